@@ -103,7 +103,7 @@ def demo_multilingual():
 
         # Show supported languages
         print("\nSupported languages (25 European languages):")
-        languages = provider.SUPPORTED_LANGUAGES
+        languages = provider.supported_languages()
         for i in range(0, len(languages), 5):
             print("  " + ", ".join(languages[i : i + 5]))
 
@@ -4,6 +4,7 @@ This module provides Click-based command-line interface for:
 - Starting interviews from PDF questionnaires
 - Configuring TTS/STT settings
 - Testing audio devices
+- Quantizing Piper voice models
 """
 
 from __future__ import annotations
@@ -59,6 +60,11 @@ def cli(verbose: bool, log_file: Optional[Path]) -> None:  # noqa: UP045
     is_flag=True,
     help="Exclude metadata from CSV export",
 )
+@click.option(
+    "--barge-in",
+    is_flag=True,
+    help="Let the user interrupt questions by starting to speak",
+)
 @click.option(
     "--tts-rate",
     type=int,
@@ -74,6 +80,7 @@ def start(
     output_dir: Optional[Path],  # noqa: UP045
     no_confirmation: bool,
     no_metadata: bool,
+    barge_in: bool,
     tts_rate: Optional[int],  # noqa: UP045
     stt_model: Optional[str],  # noqa: UP045
 ) -> None:
@@ -125,6 +132,7 @@ def start(
             stt_provider=stt_provider,
             pdf_path=str(pdf_path),
             enable_confirmation=not no_confirmation,
+            enable_barge_in=barge_in,
         )
 
         logger.info(f"Loaded {len(orchestrator.questions)} questions from PDF")
@@ -417,5 +425,39 @@ def test_audio(tts_test: bool, stt_test: bool, test_all: bool) -> None:
         sys.exit(1)
 
 
+@cli.command()
+@click.option(
+    "--model",
+    "model_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),  # type: ignore[type-var]
+    help="Piper .onnx model to quantize (default: configured TTS_PIPER_MODEL_PATH)",
+)
+def quantize_tts(model_path: Optional[Path]) -> None:  # noqa: UP045
+    """Create an INT8 version of the Piper voice model.
+
+    The quantized model is written next to the original as <name>_int8.onnx
+    and is picked up automatically on CPUs with INT8 dot-product support
+    (or always with TTS_PIPER_USE_QUANTIZED=true).
+
+    Example:
+        interview quantize-tts
+
+        interview quantize-tts --model models/tts/piper/en_US-amy-medium.onnx
+    """
+    from conversation_agent.providers.tts.piper_model import quantize_model
+
+    try:
+        source = model_path or Path(TTSConfig().piper_model_path)
+        click.echo(f"Quantizing {source}...")
+        output = quantize_model(source)
+        size_mb = output.stat().st_size / 1e6
+        click.echo(f"✓ Wrote {output} ({size_mb:.1f} MB)")
+
+    except Exception as e:
+        logger.error(f"Quantization failed: {e}")
+        click.echo(f"\n✗ Quantization failed: {e}")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     cli()
@@ -20,9 +20,11 @@ class STTConfig(BaseSettings):
         STT_SAMPLE_RATE: Audio sample rate (default: 16000)
         STT_SILENCE_THRESHOLD: Silence detection threshold (default: 0.01)
         STT_SILENCE_DURATION: Silence duration to stop (default: 2.0)
+        STT_INTERIM_TRANSCRIPTS: Whisper interim text while recording (default: False)
         STT_PARAKEET_MODEL: Parakeet model name (default: "nvidia/parakeet-tdt-0.6b-v3")
-        STT_PARAKEET_ENABLE_TIMESTAMPS: Enable Parakeet timestamps (default: True)
+        STT_PARAKEET_ENABLE_TIMESTAMPS: Enable Parakeet timestamps (default: False)
         STT_PARAKEET_LOCAL_ATTENTION: Use local attention for long audio (default: False)
+        STT_PARAKEET_COMPILE: Compile the Parakeet encoder with torch.compile (default: False)
 
     Example:
         # Use defaults
@@ -45,7 +47,7 @@ class STTConfig(BaseSettings):
 
     provider: str = Field(
         default="whisper",
-        description="STT provider to use (whisper, parakeet)",
+        description="STT provider to use (whisper, faster-whisper, parakeet)",
     )
 
     model_size: str = Field(
@@ -92,6 +94,12 @@ class STTConfig(BaseSettings):
         description="Maximum recording duration (seconds)",
     )
 
+    interim_transcripts: bool = Field(
+        default=False,
+        description="Re-decode recordings in the background for interim text "
+        "(Whisper, faster-whisper), so spoken commands end a recording early",
+    )
+
     # Parakeet-specific configuration
     parakeet_model: str = Field(
         default="nvidia/parakeet-tdt-0.6b-v3",
@@ -99,7 +107,7 @@ class STTConfig(BaseSettings):
     )
 
     parakeet_enable_timestamps: bool = Field(
-        default=True,
+        default=False,
         description="Enable word/segment timestamps for Parakeet",
     )
 
@@ -108,6 +116,11 @@ class STTConfig(BaseSettings):
         description="Use local attention for long audio (Parakeet)",
     )
 
+    parakeet_compile: bool = Field(
+        default=False,
+        description="Compile the Parakeet encoder with torch.compile/CUDA graphs (GPU)",
+    )
+
     def get_provider(self):
         """Get configured STT provider instance.
 
@@ -118,6 +131,7 @@ class STTConfig(BaseSettings):
             ValueError: If provider name is not recognized.
         """
         from conversation_agent.providers.stt import (
+            FasterWhisperProvider,
             ParakeetProvider,
             STTError,
             WhisperProvider,
@@ -131,11 +145,24 @@ class STTConfig(BaseSettings):
                     model_size=self.model_size,
                     language=self.language,
                     device=self.device,
+                    interim_transcripts=self.interim_transcripts,
                 )
                 return provider
             except STTError as e:
                 raise ValueError(f"Failed to initialize Whisper provider: {e}") from e
 
+        elif provider_name == "faster-whisper":
+            try:
+                provider = FasterWhisperProvider(
+                    model_size=self.model_size,
+                    language=self.language,
+                    device=self.device,
+                    interim_transcripts=self.interim_transcripts,
+                )
+                return provider
+            except STTError as e:
+                raise ValueError(f"Failed to initialize faster-whisper provider: {e}") from e
+
         elif provider_name == "parakeet":
             try:
                 provider = ParakeetProvider(
@@ -143,6 +170,7 @@ class STTConfig(BaseSettings):
                     language=self.language,
                     enable_timestamps=self.parakeet_enable_timestamps,
                     use_local_attention=self.parakeet_local_attention,
+                    compile_model=self.parakeet_compile,
                 )
                 return provider
             except STTError as e:
@@ -150,5 +178,6 @@ class STTConfig(BaseSettings):
 
         else:
             raise ValueError(
-                f"Unknown STT provider: {self.provider}. Supported: whisper, parakeet"
+                f"Unknown STT provider: {self.provider}. "
+                "Supported: whisper, faster-whisper, parakeet"
             )
@@ -26,6 +26,14 @@ class TTSConfig(BaseSettings):
         TTS_PIPER_MODEL_PATH: Path to Piper .onnx model
         TTS_PIPER_CONFIG_PATH: Path to Piper config (optional)
         TTS_PIPER_SAMPLE_RATE: Sample rate in Hz (default: 22050)
+        TTS_PIPER_USE_QUANTIZED: Load the INT8 model variant if present
+            (default: auto, only on CPUs with VNNI/dotprod)
+        TTS_PIPER_NUM_THREADS: onnxruntime threads for Piper synthesis
+            (default: one per physical core)
+        TTS_PIPER_USE_CUDA: Run Piper on a CUDA GPU (default: false,
+            requires onnxruntime-gpu)
+        TTS_PIPER_WARM_UP: Run a dummy synthesis after loading so the first
+            question isn't delayed (default: true)
 
     Example:
         # Use defaults
@@ -86,6 +94,28 @@ class TTSConfig(BaseSettings):
         description="Piper audio sample rate in Hz",
     )
 
+    piper_use_quantized: Optional[bool] = Field(  # noqa: UP045
+        default=None,
+        description="Load the INT8 Piper model (<model>_int8.onnx) when present. "
+        "None: only on CPUs with INT8 dot-product instructions",
+    )
+
+    piper_num_threads: Optional[int] = Field(  # noqa: UP045
+        default=None,
+        ge=1,
+        description="onnxruntime intra-op threads for Piper (None: one per physical core)",
+    )
+
+    piper_use_cuda: bool = Field(
+        default=False,
+        description="Run Piper on a CUDA GPU (requires onnxruntime-gpu; falls back to CPU)",
+    )
+
+    piper_warm_up: bool = Field(
+        default=True,
+        description="Warm up the Piper model with a background synthesis after loading",
+    )
+
     def get_provider(self):
         """Get configured TTS provider instance.
 
@@ -120,8 +150,13 @@ class TTSConfig(BaseSettings):
                     model_path=self.piper_model_path,
                     config_path=self.piper_config_path,
                     sample_rate=self.piper_sample_rate,
+                    use_quantized=self.piper_use_quantized,
+                    num_threads=self.piper_num_threads,
+                    use_cuda=self.piper_use_cuda,
                 )
                 provider.initialize()  # Load model
+                if self.piper_warm_up:
+                    provider.warm_up()
                 provider.set_volume(self.volume)
 
                 # Note: rate not supported for Piper (fixed prosody)
@@ -4,18 +4,14 @@ from __future__ import annotations
 
 import wave
 from pathlib import Path
-from typing import Optional  # noqa: UP045
+from typing import Callable, Optional  # noqa: UP045
 
 import numpy as np
 
+from conversation_agent.core.audio_input import AudioError, InputStreamMixin
 
-class AudioError(Exception):
-    """Exception raised when audio operations fail."""
 
-    pass
-
-
-class AudioManager:
+class AudioManager(InputStreamMixin):
     """Manager for audio input/output operations using PyAudio.
 
     This class provides a wrapper around PyAudio for recording audio from
@@ -70,8 +66,24 @@ class AudioManager:
         else:
             raise AudioError(f"Unsupported bit depth: {format_bits}. Use 8 or 16.")
 
+        # Running energy statistics of the last record_until_silence() call
+        self._sq_sum = 0.0
+        self._n_samples = 0
+        # Bytes recorded up to the end of the last non-silent chunk, and
+        # before the first one
+        self._speech_bytes = 0
+        self._speech_start_bytes = 0
+
+        # Input stream opened ahead of time by prewarm(): (device_index, stream)
+        self._prewarmed: Optional[tuple[Optional[int], object]] = None  # noqa: UP045
+        # Audio that triggered wait_for_speech(), left for the next recording.
+        # While set, the prewarmed stream is still running.
+        self._preroll: Optional[bytes] = None  # noqa: UP045
+
     def __del__(self):
         """Clean up PyAudio resources."""
+        if getattr(self, "_prewarmed", None) is not None:
+            self._prewarmed[1].close()
         if hasattr(self, "pyaudio"):
             self.pyaudio.terminate()
 
@@ -163,17 +175,30 @@ class AudioManager:
         silence_duration: float = 2.0,
         max_duration: float = 60.0,
         device_index: Optional[int] = None,  # noqa: UP045
+        on_chunk: Optional[Callable[[bytes], bool]] = None,  # noqa: UP045
+        no_speech_timeout: Optional[float] = None,  # noqa: UP045
     ) -> bytes:
         """Record audio until silence is detected.
 
+        If wait_for_speech() just detected speech, the audio it read is
+        included at the start of the recording, so the first word isn't
+        clipped.
+
         Args:
             silence_threshold: Amplitude threshold for silence (0.0-1.0).
             silence_duration: Duration of silence to stop recording (seconds).
             max_duration: Maximum recording duration (seconds).
             device_index: Input device index (None = default device).
+            on_chunk: Called with each recorded chunk; returning True stops
+                the recording early.
+            no_speech_timeout: Give up and return b"" if nothing above the
+                silence threshold is heard within this many seconds. When
+                set, the silence_duration countdown only starts once speech
+                has been heard (None = silence is counted from the start).
 
         Returns:
-            Raw audio data as bytes (PCM format).
+            Raw audio data as bytes (PCM format), or b"" if no speech was
+            heard before no_speech_timeout.
 
         Raises:
             AudioError: If recording fails.
@@ -190,45 +215,142 @@ class AudioManager:
             raise AudioError(f"Max duration must be positive, got {max_duration}")
 
         try:
-            stream = self.pyaudio.open(
-                format=self.format,
-                channels=self.channels,
-                rate=self.sample_rate,
-                input=True,
-                input_device_index=device_index,
-                frames_per_buffer=self.chunk_size,
-            )
+            stream, preroll = self._take_input_stream(device_index)
 
             frames = []
+            self._sq_sum = 0.0
+            self._n_samples = 0
+            recorded_bytes = 0
+            # Stats at the last non-silent chunk, so the trailing silence
+            # window doesn't dilute the speech level
+            speech_stats = (0, 0.0, 0)
+            speech_start = 0
             silence_chunks = 0
             silence_chunks_needed = int(
                 (silence_duration * self.sample_rate) / self.chunk_size
             )
             max_chunks = int((max_duration * self.sample_rate) / self.chunk_size)
+            no_speech_chunks = (
+                int((no_speech_timeout * self.sample_rate) / self.chunk_size)
+                if no_speech_timeout is not None
+                else max_chunks
+            )
+            heard_speech = True
 
-            for _ in range(max_chunks):
-                data = stream.read(self.chunk_size, exception_on_overflow=False)
+            for chunk_index in range(max_chunks):
+                if chunk_index == 0 and preroll:
+                    data = preroll
+                else:
+                    data = stream.read(self.chunk_size, exception_on_overflow=False)
                 frames.append(data)
+                recorded_bytes += len(data)
+                # One pass over the chunk updates the running RMS and gives
+                # its amplitude
+                amplitude = self._accumulate_energy(data)
 
-                # Calculate amplitude
-                amplitude = self._calculate_amplitude(data)
-
-                # Check for silence
+                # Check for silence (before any speech, no_speech_timeout applies)
                 if amplitude < silence_threshold:
-                    silence_chunks += 1
-                    if silence_chunks >= silence_chunks_needed:
-                        break
+                    if speech_stats[0] or no_speech_timeout is None:
+                        silence_chunks += 1
+                        if silence_chunks >= silence_chunks_needed:
+                            break
                 else:
                     silence_chunks = 0
+                    if not speech_stats[0]:
+                        speech_start = recorded_bytes - len(data)
+                    speech_stats = (recorded_bytes, self._sq_sum, self._n_samples)
+
+                if on_chunk is not None and on_chunk(data):
+                    break
+
+                if chunk_index + 1 >= no_speech_chunks and not speech_stats[0]:
+                    heard_speech = False
+                    break
 
             stream.stop_stream()
             stream.close()
 
+            self._speech_bytes = speech_stats[0]
+            self._speech_start_bytes = speech_start
+            if self._speech_bytes:
+                _, self._sq_sum, self._n_samples = speech_stats
+
+            if not heard_speech:
+                return b""
             return b"".join(frames)
 
         except Exception as e:
             raise AudioError(f"Recording failed: {e}") from e
 
+    def _accumulate_energy(self, audio_data: bytes) -> float:
+        """Add a chunk's squared sample values to the running statistics.
+
+        Args:
+            audio_data: Raw audio bytes.
+
+        Returns:
+            The chunk's normalized RMS amplitude (0.0-1.0).
+        """
+        sq_sum, n_samples = self._square_sum(audio_data)
+        self._sq_sum += sq_sum
+        self._n_samples += n_samples
+        return self._normalized_rms(sq_sum, n_samples)
+
+    def _square_sum(self, audio_data: bytes) -> tuple[float, int]:
+        """Sum the squared sample values of a chunk.
+
+        Args:
+            audio_data: Raw audio bytes.
+
+        Returns:
+            Tuple of (sum of squares in raw sample units, number of samples).
+        """
+        if self.format_bits == 16:
+            samples = np.frombuffer(audio_data, dtype=np.int16)
+        else:  # 8-bit unsigned, centred on 128
+            samples = np.frombuffer(audio_data, dtype=np.uint8).astype(np.float32) - 128.0
+
+        # Square straight into float32 (no int32 widening copy), sum in float64
+        return float(np.square(samples, dtype=np.float32).sum(dtype=np.float64)), samples.size
+
+    def _normalized_rms(self, sq_sum: float, n_samples: int) -> float:
+        """Convert a sum of squares to RMS relative to full scale.
+
+        Args:
+            sq_sum: Sum of squared sample values.
+            n_samples: Number of samples summed.
+
+        Returns:
+            Normalized RMS amplitude (0.0-1.0).
+        """
+        if n_samples == 0:
+            return 0.0
+        full_scale = 32768.0 if self.format_bits == 16 else 128.0
+        return float(np.sqrt(sq_sum / n_samples)) / full_scale
+
+    def get_last_speech_bytes(self) -> int:
+        """Get the length of the last recording excluding trailing silence.
+
+        Returns:
+            Byte count up to the end of the last non-silent chunk of the
+            last record_until_silence() call (0 if no speech was heard).
+        """
+        return self._speech_bytes
+
+    def get_last_rms(self) -> float:
+        """Get RMS level of the last silence-bounded recording.
+
+        Computed incrementally while recording, so callers don't need to
+        re-scan the returned buffer. Covers only the audio up to the end of
+        speech when any was detected, not the trailing silence window.
+
+        Returns:
+            RMS in raw sample units (0.0 if nothing recorded).
+        """
+        if self._n_samples == 0:
+            return 0.0
+        return float(np.sqrt(self._sq_sum / self._n_samples))
+
     def _calculate_amplitude(self, audio_data: bytes) -> float:
         """Calculate normalized amplitude of audio data.
 
@@ -239,19 +361,7 @@ class AudioManager:
             Normalized amplitude (0.0-1.0).
         """
         try:
-            # Convert bytes to numpy array
-            if self.format_bits == 16:
-                audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                max_val = 32768.0
-            else:  # 8-bit
-                audio_array = np.frombuffer(audio_data, dtype=np.uint8)
-                max_val = 128.0
-
-            # Calculate RMS amplitude
-            rms = np.sqrt(np.mean(np.square(audio_array.astype(float))))
-            normalized = rms / max_val
-
-            return float(normalized)
+            return self._normalized_rms(*self._square_sum(audio_data))
         except Exception:
             return 0.0
 
@@ -282,7 +392,9 @@ class AudioManager:
                 wav_file.setnchannels(self.channels)
                 wav_file.setsampwidth(self.format_bits // 8)
                 wav_file.setframerate(self.sample_rate)
-                wav_file.writeframes(audio_data)
+                # Written as-is (no NumPy round trip); close() fills in the
+                # header sizes once
+                wav_file.writeframesraw(audio_data)
 
         except Exception as e:
             raise AudioError(f"Failed to save WAV file '{filename}': {e}") from e
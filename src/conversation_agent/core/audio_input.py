@@ -0,0 +1,232 @@
+"""Input stream reuse and level detection for the audio manager."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any, Optional  # noqa: UP045
+
+
+class AudioError(Exception):
+    """Exception raised when audio operations fail."""
+
+    pass
+
+
+class InputStreamMixin:
+    """Microphone stream handling shared by AudioManager's recordings.
+
+    Opens the input stream ahead of time (prewarm), waits for the level to
+    settle or for the user to start talking, and keeps the audio that
+    triggered speech detection as pre-roll for the next recording.
+    """
+
+    pyaudio: Any
+    format: int
+    sample_rate: int
+    chunk_size: int
+    channels: int
+    format_bits: int
+    _prewarmed: Optional[tuple[Optional[int], Any]]  # noqa: UP045
+    _preroll: Optional[bytes]  # noqa: UP045
+    _speech_bytes: int
+    _speech_start_bytes: int
+
+    def prewarm(self, device_index: Optional[int] = None) -> None:  # noqa: UP045
+        """Open the input stream ahead of the next recording.
+
+        The stream is opened stopped, so nothing is captured until
+        record_until_silence() starts it. Intended to run concurrently with
+        TTS playback to hide device-open latency. Failures are ignored; the
+        next recording then opens its own stream.
+
+        Args:
+            device_index: Input device index (None = default device).
+        """
+        if self._prewarmed is not None:
+            return
+
+        try:
+            stream = self._open_input_stream(device_index, start=False)
+        except Exception:
+            return
+
+        self._prewarmed = (device_index, stream)
+
+    def _open_input_stream(
+        self, device_index: Optional[int], start: bool = True  # noqa: UP045
+    ):
+        """Open a PyAudio input stream with the manager's settings.
+
+        Args:
+            device_index: Input device index (None = default device).
+            start: Whether to start the stream immediately.
+
+        Returns:
+            PyAudio input stream.
+        """
+        return self.pyaudio.open(
+            format=self.format,
+            channels=self.channels,
+            rate=self.sample_rate,
+            input=True,
+            input_device_index=device_index,
+            frames_per_buffer=self.chunk_size,
+            start=start,
+        )
+
+    def _take_input_stream(self, device_index: Optional[int]):  # noqa: UP045
+        """Take the prewarmed stream if it matches, otherwise open a new one.
+
+        Args:
+            device_index: Input device index (None = default device).
+
+        Returns:
+            Tuple of (started PyAudio input stream, pre-roll audio). The
+            pre-roll is the audio already read by wait_for_speech() on that
+            stream (b"" if there is none).
+        """
+        preroll, self._preroll = self._preroll, None
+        if self._prewarmed is not None:
+            prewarmed_device, stream = self._prewarmed
+            self._prewarmed = None
+            if prewarmed_device == device_index:
+                if preroll is None:
+                    stream.start_stream()
+                return stream, preroll or b""
+            stream.close()
+
+        return self._open_input_stream(device_index), b""
+
+    def wait_for_silence(
+        self,
+        threshold: float = 0.005,
+        max_wait: float = 0.5,
+        device_index: Optional[int] = None,  # noqa: UP045
+    ) -> bool:
+        """Wait until the microphone hears silence, up to a time limit.
+
+        Reads 20ms chunks and returns once three consecutive chunks are below
+        the threshold. Used to let speaker echo die out before recording.
+        The stream is kept open for the next recording.
+
+        Args:
+            threshold: Amplitude threshold for silence (0.0-1.0).
+            max_wait: Maximum time to wait (seconds).
+            device_index: Input device index (None = default device).
+
+        Returns:
+            True if silence was detected, False if max_wait elapsed first.
+
+        Raises:
+            AudioError: If reading from the microphone fails.
+        """
+        try:
+            return self._wait_for_level(threshold, True, max_wait, None, device_index)
+        except Exception as e:
+            raise AudioError(f"Failed to wait for silence: {e}") from e
+
+    def wait_for_speech(
+        self,
+        threshold: float = 0.05,
+        max_wait: float = 60.0,
+        stop_event: Optional[threading.Event] = None,  # noqa: UP045
+        device_index: Optional[int] = None,  # noqa: UP045
+    ) -> bool:
+        """Wait until the microphone hears speech, up to a time limit.
+
+        Reads 20ms chunks and returns once three consecutive chunks are at or
+        above the threshold. Used to notice the user talking over TTS
+        playback. The stream is kept open for the next recording; when
+        speech is detected it keeps running, and the audio that triggered
+        detection becomes the start of the next record_until_silence().
+
+        Args:
+            threshold: Amplitude threshold for speech (0.0-1.0).
+            max_wait: Maximum time to wait (seconds).
+            stop_event: Event that ends the wait early when set.
+            device_index: Input device index (None = default device).
+
+        Returns:
+            True if speech was detected, False if max_wait elapsed or
+            stop_event was set first.
+
+        Raises:
+            AudioError: If reading from the microphone fails.
+        """
+        try:
+            return self._wait_for_level(
+                threshold, False, max_wait, stop_event, device_index
+            )
+        except Exception as e:
+            raise AudioError(f"Failed to wait for speech: {e}") from e
+
+    def _wait_for_level(
+        self,
+        threshold: float,
+        quiet: bool,
+        max_wait: float,
+        stop_event: Optional[threading.Event],  # noqa: UP045
+        device_index: Optional[int],  # noqa: UP045
+    ) -> bool:
+        """Read 20ms chunks until three in a row are on one side of threshold.
+
+        Args:
+            threshold: Amplitude threshold (0.0-1.0).
+            quiet: Wait for chunks below the threshold (True) or at/above it.
+            max_wait: Maximum time to wait (seconds).
+            stop_event: Event that ends the wait early when set.
+            device_index: Input device index (None = default device).
+
+        Returns:
+            True if the level was reached, False otherwise.
+        """
+        frames_per_read = max(1, int(self.sample_rate * 0.02))
+        max_reads = max(1, int(max_wait / 0.02))
+
+        stream, _ = self._take_input_stream(device_index)
+        # About one recording chunk of the latest reads, kept as pre-roll
+        recent: deque[bytes] = deque(maxlen=max(3, -(-self.chunk_size // frames_per_read)))
+        matching_reads = 0
+        reached = False
+        for _ in range(max_reads):
+            if stop_event is not None and stop_event.is_set():
+                break
+            data = stream.read(frames_per_read, exception_on_overflow=False)
+            recent.append(data)
+            if (self._calculate_amplitude(data) < threshold) == quiet:
+                matching_reads += 1
+                if matching_reads >= 3:
+                    reached = True
+                    break
+            else:
+                matching_reads = 0
+
+        self._prewarmed = (device_index, stream)
+        if reached and not quiet:
+            # Leave the stream running so nothing the user says is dropped
+            self._preroll = b"".join(recent)
+        else:
+            stream.stop_stream()
+        return reached
+
+    def trim_to_speech(self, audio_data: bytes, padding: float = 0.3) -> bytes:
+        """Cut the silence before and after the speech in the last recording.
+
+        Uses the speech boundaries found by the last record_until_silence()
+        call, so STT doesn't spend time decoding the silence windows.
+
+        Args:
+            audio_data: Audio returned by the last record_until_silence() call.
+            padding: Audio to keep on each side of the speech (seconds).
+
+        Returns:
+            The speech portion of audio_data, or audio_data unchanged if no
+            speech was detected.
+        """
+        if not self._speech_bytes:
+            return audio_data
+
+        pad = int(padding * self.sample_rate) * self.channels * (self.format_bits // 8)
+        start = max(0, self._speech_start_bytes - pad)
+        return audio_data[start : self._speech_bytes + pad]
@@ -54,6 +54,12 @@ class UserIntent(Enum):
     UNKNOWN = "unknown"
 
 
+# One bit per state (by definition order) so state-set membership is a single AND
+_STATE_BITS = {state: 1 << index for index, state in enumerate(ConversationState)}
+_TERMINAL_MASK = _STATE_BITS[ConversationState.COMPLETE]
+_ERROR_MASK = _STATE_BITS[ConversationState.ERROR]
+
+
 class ConversationStateMachine:
     """Manages interview conversation state transitions.
 
@@ -108,7 +114,7 @@ class ConversationStateMachine:
         Raises:
             ValueError: If not in ERROR state or no previous state
         """
-        if self.current_state != ConversationState.ERROR:
+        if not _STATE_BITS[self.current_state] & _ERROR_MASK:
             raise ValueError("Cannot recover: not in ERROR state")
 
         if self.previous_state is None:
@@ -170,7 +176,7 @@ class ConversationStateMachine:
         Returns:
             True if in COMPLETE state
         """
-        return self.current_state == ConversationState.COMPLETE
+        return _STATE_BITS[self.current_state] & _TERMINAL_MASK != 0
 
     def can_transition_to(self, state: ConversationState) -> bool:
         """Check if can transition to given state.
@@ -6,6 +6,40 @@ import re
 
 from conversation_agent.core.conversation_state import UserIntent
 
+# Question-word prefixes (trailing space avoids matching "whatever", "however", ...)
+_QUESTION_WORDS = ("what ", "when ", "where ", "who ", "why ", "how ")
+
+# Common one-word replies, each matched by exactly one intent's patterns.
+# A whole-text match always scores 0.9 in _match_patterns, so recognize()
+# can answer these with a dict lookup instead of running every regex.
+_EXACT_INTENTS = {
+    "yes": UserIntent.CONFIRM_YES,
+    "yeah": UserIntent.CONFIRM_YES,
+    "yep": UserIntent.CONFIRM_YES,
+    "yup": UserIntent.CONFIRM_YES,
+    "correct": UserIntent.CONFIRM_YES,
+    "right": UserIntent.CONFIRM_YES,
+    "exactly": UserIntent.CONFIRM_YES,
+    "no": UserIntent.CONFIRM_NO,
+    "nope": UserIntent.CONFIRM_NO,
+    "nah": UserIntent.CONFIRM_NO,
+    "incorrect": UserIntent.CONFIRM_NO,
+    "wrong": UserIntent.CONFIRM_NO,
+    "skip": UserIntent.SKIP,
+    "pass": UserIntent.SKIP,
+    "repeat": UserIntent.REPEAT,
+    "pardon": UserIntent.REPEAT,
+    "clarify": UserIntent.CLARIFY,
+    "explain": UserIntent.CLARIFY,
+    "start": UserIntent.START,
+    "begin": UserIntent.START,
+    "ready": UserIntent.START,
+    "quit": UserIntent.QUIT,
+    "exit": UserIntent.QUIT,
+    "stop": UserIntent.QUIT,
+    "cancel": UserIntent.QUIT,
+}
+
 
 class IntentRecognizer:
     """Recognizes user intents from transcribed speech.
@@ -87,6 +121,29 @@ class IntentRecognizer:
 
         text_lower = text.lower().strip()
 
+        # Fast path: single-word replies ("yes", "skip", "Yes.")
+        key = text_lower[:-1] if text_lower[-1] in ".!?" else text_lower
+        exact_intent = _EXACT_INTENTS.get(key)
+        if exact_intent is not None:
+            confidence = 1.0 if exact_intent == context_intent else 0.9
+            if confidence >= self.confidence_threshold:
+                return (exact_intent, confidence)
+            return (UserIntent.UNKNOWN, confidence)
+
+        return self._recognize_patterns(text_lower, context_intent)
+
+    def _recognize_patterns(
+        self, text_lower: str, context_intent: UserIntent | None
+    ) -> tuple[UserIntent, float]:
+        """Recognize intent by running the full regex pattern pipeline.
+
+        Args:
+            text_lower: Lowercased, stripped user text
+            context_intent: Expected intent based on conversation context
+
+        Returns:
+            Tuple of (intent, confidence_score)
+        """
         # Check each intent's patterns
         best_match = (UserIntent.UNKNOWN, 0.0)
 
@@ -123,22 +180,20 @@ class IntentRecognizer:
             Confidence score (0.0-1.0)
         """
         for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                # Calculate confidence based on match quality
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    # Higher confidence for longer/more specific matches
-                    match_length = len(match.group(0))
-                    text_length = len(text)
-                    base_confidence = 0.7
-
-                    # Boost if match covers significant portion of text
-                    if match_length / text_length > 0.5:
-                        base_confidence = 0.9
-                    elif match_length / text_length > 0.3:
-                        base_confidence = 0.8
-
-                    return base_confidence
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match is not None:
+                # Higher confidence for longer/more specific matches
+                match_length = len(match.group(0))
+                text_length = len(text)
+                base_confidence = 0.7
+
+                # Boost if match covers significant portion of text
+                if match_length / text_length > 0.5:
+                    base_confidence = 0.9
+                elif match_length / text_length > 0.3:
+                    base_confidence = 0.8
+
+                return base_confidence
 
         return 0.0
 
@@ -151,13 +206,13 @@ class IntentRecognizer:
         Returns:
             True if text appears to be an answer
         """
-        # Short phrases likely commands
-        if len(text.split()) <= 2:
+        # Short phrases (at most two words) are likely commands; maxsplit
+        # stops splitting once a third word is found
+        if len(text.split(maxsplit=2)) < 3:
             return False
 
         # Check for question words (likely not an answer)
-        question_words = ["what", "when", "where", "who", "why", "how"]
-        if any(text.startswith(word) for word in question_words):
+        if text.startswith(_QUESTION_WORDS):
             return False
 
         # Otherwise assume it's an answer
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from conversation_agent.config import NormalizationConfig
 from conversation_agent.core.audio import AudioManager
@@ -15,6 +18,7 @@ from conversation_agent.core.conversation_state import (
     UserIntent,
 )
 from conversation_agent.core.intent_recognizer import IntentRecognizer
+from conversation_agent.core.interview_prompts import _CANNED_PROMPTS, PromptMixin
 from conversation_agent.core.pdf_parser import PDFQuestionParser
 from conversation_agent.models.interview import (
     ConversationTurn,
@@ -23,12 +27,13 @@ from conversation_agent.models.interview import (
     Response,
 )
 from conversation_agent.providers.stt.base import STTProvider
+from conversation_agent.providers.stt.batching import BatchedSTTService
 from conversation_agent.providers.tts.base import TTSProvider
 
 logger = logging.getLogger(__name__)
 
 
-class InterviewOrchestrator:
+class InterviewOrchestrator(PromptMixin):
     """Orchestrates the interview conversation flow.
 
     Manages the complete interview lifecycle from greeting to closing,
@@ -41,8 +46,9 @@ class InterviewOrchestrator:
         intent_recognizer: User intent recognizer
         session: Current interview session
         questions: List of questions to ask
-        current_question_index: Index of current question
+        current_question_index: Number of questions finished so far
         enable_confirmation: Whether to confirm answers
+        enable_barge_in: Whether the user can interrupt questions
         max_retries: Maximum retry attempts per question
     """
 
@@ -66,6 +72,7 @@ class InterviewOrchestrator:
         max_retries: int = 3,
         greeting: Optional[str] = None,  # noqa: UP045
         closing: Optional[str] = None,  # noqa: UP045
+        enable_barge_in: bool = False,
     ):
         """Initialize interview orchestrator.
 
@@ -77,6 +84,8 @@ class InterviewOrchestrator:
             max_retries: Max retry attempts per question (default: 3)
             greeting: Custom greeting message
             closing: Custom closing message
+            enable_barge_in: Stop speaking a question as soon as the user
+                starts talking over it (default: False)
 
         Raises:
             FileNotFoundError: If PDF file doesn't exist
@@ -90,38 +99,67 @@ class InterviewOrchestrator:
 
         self.tts = tts_provider
         self.stt = stt_provider
+        # Shared with other sessions using the same provider so concurrent
+        # transcriptions are decoded as one batch
+        self._stt_service = BatchedSTTService.for_provider(stt_provider)
         self.audio_manager = AudioManager()
+        self._sample_rate = self.audio_manager.get_sample_rate()
+        self._bytes_per_second = self._sample_rate * self.audio_manager.channels * 2
         self.state_machine = ConversationStateMachine()
-        self.intent_recognizer = IntentRecognizer()
 
         # Initialize text normalizer for structured data (emails, phones, etc.)
         norm_config = NormalizationConfig()
         self.text_normalizer = norm_config.get_normalizer()  # None if disabled
 
-        # Load questions from PDF
-        parser = PDFQuestionParser()
-        self.questions = parser.parse(pdf_path)
-
-        if not self.questions:
-            raise ValueError(f"No questions found in PDF: {pdf_path}")
-
         # Initialize session
         self.session = InterviewSession(questionnaire_path=pdf_path)
 
         # Configuration
         self.enable_confirmation = enable_confirmation
+        self.enable_barge_in = enable_barge_in
         self.max_retries = max_retries
         self.greeting = greeting or self.DEFAULT_GREETING
         self.closing = closing or self.DEFAULT_CLOSING
 
+        # Load questions from PDF in the background while the fixed prompts
+        # are synthesized once (so retries only replay audio)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            questions_future = executor.submit(PDFQuestionParser().parse, pdf_path)
+            self._canned = self._synthesize_prompts(
+                (*_CANNED_PROMPTS, self.greeting, self.closing)
+            )
+            self.questions = questions_future.result()
+
+        if not self.questions:
+            raise ValueError(f"No questions found in PDF: {pdf_path}")
+        # Add every question to the same cache in the background, while the
+        # greeting plays; questions not ready yet fall back to speak()
+        self._presynth_thread: Optional[threading.Thread] = None  # noqa: UP045
+        if self._canned:
+            self._presynth_thread = threading.Thread(
+                target=self._presynthesize_questions, daemon=True
+            )
+            self._presynth_thread.start()
+
         # State tracking
-        self.current_question_index = 0
+        self.current_question_index = 0  # Advanced only by run()
         self.current_question: Optional[Question] = None  # noqa: UP045
         self.current_response_text: Optional[str] = None  # noqa: UP045
         self.retry_count = 0
         self.last_audio_size = 0  # Track last audio size for duplicate detection
         self.duplicate_audio_count = 0  # Count consecutive duplicate audio captures
 
+    @functools.cached_property
+    def intent_recognizer(self) -> IntentRecognizer:
+        """User intent recognizer, built on first use."""
+        return IntentRecognizer()
+
+    @functools.cached_property
+    def _recognize_cached(self) -> Callable[..., tuple[UserIntent, float]]:
+        """Memoized intent recognition, built on first use."""
+        # Retry and confirmation loops hear the same short replies repeatedly
+        return functools.lru_cache(maxsize=256)(self.intent_recognizer.recognize)
+
     def run(self) -> InterviewSession:
         """Run the complete interview.
 
@@ -138,11 +176,12 @@ class InterviewOrchestrator:
 
             # Process questions
             self.state_machine.transition_to(ConversationState.QUESTIONING)
-            while self.current_question_index < len(self.questions):
-                self._process_question()
+            for index, question in enumerate(self.questions):
+                self._process_question(index, question)
                 # Check if user quit early
                 if self.state_machine.is_terminal():
                     return self.session
+                self.current_question_index = index + 1
 
             # Close interview
             self.state_machine.transition_to(ConversationState.CLOSING)
@@ -165,83 +204,47 @@ class InterviewOrchestrator:
             self.state_machine.set_error(f"Interview failed: {e}")
             raise
 
-    def _handle_greeting(self) -> None:
-        """Handle greeting state."""
-        self.tts.speak(self.greeting)
-
-        # Wait for user to confirm ready
-        while True:
-            # Record audio from microphone with shorter silence detection
-            audio_data = self.audio_manager.record_until_silence(
-                silence_threshold=0.005,  # Slightly less sensitive to noise
-                silence_duration=2.0,     # 2 seconds of silence (faster response)
-            )
-            # Log audio data details
-            audio_duration = len(audio_data) / (
-                self.audio_manager.get_sample_rate()
-                * self.audio_manager.channels
-                * 2
-            )
-            logger.info(
-                f"🎤 Recorded audio: {len(audio_data)} bytes, "
-                f"{audio_duration:.2f}s duration"
-            )
-
-            result = self.stt.transcribe_audio_data(
-                audio_data,
-                self.audio_manager.get_sample_rate()
-            )
-            # Log transcription result
-            logger.info(f"📝 Transcription result: {result}")
-            user_text = result.get("text", "")
-
-            intent, confidence = self.intent_recognizer.recognize(
-                user_text, context_intent=UserIntent.START
-            )
-            logger.info(
-                f"🎯 Intent recognized: {intent.value}, "
-                f"confidence: {confidence:.2f}, "
-                f"text: '{user_text}'"
-            )
-
-            if intent == UserIntent.START:
-                break
-            elif intent == UserIntent.QUIT:
-                # User quit before starting
-                self.session.mark_completed()
-                self.state_machine.transition_to(ConversationState.COMPLETE)
-                return
-            else:
-                # Repeat greeting
-                self.tts.speak("I didn't catch that. Are you ready to begin?")
+    def _process_question(self, index: int, question: Question) -> None:
+        """Process a single question.
 
-    def _process_question(self) -> None:
-        """Process a single question."""
-        self.current_question = self.questions[self.current_question_index]
+        Args:
+            index: Position of the question in self.questions
+            question: Question to ask
+        """
+        self.current_question = question
         self.retry_count = 0
-        turn_start = time.time()
+        turn_start_ns = time.perf_counter_ns()
+
+        # Let the TTS provider synthesize the next question while this one
+        # is asked and answered
+        if index + 1 < len(self.questions):
+            next_text = self._format_question_text(self.questions[index + 1])
+            if next_text not in self._canned:
+                self.tts.prefetch(next_text)
 
         logger.info(
-            f"📋 Processing question {self.current_question_index + 1}/"
-            f"{len(self.questions)}: '{self.current_question.text[:50]}...'"
+            "📋 Processing question %d/%d: '%.50s...'",
+            index + 1, len(self.questions), question.text,
         )
 
         # Ask question
-        self._ask_question()
+        interrupted = self._ask_question()
 
         # Wait for TTS audio to fully finish and dissipate
         # Prevents microphone from picking up speaker output
-        logger.info("⏳ Waiting for audio to settle before listening...")
-        time.sleep(1.0)  # 1 second delay to prevent echo/feedback
+        # (not needed if the user is already talking over it)
+        if not interrupted:
+            logger.info("⏳ Waiting for audio to settle before listening...")
+            self._wait_for_audio_to_settle()
         logger.info("🎧 Ready to listen for response")
 
         # Get answer
         loop_iteration = 0
         while self.retry_count < self.max_retries:
             loop_iteration += 1
-            logger.info(
-                f"🔄 Loop iteration {loop_iteration}, "
-                f"retry_count={self.retry_count}/{self.max_retries}"
+            logger.debug(
+                "🔄 Loop iteration %d, retry_count=%d/%d",
+                loop_iteration, self.retry_count, self.max_retries,
             )
 
             user_text = self._listen_for_response()
@@ -249,61 +252,40 @@ class InterviewOrchestrator:
             if not user_text:
                 self.retry_count += 1
                 logger.warning(
-                    f"⚠️ Empty transcription, retry_count={self.retry_count}/"
-                    f"{self.max_retries}"
+                    "⚠️ Empty transcription, retry_count=%d/%d",
+                    self.retry_count, self.max_retries,
                 )
                 if self.retry_count < self.max_retries:
-                    self.tts.speak("I didn't hear that. Could you please repeat?")
-                    time.sleep(1.5)  # Wait for audio to settle
+                    self._speak_canned("I didn't hear that. Could you please repeat?")
+                    self._wait_for_audio_to_settle()
                 continue
 
             # Recognize intent
-            intent, confidence = self.intent_recognizer.recognize(user_text)
+            intent, confidence = self._recognize(user_text)
             logger.info(
-                f"🎯 Intent: {intent.value}, confidence: {confidence:.2f}, "
-                f"text: '{user_text}'"
+                "🎯 Intent: %s, confidence: %.2f, text: %r",
+                intent.value, confidence, user_text,
             )
 
             # Handle intent
             if intent == UserIntent.ANSWER:
                 logger.info("✅ Recognized as ANSWER intent")
-                self.current_response_text = user_text
-                if self.enable_confirmation:
-                    logger.info("🔍 Confirmation enabled, requesting confirmation...")
-                    confirmed = self._confirm_answer()
-                    logger.info(
-                        f"🔍 Confirmation result: {confirmed}, "
-                        f"retry_count={self.retry_count}/{self.max_retries}"
-                    )
-                    if confirmed:
-                        logger.info("✅ Answer confirmed, breaking loop")
-                        break  # Answer confirmed
-                    # Check if max retries reached after failed confirmation
-                    if self.retry_count >= self.max_retries:
-                        logger.warning(
-                            "⚠️ Max retries reached after failed confirmation, "
-                            "breaking loop"
-                        )
-                        break  # Give up, save whatever we have
-                    logger.info("🔄 Confirmation failed, retrying...")
-                    # else: Loop to retry
-                else:
-                    logger.info("✅ No confirmation needed, breaking loop")
-                    break  # No confirmation needed
+                if self._accept_as_answer(user_text):
+                    break
 
             elif intent == UserIntent.REPEAT:
                 logger.info("🔁 REPEAT intent, asking question again")
                 self._ask_question()
-                time.sleep(1.5)  # Wait for audio to settle
+                self._wait_for_audio_to_settle()
 
             elif intent == UserIntent.CLARIFY:
                 logger.info("❓ CLARIFY intent, providing clarification")
                 self._provide_clarification()
-                time.sleep(1.5)  # Wait for audio to settle
+                self._wait_for_audio_to_settle()
 
             elif intent == UserIntent.SKIP:
                 logger.info("⏭️ SKIP intent, skipping question")
-                self._skip_question(turn_start)
+                self._skip_question(turn_start_ns)
                 return
 
             elif intent == UserIntent.QUIT:
@@ -314,151 +296,52 @@ class InterviewOrchestrator:
             else:
                 # Treat as answer attempt
                 logger.info(
-                    f"❔ UNKNOWN/OTHER intent ({intent.value}), "
-                    "treating as answer attempt"
+                    "❔ UNKNOWN/OTHER intent (%s), treating as answer attempt",
+                    intent.value,
                 )
-                self.current_response_text = user_text
-                if self.enable_confirmation:
-                    logger.info("🔍 Confirmation enabled, requesting confirmation...")
-                    confirmed = self._confirm_answer()
-                    logger.info(
-                        f"🔍 Confirmation result: {confirmed}, "
-                        f"retry_count={self.retry_count}/{self.max_retries}"
-                    )
-                    if confirmed:
-                        logger.info("✅ Answer confirmed, breaking loop")
-                        break
-                    # Check if max retries reached after failed confirmation
-                    if self.retry_count >= self.max_retries:
-                        logger.warning(
-                            "⚠️ Max retries reached after failed confirmation, "
-                            "breaking loop"
-                        )
-                        break  # Give up, save whatever we have
-                    logger.info("🔄 Confirmation failed, retrying...")
-                else:
-                    logger.info("✅ No confirmation needed, breaking loop")
+                if self._accept_as_answer(user_text):
                     break
 
         logger.info(
-            f"🏁 Exited loop after {loop_iteration} iterations, "
-            f"final retry_count={self.retry_count}"
+            "🏁 Exited loop after %d iterations, final retry_count=%d",
+            loop_iteration, self.retry_count,
         )
 
         # Save turn
-        self._save_turn(turn_start)
-        self.current_question_index += 1
+        self._save_turn(turn_start_ns)
 
-    def _ask_question(self) -> None:
-        """Speak current question via TTS."""
-        if self.current_question:
-            question_text = f"Question {self.current_question.number}. "
-            question_text += self.current_question.text
-            logger.info(f"🔊 Speaking question: '{question_text}'")
-            logger.info(f"📢 TTS provider: {self.tts.__class__.__name__}")
-            self.tts.speak(question_text)
-            logger.info("✅ TTS completed speaking question")
+    def _accept_as_answer(self, user_text: str) -> bool:
+        """Take user text as the answer, confirming it if enabled.
 
-    def _listen_for_response(self) -> str:
-        """Listen for user response via STT.
+        Args:
+            user_text: Transcribed answer
 
         Returns:
-            Transcribed text
+            True if the question loop should stop (answer accepted or
+            retries exhausted), False to listen again
         """
-        logger.info("👂 Entering _listen_for_response, starting audio recording...")
-        # Record audio from microphone with high silence threshold
-        # This reduces false positives from echo/feedback and ambient noise
-        audio_data = self.audio_manager.record_until_silence(
-            silence_threshold=0.05,   # Very high threshold = much less sensitive
-            silence_duration=3.0,     # 3 seconds of silence to ensure speech ended
-        )
-        # Log audio data details
-        audio_duration = len(audio_data) / (
-            self.audio_manager.get_sample_rate()
-            * self.audio_manager.channels
-            * 2
-        )
-        logger.info(
-            f"🎤 Recorded audio: {len(audio_data)} bytes, "
-            f"{audio_duration:.2f}s duration"
-        )
-
-        # Check for duplicate audio (possible echo/feedback issue)
-        if len(audio_data) == self.last_audio_size and self.last_audio_size > 0:
-            self.duplicate_audio_count += 1
-            logger.warning(
-                f"⚠️ DUPLICATE AUDIO DETECTED! Same audio size as previous: "
-                f"{len(audio_data)} bytes (count: {self.duplicate_audio_count}). "
-                "This may indicate microphone is picking up TTS echo/feedback "
-                "or ambient noise."
-            )
-        else:
-            self.duplicate_audio_count = 0  # Reset counter
-        self.last_audio_size = len(audio_data)
-
-        # Check audio quality - reject if too short (likely just noise)
-        MIN_VALID_AUDIO_DURATION = 0.5  # At least 0.5 seconds of audio
-        if audio_duration < MIN_VALID_AUDIO_DURATION:
-            logger.warning(
-                f"⚠️ Audio too short ({audio_duration:.2f}s < "
-                f"{MIN_VALID_AUDIO_DURATION}s), likely noise. Treating as silence."
-            )
-            return ""
-
-        # Check audio energy level - reject if too quiet (just ambient noise)
-        import struct
-        audio_samples = struct.unpack(f"{len(audio_data) // 2}h", audio_data)
-        avg_amplitude = sum(abs(sample) for sample in audio_samples) / len(
-            audio_samples
-        )
-        MIN_AMPLITUDE = 100  # Minimum average amplitude for valid speech
-        if avg_amplitude < MIN_AMPLITUDE:
-            logger.warning(
-                f"⚠️ Audio amplitude too low ({avg_amplitude:.0f} < "
-                f"{MIN_AMPLITUDE}), likely ambient noise. Treating as silence."
-            )
-            return ""
+        self.current_response_text = user_text
+        if not self.enable_confirmation:
+            logger.info("✅ No confirmation needed, breaking loop")
+            return True
 
+        logger.info("🔍 Confirmation enabled, requesting confirmation...")
+        confirmed = self._confirm_answer()
         logger.info(
-            f"✅ Audio quality check passed: duration={audio_duration:.2f}s, "
-            f"amplitude={avg_amplitude:.0f}"
-        )
-
-        # Transcribe the recorded audio
-        logger.info("🔊 Transcribing recorded audio...")
-        result = self.stt.transcribe_audio_data(
-            audio_data,
-            self.audio_manager.get_sample_rate()
+            "🔍 Confirmation result: %s, retry_count=%d/%d",
+            confirmed, self.retry_count, self.max_retries,
         )
-        # Log transcription result
-        logger.info(f"📝 Transcription result: {result}")
-
-        user_text = result.get("text", "").strip()
-
-        # Apply text normalization for structured data (emails, phones, etc.)
-        if user_text and self.text_normalizer:
-            user_text = self.text_normalizer.normalize(user_text)
-
-        # Check for Whisper hallucinations (common false positives)
-        WHISPER_HALLUCINATIONS = [
-            "you", "thank you", "thanks", ".", "...",
-            "bye", "goodbye", "music", "subscribe"
-        ]
-        if user_text.lower() in WHISPER_HALLUCINATIONS and audio_duration < 2.0:
+        if confirmed:
+            logger.info("✅ Answer confirmed, breaking loop")
+            return True
+        # Check if max retries reached after failed confirmation
+        if self.retry_count >= self.max_retries:
             logger.warning(
-                f"⚠️ Potential Whisper hallucination detected: '{user_text}' "
-                f"with short audio ({audio_duration:.2f}s). Treating as silence."
-            )
-            return ""
-
-        if user_text:
-            logger.info(
-                f"✅ User response: '{user_text}' (length: {len(user_text)})"
+                "⚠️ Max retries reached after failed confirmation, breaking loop"
             )
-        else:
-            logger.warning("⚠️ Empty transcription received")
-
-        return user_text
+            return True  # Give up, save whatever we have
+        logger.info("🔄 Confirmation failed, retrying...")
+        return False
 
     def _confirm_answer(self) -> bool:
         """Confirm user's answer.
@@ -467,8 +350,8 @@ class InterviewOrchestrator:
             True if user confirms, False if wants to retry
         """
         logger.info(
-            f"🔍 Entering _confirm_answer, current_response_text="
-            f"'{self.current_response_text}', retry_count={self.retry_count}"
+            "🔍 Entering _confirm_answer, current_response_text=%r, retry_count=%d",
+            self.current_response_text, self.retry_count,
         )
         self.state_machine.transition_to(ConversationState.CONFIRMING)
 
@@ -476,23 +359,21 @@ class InterviewOrchestrator:
         confirmation_prompt = (
             f"You said: {self.current_response_text}. Is that correct?"
         )
-        logger.info(f"💬 Asking for confirmation: '{confirmation_prompt}'")
+        logger.info("💬 Asking for confirmation: %r", confirmation_prompt)
         self.tts.speak(confirmation_prompt)
 
         # Wait for TTS audio to settle
         logger.info("⏳ Waiting for audio to settle before listening...")
-        time.sleep(1.5)  # 1.5 second delay to prevent echo/feedback
+        self._wait_for_audio_to_settle()
         logger.info("🎧 Ready to listen for confirmation")
 
         # Get confirmation
-        user_text = self._listen_for_response()
-        logger.info(f"📥 Received confirmation response: '{user_text}'")
+        user_text = self._listen_for_confirmation()
+        logger.info("📥 Received confirmation response: %r", user_text)
 
-        intent, confidence = self.intent_recognizer.recognize(
-            user_text, context_intent=UserIntent.CONFIRM_YES
-        )
+        intent, confidence = self._recognize(user_text, context_intent=UserIntent.CONFIRM_YES)
         logger.info(
-            f"🎯 Confirmation intent: {intent.value}, confidence: {confidence:.2f}"
+            "🎯 Confirmation intent: %s, confidence: %.2f", intent.value, confidence
         )
 
         self.state_machine.transition_to(ConversationState.QUESTIONING)
@@ -502,39 +383,32 @@ class InterviewOrchestrator:
             return True
         elif intent == UserIntent.CONFIRM_NO:
             logger.info(
-                f"❌ Confirmation: NO, incrementing retry_count to "
-                f"{self.retry_count + 1}"
+                "❌ Confirmation: NO, incrementing retry_count to %d",
+                self.retry_count + 1,
             )
-            self.tts.speak("Okay, let's try again.")
+            self._speak_canned("Okay, let's try again.")
             self.retry_count += 1
-            logger.info(f"🔄 retry_count after increment: {self.retry_count}")
+            logger.debug("🔄 retry_count after increment: %d", self.retry_count)
             return False
         else:
             logger.warning(
-                f"❔ Confirmation: UNCLEAR ({intent.value}), incrementing "
-                f"retry_count to {self.retry_count + 1}"
+                "❔ Confirmation: UNCLEAR (%s), incrementing retry_count to %d",
+                intent.value, self.retry_count + 1,
             )
-            self.tts.speak("I didn't understand. Let's try again.")
+            self._speak_canned("I didn't understand. Let's try again.")
             self.retry_count += 1
-            logger.info(f"🔄 retry_count after increment: {self.retry_count}")
+            logger.debug("🔄 retry_count after increment: %d", self.retry_count)
             return False
 
-    def _provide_clarification(self) -> None:
-        """Provide clarification for current question."""
-        # For now, just repeat the question
-        # Could be enhanced with additional context
-        self.tts.speak("Let me repeat the question.")
-        self._ask_question()
-
-    def _skip_question(self, turn_start: float) -> None:
+    def _skip_question(self, turn_start_ns: int) -> None:
         """Skip current question.
 
         Args:
-            turn_start: Timestamp when turn started
+            turn_start_ns: time.perf_counter_ns() value when turn started
         """
         if self.current_question:
-            duration = time.time() - turn_start
-            turn = ConversationTurn(
+            duration = (time.perf_counter_ns() - turn_start_ns) / 1e9
+            turn = ConversationTurn.make_trusted(
                 question=self.current_question,
                 response=None,
                 duration_seconds=duration,
@@ -542,29 +416,28 @@ class InterviewOrchestrator:
             )
             self.session.add_turn(turn)
 
-        self.current_question_index += 1
-        self.tts.speak("Okay, moving to the next question.")
+        self._speak_canned("Okay, moving to the next question.")
 
-    def _save_turn(self, turn_start: float) -> None:
+    def _save_turn(self, turn_start_ns: int) -> None:
         """Save completed conversation turn.
 
         Args:
-            turn_start: Timestamp when turn started
+            turn_start_ns: time.perf_counter_ns() value when turn started
         """
         if not self.current_question:
             return
 
-        duration = time.time() - turn_start
+        duration = (time.perf_counter_ns() - turn_start_ns) / 1e9
 
         response = None
         if self.current_response_text:
-            response = Response(
+            response = Response.make_trusted(
                 text=self.current_response_text,
                 confidence=0.9,  # Placeholder
                 retry_count=self.retry_count,
             )
 
-        turn = ConversationTurn(
+        turn = ConversationTurn.make_trusted(
             question=self.current_question,
             response=response,
             duration_seconds=duration,
@@ -575,7 +448,7 @@ class InterviewOrchestrator:
 
     def _handle_closing(self) -> None:
         """Handle closing state."""
-        self.tts.speak(self.closing)
+        self._speak_canned(self.closing)
 
     def _handle_early_exit(self) -> None:
         """Handle user quitting early."""
@@ -592,9 +465,9 @@ class InterviewOrchestrator:
         total = len(self.questions)
         completed = self.current_question_index
 
-        # Count answered vs skipped from session turns
-        answered = sum(1 for turn in self.session.turns if not turn.skipped)
-        skipped = sum(1 for turn in self.session.turns if turn.skipped)
+        # Count answered vs skipped from the session's running totals
+        skipped = self.session.skipped_questions
+        answered = self.session.total_questions - skipped
 
         remaining = total - completed
         percent = (completed / total * 100) if total > 0 else 0
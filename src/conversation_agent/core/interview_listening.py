@@ -0,0 +1,258 @@
+"""Response recording and transcription for the interview orchestrator."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Callable, Optional
+
+from conversation_agent.core.conversation_state import UserIntent
+from conversation_agent.providers.stt.base import TranscriptionResult
+
+if TYPE_CHECKING:
+    from conversation_agent.core.audio import AudioManager
+    from conversation_agent.core.text_normalizer import TextNormalizer
+    from conversation_agent.providers.stt.base import STTProvider
+    from conversation_agent.providers.stt.batching import BatchedSTTService
+
+logger = logging.getLogger(__name__)
+
+# Minimum recording length for a valid response (seconds)
+_MIN_VALID_AUDIO_DURATION = 0.5
+
+# Minimum RMS for valid speech (~1.25x the old mean-abs floor)
+_MIN_RMS = 125
+
+# Common Whisper false positives on short, near-silent clips
+_WHISPER_HALLUCINATIONS: frozenset[str] = frozenset({
+    "you", "thank you", "thanks", ".", "...",
+    "bye", "goodbye", "music", "subscribe",
+})
+
+# Commands that end a recording as soon as they show up in interim STT text
+_STREAM_STOP_INTENTS = frozenset({UserIntent.SKIP, UserIntent.REPEAT, UserIntent.QUIT})
+
+
+class ListeningMixin:
+    """Records, screens and transcribes replies for InterviewOrchestrator.
+
+    Recordings that are too short, too quiet or look like Whisper
+    hallucinations are treated as silence, and spoken commands can end a
+    recording early.
+    """
+
+    stt: STTProvider
+    audio_manager: AudioManager
+    text_normalizer: Optional[TextNormalizer]  # noqa: UP045
+    last_audio_size: int
+    duplicate_audio_count: int
+    _stt_service: BatchedSTTService
+    _sample_rate: int
+    _bytes_per_second: int
+    _recognize_cached: Callable[..., tuple[UserIntent, float]]
+
+    def _listen_for_response(self) -> str:
+        """Listen for user response via STT.
+
+        Returns:
+            Transcribed text
+        """
+        logger.info("👂 Entering _listen_for_response, starting audio recording...")
+        # Record audio from microphone with high silence threshold
+        # This reduces false positives from echo/feedback and ambient noise
+        with self._command_spotter() as on_chunk:
+            audio_data = self.audio_manager.record_until_silence(
+                silence_threshold=0.05,   # Very high threshold = much less sensitive
+                silence_duration=3.0,     # 3 seconds of silence to ensure speech ended
+                on_chunk=on_chunk,
+                no_speech_timeout=2.0,    # Give up early if nobody starts talking
+            )
+        if not audio_data:
+            logger.warning("⚠️ No speech detected, treating as silence")
+            return ""
+
+        # Log audio data details
+        audio_duration = len(audio_data) / self._bytes_per_second
+        speech_duration = (
+            self.audio_manager.get_last_speech_bytes() / self._bytes_per_second
+        )
+        logger.info(
+            "🎤 Recorded audio: %d bytes, %.2fs duration (%.2fs before silence)",
+            len(audio_data), audio_duration, speech_duration,
+        )
+
+        # Check for duplicate audio (possible echo/feedback issue)
+        if len(audio_data) == self.last_audio_size and self.last_audio_size > 0:
+            self.duplicate_audio_count += 1
+            logger.warning(
+                "⚠️ DUPLICATE AUDIO DETECTED! Same audio size as previous: "
+                "%d bytes (count: %d). "
+                "This may indicate microphone is picking up TTS echo/feedback "
+                "or ambient noise.",
+                len(audio_data), self.duplicate_audio_count,
+            )
+        else:
+            self.duplicate_audio_count = 0  # Reset counter
+        self.last_audio_size = len(audio_data)
+
+        # Check audio quality - reject if too short (likely just noise)
+        if audio_duration < _MIN_VALID_AUDIO_DURATION:
+            logger.warning(
+                "⚠️ Audio too short (%.2fs < %ss), likely noise. Treating as silence.",
+                audio_duration, _MIN_VALID_AUDIO_DURATION,
+            )
+            return ""
+
+        # Check audio energy level - reject if too quiet (just ambient noise)
+        rms = self.audio_manager.get_last_rms()
+        if rms < _MIN_RMS:
+            logger.warning(
+                "⚠️ Audio RMS too low (%.0f < %d), likely ambient noise. "
+                "Treating as silence.",
+                rms, _MIN_RMS,
+            )
+            return ""
+
+        logger.info(
+            "✅ Audio quality check passed: duration=%.2fs, rms=%.0f",
+            audio_duration, rms,
+        )
+
+        # Transcribe the recorded audio
+        logger.info("🔊 Transcribing recorded audio...")
+        result = self._transcribe(audio_data)
+        # Log transcription result
+        logger.info("📝 Transcription result: %s", result)
+
+        user_text = result.get("text", "").strip()
+
+        # Apply text normalization for structured data (emails, phones, etc.)
+        if user_text and self.text_normalizer:
+            user_text = self.text_normalizer.normalize(user_text)
+
+        # Check for Whisper hallucinations (common false positives)
+        # (judged on speech length; the trailing silence window alone is 3s)
+        if (
+            user_text
+            and speech_duration < 2.0
+            and user_text.casefold() in _WHISPER_HALLUCINATIONS
+        ):
+            logger.warning(
+                "⚠️ Potential Whisper hallucination detected: %r "
+                "with short speech (%.2fs). Treating as silence.",
+                user_text, speech_duration,
+            )
+            return ""
+
+        if user_text:
+            logger.info("✅ User response: %r (length: %d)", user_text, len(user_text))
+        else:
+            logger.warning("⚠️ Empty transcription received")
+
+        return user_text
+
+    def _listen_for_confirmation(self) -> str:
+        """Listen for a short yes/no reply via STT.
+
+        Waits up to 3 seconds for the user to start talking, then stops after
+        a much shorter trailing silence than _listen_for_response since
+        confirmations are one or two words.
+
+        Returns:
+            Transcribed text, or empty string if the audio was too quiet
+        """
+        audio_data = self.audio_manager.record_until_silence(
+            silence_threshold=0.01,
+            silence_duration=0.8,    # Counted only once speech has started
+            max_duration=5.0,
+            no_speech_timeout=3.0,
+        )
+        rms = self.audio_manager.get_last_rms()
+        if not audio_data or rms < _MIN_RMS:
+            logger.warning("⚠️ No usable confirmation audio (rms=%.0f)", rms)
+            return ""
+
+        result = self._transcribe(audio_data)
+        return result.get("text", "").strip()
+
+    def _transcribe(self, audio_data: bytes) -> TranscriptionResult:
+        """Transcribe recorded audio through the shared batching service.
+
+        Silence before and after the detected speech is cut first, so STT
+        compute scales with how long the user spoke rather than with the
+        recording window.
+
+        Args:
+            audio_data: Raw audio bytes from the last microphone recording
+
+        Returns:
+            Transcription result dictionary
+        """
+        audio_data = self.audio_manager.trim_to_speech(audio_data)
+        return self._stt_service.submit(audio_data, self._sample_rate).result()
+
+    @contextlib.contextmanager
+    def _command_spotter(
+        self,
+        stop_intents: frozenset[UserIntent] = _STREAM_STOP_INTENTS,
+        context_intent: Optional[UserIntent] = None,  # noqa: UP045
+    ) -> Iterator[Callable[[bytes], bool]]:
+        """Build an on_chunk callback that stops recording on spoken commands.
+
+        Recorded audio is pushed to an STT stream and, about every 500ms, the
+        interim transcript is checked for a command (skip/repeat/quit by
+        default) so the recording doesn't have to wait out the full silence
+        timeout. Interim decodes go through the shared batching service, and
+        the stream is closed on exit so none is still running when the final
+        transcription starts.
+
+        Args:
+            stop_intents: Intents that end the recording
+            context_intent: Expected intent based on conversation context
+
+        Yields:
+            Callback for AudioManager.record_until_silence()
+        """
+        stream = self.stt.start_stream(
+            self._sample_rate,
+            transcribe=lambda audio_data, sample_rate: self._stt_service.submit(
+                audio_data, sample_rate
+            ).result(),
+        )
+        check_bytes = self._bytes_per_second // 2
+        pending = 0
+
+        def on_chunk(chunk: bytes) -> bool:
+            nonlocal pending
+            stream.push(chunk)
+            pending += len(chunk)
+            if pending < check_bytes:
+                return False
+            pending = 0
+            intent, confidence = self._recognize(stream.partial(), context_intent)
+            return intent in stop_intents and confidence > 0.8
+
+        try:
+            yield on_chunk
+        finally:
+            stream.close()
+
+    def _recognize(
+        self,
+        text: str,
+        context_intent: Optional[UserIntent] = None,  # noqa: UP045
+    ) -> tuple[UserIntent, float]:
+        """Recognize intent, reusing results for repeated utterances.
+
+        Args:
+            text: Transcribed user speech
+            context_intent: Expected intent based on conversation context
+
+        Returns:
+            Tuple of (intent, confidence_score); (UNKNOWN, 0.0) for empty text
+        """
+        key = text.strip().lower()
+        if not key:
+            return UserIntent.UNKNOWN, 0.0
+        return self._recognize_cached(key, context_intent)
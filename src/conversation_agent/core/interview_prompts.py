@@ -0,0 +1,253 @@
+"""Prompt playback and greeting handling for the interview orchestrator."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+from conversation_agent.core.audio import AudioError
+from conversation_agent.core.conversation_state import ConversationState, UserIntent
+from conversation_agent.core.interview_listening import ListeningMixin
+from conversation_agent.providers.tts.base import TTSError
+
+if TYPE_CHECKING:
+    from conversation_agent.core.audio import AudioManager
+    from conversation_agent.core.conversation_state import ConversationStateMachine
+    from conversation_agent.models.interview import InterviewSession, Question
+    from conversation_agent.providers.tts.base import TTSProvider
+
+logger = logging.getLogger(__name__)
+
+# Replies to the greeting that end its recording as soon as they're heard
+_GREETING_STOP_INTENTS = frozenset({UserIntent.START, UserIntent.QUIT})
+
+# Seconds to wait for the user to say they're ready before ending the session
+_GREETING_TIMEOUT = 60.0
+
+# Fixed prompts that can be spoken many times in one session
+_CANNED_PROMPTS = (
+    "I didn't catch that. Are you ready to begin?",
+    "I didn't hear that. Could you please repeat?",
+    "Okay, let's try again.",
+    "I didn't understand. Let's try again.",
+    "Okay, moving to the next question.",
+    "Let me repeat the question.",
+)
+
+
+class PromptMixin(ListeningMixin):
+    """Speaks prompts for InterviewOrchestrator and waits for the greeting reply.
+
+    Fixed prompts and questions are synthesized ahead of time when the TTS
+    provider supports it, and prompts can be cut short by barge-in.
+    """
+
+    tts: TTSProvider
+    audio_manager: AudioManager
+    state_machine: ConversationStateMachine
+    session: InterviewSession
+    questions: list[Question]
+    greeting: str
+    current_question: Optional[Question]  # noqa: UP045
+    enable_barge_in: bool
+    _canned: dict[str, bytes]
+
+    def _synthesize_prompts(self, prompts: tuple[str, ...]) -> dict[str, bytes]:
+        """Synthesize prompts ahead of time if the TTS provider supports it.
+
+        Args:
+            prompts: Prompt texts to synthesize
+
+        Returns:
+            Mapping of prompt text to audio (empty if unsupported)
+        """
+        canned: dict[str, bytes] = {}
+        for prompt in prompts:
+            try:
+                canned[prompt] = self.tts.synth_to_bytes(prompt)
+            except NotImplementedError:
+                return {}
+            except TTSError as e:
+                logger.warning("⚠️ Could not pre-synthesize %r: %s", prompt, e)
+        return canned
+
+    def _presynthesize_questions(self) -> None:
+        """Synthesize all question prompts into the canned audio cache.
+
+        Questions are synthesized one at a time, in order. Providers such as
+        Piper run synthesis on a single worker, so requesting one prompt at a
+        time keeps a speak() or prefetch() from queueing behind the whole
+        questionnaire.
+        """
+        try:
+            for question in self.questions:
+                text = self._format_question_text(question)
+                if text not in self._canned:
+                    self._canned[text] = self.tts.synth_to_bytes(text)
+        except TTSError as e:
+            logger.warning("⚠️ Question pre-synthesis stopped: %s", e)
+
+    def _speak_canned(self, text: str) -> None:
+        """Speak a prompt, replaying pre-synthesized audio when available.
+
+        Args:
+            text: Prompt text
+        """
+        audio = self._canned.get(text)
+        if audio is None:
+            self.tts.speak(text)
+        else:
+            self.tts.play_bytes(audio)
+
+    def _handle_greeting(self) -> None:
+        """Handle greeting state."""
+        if self._speak_prompt(self.greeting):
+            logger.info("🗣️ User interrupted the greeting, listening now")
+
+        # Wait for user to confirm ready, but not forever
+        deadline = time.monotonic() + _GREETING_TIMEOUT
+        while time.monotonic() < deadline:
+            # Record audio from microphone with shorter silence detection;
+            # stops as soon as the interim transcript says start or quit
+            with self._command_spotter(_GREETING_STOP_INTENTS, UserIntent.START) as on_chunk:
+                audio_data = self.audio_manager.record_until_silence(
+                    silence_threshold=0.005,  # Slightly less sensitive to noise
+                    silence_duration=2.0,     # 2 seconds of silence (faster response)
+                    on_chunk=on_chunk,
+                )
+            # Log audio data details
+            audio_duration = len(audio_data) / self._bytes_per_second
+            logger.info(
+                "🎤 Recorded audio: %d bytes, %.2fs duration",
+                len(audio_data), audio_duration,
+            )
+
+            result = self._transcribe(audio_data)
+            # Log transcription result
+            logger.info("📝 Transcription result: %s", result)
+            user_text = result.get("text", "")
+
+            intent, confidence = self._recognize(
+                user_text, context_intent=UserIntent.START
+            )
+            logger.info(
+                "🎯 Intent recognized: %s, confidence: %.2f, text: %r",
+                intent.value, confidence, user_text,
+            )
+
+            if intent == UserIntent.START:
+                return
+            elif intent == UserIntent.QUIT:
+                # User quit before starting
+                break
+            else:
+                # Repeat greeting
+                self._speak_canned("I didn't catch that. Are you ready to begin?")
+        else:
+            logger.warning("No ready confirmation after %.0fs, ending session", _GREETING_TIMEOUT)
+
+        self.session.mark_completed()
+        self.state_machine.transition_to(ConversationState.COMPLETE)
+
+    def _ask_question(self) -> bool:
+        """Speak current question via TTS.
+
+        Returns:
+            True if the user interrupted the question (barge-in)
+        """
+        if not self.current_question:
+            return False
+
+        question_text = self._format_question_text(self.current_question)
+        logger.info("🔊 Speaking question: %r", question_text)
+        logger.debug("📢 TTS provider: %s", type(self.tts).__name__)
+
+        if self._speak_prompt(question_text):
+            logger.info("🗣️ User interrupted the question, listening now")
+            return True
+        logger.info("✅ TTS completed speaking question")
+        return False
+
+    def _speak_prompt(self, text: str) -> bool:
+        """Speak a prompt the user is expected to answer.
+
+        Args:
+            text: Prompt text
+
+        Returns:
+            True if the user interrupted the prompt (barge-in)
+        """
+        if not self.enable_barge_in:
+            # Open the microphone stream while the prompt is being spoken
+            prewarm = threading.Thread(target=self.audio_manager.prewarm, daemon=True)
+            prewarm.start()
+            self._speak_canned(text)
+            prewarm.join()
+            return False
+
+        # Listen while speaking and cut playback short if the user talks
+        done = threading.Event()
+        interrupted = threading.Event()
+        watcher = threading.Thread(
+            target=self._watch_for_barge_in, args=(done, interrupted), daemon=True
+        )
+        watcher.start()
+        try:
+            self._speak_canned(text)
+        finally:
+            done.set()
+            watcher.join()
+
+        return interrupted.is_set()
+
+    def _watch_for_barge_in(
+        self, done: threading.Event, interrupted: threading.Event
+    ) -> None:
+        """Stop TTS playback if the user starts speaking before it ends.
+
+        Args:
+            done: Set by the caller once playback has finished
+            interrupted: Set here if the user's speech stopped playback
+        """
+        try:
+            heard = self.audio_manager.wait_for_speech(
+                threshold=0.05,  # Same threshold as response recording
+                stop_event=done,
+            )
+        except AudioError as e:
+            logger.warning("⚠️ Barge-in detection unavailable: %s", e)
+            return
+
+        if heard and not done.is_set():
+            interrupted.set()
+            self.tts.stop()
+
+    @staticmethod
+    def _format_question_text(question: Question) -> str:
+        """Build the text spoken when asking a question.
+
+        Args:
+            question: Question to ask
+
+        Returns:
+            Text for the TTS provider
+        """
+        return f"Question {question.number}. {question.text}"
+
+    def _wait_for_audio_to_settle(self) -> None:
+        """Wait for TTS playback to drain and the microphone to go quiet.
+
+        Replaces fixed sleeps: returns as soon as the mic hears silence, so
+        the next recording doesn't pick up the tail of the agent's speech.
+        """
+        self.tts.wait_until_done()
+        self.audio_manager.wait_for_silence(threshold=0.005, max_wait=0.5)
+
+    def _provide_clarification(self) -> None:
+        """Provide clarification for current question."""
+        # For now, just repeat the question
+        # Could be enhanced with additional context
+        self._speak_canned("Let me repeat the question.")
+        self._ask_question()
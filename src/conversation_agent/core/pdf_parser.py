@@ -1,14 +1,66 @@
 """PDF questionnaire parser for extracting interview questions."""
 
+import functools
+import hashlib
+import itertools
+import json
 import logging
+import multiprocessing
+import os
+import re
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional, Union
 
 from pypdf import PdfReader
 from pypdf.errors import PdfReadError
 
+try:
+    import pypdfium2 as pdfium  # Native text extraction, much faster than pypdf
+except ImportError:
+    pdfium = None
+
 from conversation_agent.models import Question
 
+logger = logging.getLogger(__name__)
+
+# Below this many pages, starting worker processes costs more than it saves
+_PARALLEL_MIN_PAGES = 16
+
+
+def _extract_page_text(page, page_num: int) -> Optional[str]:
+    """Extract text from one page, warning instead of raising on failure.
+
+    Args:
+        page: pypdf page object
+        page_num: Zero-based page index (for the warning)
+
+    Returns:
+        Page text, or None if extraction failed
+    """
+    try:
+        return page.extract_text()
+    except Exception as e:
+        # Warn but continue with other pages
+        logger.warning("Failed to extract text from page %d: %s", page_num + 1, e)
+        return None
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> list[Optional[str]]:
+    """Extract text from a range of pages (runs in a worker process).
+
+    Args:
+        pdf_path: Path to the PDF file
+        start: First page index
+        stop: Page index after the last page
+
+    Returns:
+        Text per page, None for pages whose text couldn't be extracted
+    """
+    reader = PdfReader(pdf_path)
+    return [_extract_page_text(reader.pages[i], i) for i in range(start, stop)]
+
 
 class PDFParseError(Exception):
     """Exception raised when PDF parsing fails."""
@@ -16,6 +68,143 @@ class PDFParseError(Exception):
     pass
 
 
+def _extract_pypdf_page_texts(pdf_path: str, max_workers: Optional[int]) -> list[Optional[str]]:
+    """Extract the text of every page with pypdf, in page order.
+
+    pypdf parses content streams in pure Python, so large PDFs are split
+    into contiguous page ranges extracted in separate processes.
+
+    Args:
+        pdf_path: Path to the PDF file
+        max_workers: Maximum worker processes (None uses every CPU)
+
+    Returns:
+        Text per page, None for pages whose text couldn't be extracted
+
+    Raises:
+        PDFParseError: If the PDF can't be opened or has no pages
+    """
+    try:
+        reader = PdfReader(pdf_path)
+    except PdfReadError as e:
+        raise PDFParseError(f"Failed to read PDF: {e}") from e
+    except Exception as e:
+        raise PDFParseError(f"Unexpected error reading PDF: {e}") from e
+
+    page_count = len(reader.pages)
+    if page_count == 0:
+        raise PDFParseError("PDF file has no pages")
+
+    workers = min(max_workers or os.cpu_count() or 1, page_count // _PARALLEL_MIN_PAGES)
+    if workers <= 1:
+        return [_extract_page_text(page, i) for i, page in enumerate(reader.pages)]
+
+    bounds = [page_count * i // workers for i in range(workers + 1)]
+    # Spawn rather than fork: the caller may already be running other threads
+    # (TTS, audio, STT batching), and forking those is unsafe
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        chunks = executor.map(_extract_page_range, [pdf_path] * workers, bounds[:-1], bounds[1:])
+        return [text for chunk in chunks for text in chunk]
+
+
+def _extract_pdfium_page_texts(pdf_path: str) -> list[Optional[str]]:
+    """Extract the text of every page with PDFium, in page order.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Text per page, None for pages whose text couldn't be extracted
+
+    Raises:
+        PDFParseError: If the PDF can't be opened or has no pages
+    """
+    try:
+        document = pdfium.PdfDocument(pdf_path)
+    except pdfium.PdfiumError as e:
+        raise PDFParseError(f"Failed to read PDF: {e}") from e
+    except Exception as e:
+        raise PDFParseError(f"Unexpected error reading PDF: {e}") from e
+
+    try:
+        if len(document) == 0:
+            raise PDFParseError("PDF file has no pages")
+
+        page_texts: list[Optional[str]] = []
+        for page_num in range(len(document)):
+            try:
+                text = document[page_num].get_textpage().get_text_range()
+            except Exception as e:
+                # Warn but continue with other pages
+                logger.warning("Failed to extract text from page %d: %s", page_num + 1, e)
+                page_texts.append(None)
+                continue
+            # PDFium separates lines with CRLF; pypdf (and _extract_questions) use LF
+            page_texts.append(text.replace("\r\n", "\n"))
+        return page_texts
+    finally:
+        document.close()
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_page_texts(
+    pdf_path: str,
+    mtime_ns: int,
+    size: int,
+    backend: str,
+    max_workers: Optional[int],
+    cache_dir: Optional[str],
+) -> tuple[Optional[str], ...]:
+    """Extract page texts, memoized in memory and optionally on disk.
+
+    The file's modification time and size are part of the key, so an
+    edited questionnaire is parsed again.
+
+    Args:
+        pdf_path: Resolved path to the PDF file
+        mtime_ns: File modification time (nanoseconds)
+        size: File size in bytes
+        backend: Text extraction backend ("pdfium" or "pypdf")
+        max_workers: Maximum worker processes for the pypdf backend
+        cache_dir: Directory for the on-disk cache, or None to skip it
+
+    Returns:
+        Text per page, None for pages whose text couldn't be extracted
+
+    Raises:
+        PDFParseError: If the PDF can't be opened or has no pages
+    """
+    signature = [mtime_ns, size, backend]
+    cache_file = None
+    if cache_dir is not None:
+        digest = hashlib.sha256(pdf_path.encode("utf-8")).hexdigest()
+        cache_file = Path(cache_dir) / f"{digest}.json"
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            if cached["signature"] == signature:
+                return tuple(cached["pages"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing or unreadable cache entry: parse the PDF
+
+    if backend == "pdfium":
+        page_texts = tuple(_extract_pdfium_page_texts(pdf_path))
+    else:
+        page_texts = tuple(_extract_pypdf_page_texts(pdf_path, max_workers))
+
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(
+                json.dumps({"signature": signature, "pages": page_texts}), encoding="utf-8"
+            )
+        except OSError as e:
+            logger.warning("Failed to write PDF cache %s: %s", cache_file, e)
+
+    return page_texts
+
+
 class PDFQuestionParser:
     """Parser for extracting questions from PDF questionnaires.
 
@@ -29,6 +218,9 @@ class PDFQuestionParser:
         min_question_length: int = 5,
         strip_whitespace: bool = True,
         skip_empty_lines: bool = True,
+        max_workers: Optional[int] = None,
+        backend: str = "auto",
+        cache_dir: Optional[Union[str, Path]] = None,
     ):
         """Initialize the PDF parser.
 
@@ -36,10 +228,33 @@ class PDFQuestionParser:
             min_question_length: Minimum character length for valid question
             strip_whitespace: Whether to strip leading/trailing whitespace
             skip_empty_lines: Whether to skip empty lines
+            max_workers: Processes used to extract text from large PDFs
+                (None uses every CPU, 1 extracts serially; pypdf backend only)
+            backend: Text extraction library: "pdfium" (pypdfium2), "pypdf",
+                or "auto" to use pdfium when it is installed
+            cache_dir: Directory for caching extracted text across processes
+                (e.g. ~/.cache/conversation_agent); parsed files are always
+                cached in memory
+
+        Raises:
+            ValueError: If backend is unknown or pypdfium2 is not installed
         """
+        if backend not in ("auto", "pdfium", "pypdf"):
+            raise ValueError(f"Unknown PDF backend: {backend}")
+        if backend == "pdfium" and pdfium is None:
+            raise ValueError(
+                "pypdfium2 is not installed. Install with: pip install -e '.[pdfium]'"
+            )
+        if backend == "auto":
+            backend = "pdfium" if pdfium is not None else "pypdf"
+
         self.min_question_length = min_question_length
         self.strip_whitespace = strip_whitespace
         self.skip_empty_lines = skip_empty_lines
+        self._question_end_re = self._compile_question_end_pattern()
+        self.max_workers = max_workers
+        self.backend = backend
+        self.cache_dir = str(Path(cache_dir).expanduser()) if cache_dir is not None else None
 
     def parse(self, pdf_path: Union[str, Path]) -> list[Question]:
         """Parse questions from a PDF file.
@@ -62,18 +277,18 @@ class PDFQuestionParser:
         if not pdf_path.is_file():
             raise PDFParseError(f"Path is not a file: {pdf_path}")
 
-        try:
-            reader = PdfReader(str(pdf_path))
-        except PdfReadError as e:
-            raise PDFParseError(f"Failed to read PDF: {e}") from e
-        except Exception as e:
-            raise PDFParseError(f"Unexpected error reading PDF: {e}") from e
-
-        if len(reader.pages) == 0:
-            raise PDFParseError("PDF file has no pages")
-
-        questions = self._extract_questions(reader)
-        logger = logging.getLogger(__name__)
+        stat = pdf_path.stat()
+        page_texts = _cached_page_texts(
+            str(pdf_path.resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            self.backend,
+            self.max_workers,
+            self.cache_dir,
+        )
+
+        # Questions are built fresh on every call: each gets its own id
+        questions = self._extract_questions(page_texts)
         logger.debug(f"Questions to ask: {questions}")
 
         if not questions:
@@ -81,70 +296,75 @@ class PDFQuestionParser:
 
         return questions
 
-    def _extract_questions(self, reader: PdfReader) -> list[Question]:
-        """Extract questions from all pages of the PDF.
+    def _extract_questions(self, page_texts: Sequence[Optional[str]]) -> list[Question]:
+        """Extract questions from the text of all pages.
 
         Args:
-            reader: PdfReader instance
+            page_texts: Text per page, None for pages that couldn't be read
 
         Returns:
             List of Question objects
         """
-        questions = []
-        question_number = 1
-        global_line_number = 0
+        readable = [text for text in page_texts if text is not None]
 
-        for page_num, page in enumerate(reader.pages):
-            try:
-                text = page.extract_text()
-            except Exception as e:
-                # Log warning but continue with other pages
-                print(f"Warning: Failed to extract text from page {page_num + 1}: {e}")
-                continue
+        # Line number of each page's first line, as a prefix sum of line counts
+        page_offsets = itertools.accumulate(
+            (text.count("\n") + 1 for text in readable), initial=0
+        )
 
-            lines = text.split("\n")
+        hits = [
+            (page_offset + line_index + 1, line)
+            for page_offset, text in zip(page_offsets, readable)
+            for line_index, line in self._find_question_lines(text)
+        ]
 
-            for _line_num, line in enumerate(lines):
-                global_line_number += 1
+        return [
+            Question(number=number, text=line, source_line=source_line)
+            for number, (source_line, line) in enumerate(hits, start=1)
+        ]
 
-                processed_line = self._process_line(line)
+    def _find_question_lines(self, text: str) -> Iterator[tuple[int, str]]:
+        """Find the question lines in one page of text.
 
-                if processed_line is None:
-                    continue
+        One regex scan jumps straight to the '?' ending each question line;
+        other lines are never visited in Python.
 
-                if len(processed_line) < self.min_question_length:
-                    continue
+        Args:
+            text: Page text
 
-                question = Question(
-                    number=question_number,
-                    text=processed_line,
-                    source_line=global_line_number,
-                )
-                questions.append(question)
-                question_number += 1
+        Yields:
+            (line_index, question_text) with zero-based line indexes
+        """
+        line_index = 0
+        counted_to = 0
+        for match in self._question_end_re.finditer(text):
+            end = match.start() + 1
+            start = text.rfind("\n", 0, end) + 1
+            line = text[start:end]
+            if self.strip_whitespace:
+                line = line.lstrip()
+            if len(line) < self.min_question_length:
+                continue
 
-        return questions
+            line_index += text.count("\n", counted_to, start)
+            counted_to = start
+            yield line_index, line
 
-    def _process_line(self, line: str) -> Optional[str]:
-        """Process a single line from the PDF.
+    def _compile_question_end_pattern(self) -> re.Pattern:
+        """Compile the pattern matching the '?' that ends a question line.
 
-        Args:
-            line: Raw line text
+        A question line ends with '?', ignoring trailing whitespace if
+        strip_whitespace is enabled. Empty lines never end with '?', so they
+        are always skipped. The pattern starts with a literal, which lets the
+        regex engine skip ahead to each '?' instead of trying every line.
 
         Returns:
-            Processed line text, or None if line should be skipped
+            Multiline pattern matching at the final '?' of each question line
         """
         if self.strip_whitespace:
-            line = line.strip()
-
-        if self.skip_empty_lines and not line:
-            return None
-
-        # Only accept lines ending with '?'
-        if not line.endswith('?'):
-            return None
-
-        return line
+            # [^\S\n] is whitespace within a line
+            return re.compile(r"\?[^\S\n]*$", re.MULTILINE)
+        return re.compile(r"\?$", re.MULTILINE)
 
     def validate_pdf(self, pdf_path: Union[str, Path]) -> tuple[bool, Optional[str]]:
         """Validate a PDF file without fully parsing it.
@@ -14,10 +14,54 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Callable
+
+try:
+    import re2  # Linear-time matching for the long-alternation patterns
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick  # Single-pass literal matching for digit words
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
 
+# What \s matches in ASCII text with the standard library (str.isspace());
+# RE2's \s leaves out \v and \x1c-\x1f
+_ASCII_WHITESPACE = r"[\t-\r\x1c-\x20]"
+
+
+class _IgnoreCasePattern:
+    """Case-insensitive pattern, matched with RE2 when it is installed.
+
+    RE2 runs in linear time, so the phone pattern's repeated alternation
+    can't backtrack on long transcriptions. RE2's ``\\s``, ``\\b`` and case folding
+    are ASCII-only, though, so it is only used for ASCII text; anything
+    else goes through the standard library ``re`` module, so results never
+    depend on which engine is installed.
+    """
+
+    def __init__(self, pattern: str) -> None:
+        """Compile the pattern for each engine.
+
+        Args:
+            pattern: Regular expression without backreferences or lookaround
+        """
+        self._re = re.compile(pattern, re.IGNORECASE)
+        self._re2 = None
+        if re2 is not None:
+            self._re2 = re2.compile("(?i)" + pattern.replace(r"\s", _ASCII_WHITESPACE))
+
+    def sub(self, repl: Callable[[re.Match], str], text: str) -> str:
+        """Replace every match in text, like ``re.Pattern.sub``."""
+        if self._re2 is not None and text.isascii():
+            return self._re2.sub(repl, text)
+        return self._re.sub(repl, text)
+
+
 class TextNormalizer:
     """Normalize spoken-domain text to written-domain format.
 
@@ -107,12 +151,15 @@ class TextNormalizer:
 
         original = text
 
-        # Apply normalizations in order
-        if self.enable_emails:
-            text = self._normalize_emails(text)
+        # Apply normalizations in order (in one scan if supported)
+        if self.enable_emails and self.enable_phones and self._fused_pattern is not None:
+            text = self._normalize_all(text)
+        else:
+            if self.enable_emails:
+                text = self._normalize_emails(text)
 
-        if self.enable_phones:
-            text = self._normalize_phone_numbers(text)
+            if self.enable_phones:
+                text = self._normalize_phone_numbers(text)
 
         # Log if changes were made
         if text != original and self.verbose:
@@ -120,6 +167,75 @@ class TextNormalizer:
 
         return text
 
+    def _normalize_all(self, text: str) -> str:
+        """Normalize email addresses and phone numbers in one regex scan.
+
+        Gives the same result as _normalize_emails() followed by
+        _normalize_phone_numbers(), which it falls back to in the rare case
+        that an email's local part starts inside a run of digit words.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Text with normalized email addresses and phone numbers
+        """
+        parts = []
+        last = 0
+        for match in self._fused_pattern.finditer(text):
+            if match.lastgroup == "email":
+                if self._digit_word_follows_pattern.match(text, match.end()):
+                    # "x at one dot one two three ...": the phone pass would
+                    # claim the email's last word too
+                    return self._normalize_phone_numbers(self._normalize_emails(text))
+                replacement = self._replace_email(match)
+            elif self._email_continuation_pattern.match(text, match.end()):
+                # "one two at gmail dot com": the email pass claims "two" first
+                return self._normalize_phone_numbers(self._normalize_emails(text))
+            else:
+                replacement = self._replace_phone(match)
+            parts.append(text[last : match.start()])
+            parts.append(replacement)
+            last = match.end()
+
+        if not parts:
+            return text
+        parts.append(text[last:])
+        return "".join(parts)
+
+    def _replace_email(self, match: re.Match) -> str:
+        """Format a matched spoken email address (regex sub callback)."""
+        local = match.group("local")  # "john dot smith"
+        domain = match.group("domain")  # "gmail dot com"
+
+        # Convert local part (case-insensitive replacement)
+        local_lower = local.lower()
+        local_normalized = local_lower.replace(" dot ", ".")
+        local_normalized = local_normalized.replace(" underscore ", "_")
+        local_normalized = local_normalized.replace(" dash ", "-")
+        local_normalized = local_normalized.replace(" ", "")
+
+        # Convert domain part (case-insensitive replacement)
+        domain_lower = domain.lower()
+        domain_normalized = domain_lower.replace(" dot ", ".")
+        domain_normalized = domain_normalized.replace(" ", "")
+
+        email = f"{local_normalized}@{domain_normalized}"
+        if self.verbose:
+            logger.debug(f"Email normalized: {match.group(0)} → {email}")
+        return email
+
+    def _replace_phone(self, match: re.Match) -> str:
+        """Format a matched spoken phone number (regex sub callback)."""
+        # The span is only digit words and whitespace: split it and map
+        # each word (casefolded, as the pattern ignores case) to its digits
+        digits = "".join(
+            map(self.DIGIT_WORDS.__getitem__, match.group("digits").casefold().split())
+        )
+        return self._format_phone_match(
+            match.group(0), digits, match.group("plus") is not None
+        )
+
     def _normalize_emails(self, text: str) -> str:
         """Normalize email addresses.
 
@@ -134,29 +250,7 @@ class TextNormalizer:
         Returns:
             Text with normalized email addresses
         """
-
-        def replace_email(match: re.Match) -> str:
-            local = match.group(1)  # "john dot smith"
-            domain = match.group(2)  # "gmail dot com"
-
-            # Convert local part (case-insensitive replacement)
-            local_lower = local.lower()
-            local_normalized = local_lower.replace(" dot ", ".")
-            local_normalized = local_normalized.replace(" underscore ", "_")
-            local_normalized = local_normalized.replace(" dash ", "-")
-            local_normalized = local_normalized.replace(" ", "")
-
-            # Convert domain part (case-insensitive replacement)
-            domain_lower = domain.lower()
-            domain_normalized = domain_lower.replace(" dot ", ".")
-            domain_normalized = domain_normalized.replace(" ", "")
-
-            email = f"{local_normalized}@{domain_normalized}"
-            if self.verbose:
-                logger.debug(f"Email normalized: {match.group(0)} → {email}")
-            return email
-
-        return self._email_pattern.sub(replace_email, text)
+        return self._email_pattern.sub(self._replace_email, text)
 
     def _normalize_phone_numbers(self, text: str) -> str:
         """Normalize phone numbers.
@@ -172,29 +266,96 @@ class TextNormalizer:
         Returns:
             Text with normalized phone numbers
         """
+        if self._digit_automaton is not None:
+            lowered = text.lower()
+            if len(lowered) == len(text):  # Offsets in lowered map back onto text
+                return self._normalize_phone_runs(text, lowered)
+
+        return self._phone_pattern.sub(self._replace_phone, text)
+
+    def _normalize_phone_runs(self, text: str, lowered: str) -> str:
+        """Normalize phone numbers found with the digit-word automaton.
+
+        Equivalent to the regex path in _normalize_phone_numbers(), but finds
+        every digit word in one Aho-Corasick pass over the text.
+
+        Args:
+            text: Input text
+            lowered: Lowercased text, the same length as ``text``
+
+        Returns:
+            Text with normalized phone numbers
+        """
+        parts = []
+        last = 0
+        for start, end, digits in self._digit_word_runs(lowered):
+            plus = self._plus_prefix_pattern.search(lowered, last, start)
+            if plus:
+                start = plus.start()
+            parts.append(text[last:start])
+            parts.append(self._format_phone_match(text[start:end], digits, plus is not None))
+            last = end
+
+        if not parts:
+            return text
+        parts.append(text[last:])
+        return "".join(parts)
+
+    def _digit_word_runs(self, lowered: str):
+        """Find runs of two or more whitespace-separated digit words.
 
-        def replace_phone(match: re.Match) -> str:
-            prefix = match.group(1)  # "plus " or None
-            words = match.group(2).lower().split()
+        Args:
+            lowered: Lowercased text
 
-            # Convert words to digits
-            digits = "".join(self.DIGIT_WORDS.get(w, w) for w in words)
+        Yields:
+            (start, end, digits) for each run, with ``end`` exclusive
+        """
+        # Blank out non-word characters so the space-padded keys only hit
+        # whole words: "o" inside "phone" or "to" inside "too" never matches
+        padded = f" {self._non_word_pattern.sub(' ', lowered)} "
+        run_start = run_end = 0
+        run_digits: list[str] = []
+        for last_index, (length, digit) in self._digit_automaton.iter(padded):
+            end = last_index - 1  # Drop the trailing pad, shift past the leading one
+            start = end - length
+
+            if run_digits and lowered[run_end:start].isspace():
+                run_end = end
+                run_digits.append(digit)
+                continue
+
+            if len(run_digits) >= 2:
+                yield run_start, run_end, "".join(run_digits)
+            run_start, run_end, run_digits = start, end, [digit]
+
+        if len(run_digits) >= 2:
+            yield run_start, run_end, "".join(run_digits)
+
+    def _format_phone_match(self, original: str, digits: str, is_international: bool) -> str:
+        """Format the digits of a matched digit-word run.
 
-            # Only format if it looks like a phone number (7-15 digits)
-            if not (7 <= len(digits) <= 15 and digits.isdigit()):
-                return match.group(0)  # Keep original
+        Args:
+            original: Matched text, returned unchanged if it isn't a phone number
+            digits: Digits spoken in the match
+            is_international: Whether the match has a "plus" prefix
 
-            # Format based on length and prefix
-            formatted = self._format_phone_digits(digits, prefix is not None)
+        Returns:
+            Formatted phone number, or the original text
+        """
+        # Only format if it looks like a phone number (7-15 digits)
+        if not (7 <= len(digits) <= 15 and digits.isdigit()):
+            return original  # Keep original
 
-            if self.verbose:
-                logger.debug(f"Phone normalized: {match.group(0)} → {formatted}")
+        # Format based on length and prefix
+        formatted = self._format_phone_digits(digits, is_international)
 
-            return formatted
+        if self.verbose:
+            logger.debug(f"Phone normalized: {original} → {formatted}")
 
-        return self._phone_pattern.sub(replace_phone, text)
+        return formatted
 
-    def _format_phone_digits(self, digits: str, is_international: bool) -> str:
+    @staticmethod
+    def _format_phone_digits(digits: str, is_international: bool) -> str:
         """Format digit string as phone number.
 
         Args:
@@ -230,21 +391,51 @@ class TextNormalizer:
         # - "john.smith at gmail dot com" (hybrid: typed local + spoken domain)
         # Local part: alphanumeric with optional dots/special separators
         # Domain part: Must have either a dot (.) OR "dot" word to be valid
-        self._email_pattern = re.compile(
-            r"\b([a-z0-9]+(?:[._-][a-z0-9]+)*(?:\s+(?:dot|underscore|dash)\s+[a-z0-9]+)*)"
+        email = (
+            r"\b(?P<local>[a-z0-9]+(?:[._-][a-z0-9]+)*"
+            r"(?:\s+(?:dot|underscore|dash)\s+[a-z0-9]+)*)"
             r"\s+at\s+"
-            r"([a-z0-9]+(?:[.][a-z0-9]+)+|[a-z0-9]+(?:\s+dot\s+[a-z0-9]+)+)\b",
-            re.IGNORECASE,
+            r"(?P<domain>[a-z0-9]+(?:[.][a-z0-9]+)+|[a-z0-9]+(?:\s+dot\s+[a-z0-9]+)+)\b"
         )
+        self._email_pattern = _IgnoreCasePattern(email)
 
         # Phone pattern: (plus)? sequence of digit words
         # Captures: "five five five one two three four"
         digit_words = "|".join(self.DIGIT_WORDS.keys())
-        self._phone_pattern = re.compile(
-            rf"\b(plus\s+)?"  # Optional "plus" for international
-            rf"((?:{digit_words})"  # First digit word
-            rf"(?:\s+(?:{digit_words}))+)\b",  # Remaining digit words
-            re.IGNORECASE,
+        phone = (
+            rf"\b(?P<plus>plus\s+)?"  # Optional "plus" for international
+            rf"(?P<digits>(?:{digit_words})"  # First digit word
+            rf"(?:\s+(?:{digit_words}))+)\b"  # Remaining digit words
+        )
+        self._phone_pattern = _IgnoreCasePattern(phone)
+
+        # Optional automaton over the same words, scanned once per text
+        self._digit_automaton = None
+        if ahocorasick is not None:
+            self._digit_automaton = ahocorasick.Automaton()
+            for word, digit in self.DIGIT_WORDS.items():
+                self._digit_automaton.add_word(f" {word} ", (len(word), digit))
+            self._digit_automaton.make_automaton()
+        self._non_word_pattern = re.compile(r"\W")
+        self._plus_prefix_pattern = re.compile(r"\bplus\s+$")
+
+        # Both patterns in one alternation, so normalize() usually scans the
+        # text once. Only used with the standard library engine: with RE2 or
+        # the digit-word automaton, separate passes are faster.
+        self._fused_pattern = None
+        if re2 is None and self._digit_automaton is None:
+            self._fused_pattern = re.compile(
+                f"(?P<email>{email})|(?P<phone>{phone})", re.IGNORECASE
+            )
+
+        # Where the fused scan could split text differently from the separate
+        # email and phone passes: a phone run followed by what can continue an
+        # email's local part, or an email followed by a digit word
+        self._email_continuation_pattern = re.compile(
+            r"[._-][a-z0-9]|\s+(?:at|dot|underscore|dash)\s", re.IGNORECASE
+        )
+        self._digit_word_follows_pattern = re.compile(
+            rf"\s+(?:{digit_words})\b", re.IGNORECASE
         )
 
 
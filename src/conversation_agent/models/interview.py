@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class Question(BaseModel):
@@ -26,7 +27,26 @@ class Question(BaseModel):
         default=None, description="Line number from source PDF"
     )
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @classmethod
+    def make_trusted(
+        cls, number: int, text: str, source_line: Optional[int] = None  # noqa: UP045
+    ) -> Question:
+        """Build a question from values already known to be valid.
+
+        Skips Pydantic validation. Use the regular constructor for input
+        that hasn't been checked (e.g. text parsed from a PDF).
+
+        Args:
+            number: Question number (1-indexed)
+            text: Question text
+            source_line: Line number from source PDF
+
+        Returns:
+            Question instance
+        """
+        return cls.model_construct(number=number, text=text, source_line=source_line)
 
 
 class Response(BaseModel):
@@ -50,7 +70,29 @@ class Response(BaseModel):
         default=False, description="User requested clarification"
     )
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @classmethod
+    def make_trusted(
+        cls,
+        text: str,
+        confidence: float = 1.0,
+        retry_count: int = 0,
+    ) -> Response:
+        """Build a response from values already known to be valid.
+
+        Skips Pydantic validation, which is pure overhead for responses
+        assembled from STT output on every turn.
+
+        Args:
+            text: Transcribed response text
+            confidence: Transcription confidence (0.0 to 1.0)
+            retry_count: Number of retries
+
+        Returns:
+            Response instance
+        """
+        return cls.model_construct(text=text, confidence=confidence, retry_count=retry_count)
 
 
 class ConversationTurn(BaseModel):
@@ -70,7 +112,36 @@ class ConversationTurn(BaseModel):
     )
     skipped: bool = Field(default=False, description="Question was skipped")
 
-    model_config = ConfigDict(frozen=False)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    @classmethod
+    def make_trusted(
+        cls,
+        question: Question,
+        response: Optional[Response] = None,  # noqa: UP045
+        duration_seconds: float = 0.0,
+        skipped: bool = False,
+    ) -> ConversationTurn:
+        """Build a turn from models and values already known to be valid.
+
+        Skips Pydantic validation (including re-checking the nested question
+        and response).
+
+        Args:
+            question: The question that was asked
+            response: The user's response (None if skipped/unanswered)
+            duration_seconds: Turn duration in seconds
+            skipped: Question was skipped
+
+        Returns:
+            ConversationTurn instance
+        """
+        return cls.model_construct(
+            question=question,
+            response=response,
+            duration_seconds=duration_seconds,
+            skipped=skipped,
+        )
 
 
 class InterviewSession(BaseModel):
@@ -96,6 +167,24 @@ class InterviewSession(BaseModel):
 
     model_config = ConfigDict(frozen=False)
 
+    # Running counts behind answered_questions/skipped_questions; turns are
+    # frozen, so counting each one as it's added stays correct
+    _answered: int = PrivateAttr(default=0)
+    _skipped: int = PrivateAttr(default=0)
+    # Monotonic clock readings behind total_duration_seconds; start_time and
+    # end_time are kept for display. None when the session wasn't timed here.
+    _start_ns: Optional[int] = PrivateAttr(default=None)  # noqa: UP045
+    _end_ns: Optional[int] = PrivateAttr(default=None)  # noqa: UP045
+
+    def model_post_init(self, __context: Any) -> None:
+        """Count the turns the session was created with and start its timer."""
+        for turn in self.turns:
+            self._count_turn(turn)
+        # A session given its start time was started elsewhere (e.g. loaded);
+        # only the wall clock applies to it
+        if "start_time" not in self.model_fields_set:
+            self._start_ns = time.monotonic_ns()
+
     def add_turn(self, turn: ConversationTurn) -> None:
         """Add a conversation turn to the session.
 
@@ -103,11 +192,24 @@ class InterviewSession(BaseModel):
             turn: The conversation turn to add
         """
         self.turns.append(turn)
+        self._count_turn(turn)
+
+    def _count_turn(self, turn: ConversationTurn) -> None:
+        """Update the answered/skipped counts for a new turn.
+
+        Args:
+            turn: The conversation turn being added
+        """
+        if turn.skipped:
+            self._skipped += 1
+        elif turn.response:
+            self._answered += 1
 
     def mark_completed(self) -> None:
         """Mark the interview session as completed."""
         self.completed = True
         self.end_time = datetime.now()
+        self._end_ns = time.monotonic_ns()
 
     @property
     def total_questions(self) -> int:
@@ -117,16 +219,19 @@ class InterviewSession(BaseModel):
     @property
     def answered_questions(self) -> int:
         """Get number of questions that were answered."""
-        return sum(1 for turn in self.turns if turn.response and not turn.skipped)
+        return self._answered
 
     @property
     def skipped_questions(self) -> int:
         """Get number of questions that were skipped."""
-        return sum(1 for turn in self.turns if turn.skipped)
+        return self._skipped
 
     @property
     def total_duration_seconds(self) -> float:
         """Get total interview duration in seconds."""
+        if self._start_ns is not None and (self.end_time is None or self._end_ns is not None):
+            end_ns = self._end_ns if self._end_ns is not None else time.monotonic_ns()
+            return (end_ns - self._start_ns) / 1e9
         if self.end_time:
             return (self.end_time - self.start_time).total_seconds()
         return (datetime.now() - self.start_time).total_seconds()
@@ -6,13 +6,28 @@ various STT providers (Whisper, Parakeet, etc.).
 
 from __future__ import annotations
 
-from conversation_agent.providers.stt.base import STTError, STTProvider
+from conversation_agent.providers.stt.base import (
+    LocalAgreementStream,
+    Segment,
+    STTError,
+    STTProvider,
+    STTStream,
+    TranscriptionResult,
+)
+from conversation_agent.providers.stt.batching import BatchedSTTService
+from conversation_agent.providers.stt.faster_whisper_provider import FasterWhisperProvider
 from conversation_agent.providers.stt.parakeet_provider import ParakeetProvider
 from conversation_agent.providers.stt.whisper_provider import WhisperProvider
 
 __all__ = [
     "STTProvider",
     "STTError",
+    "STTStream",
+    "LocalAgreementStream",
+    "Segment",
+    "TranscriptionResult",
+    "BatchedSTTService",
+    "FasterWhisperProvider",
     "ParakeetProvider",
     "WhisperProvider",
 ]
@@ -2,8 +2,30 @@
 
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterable, Iterator
+from typing import Callable, Optional, TypedDict  # noqa: UP045
+
+
+class Segment(TypedDict):
+    """Timed part of a transcription result."""
+
+    start: float
+    end: float
+    text: str
+
+
+class TranscriptionResult(TypedDict):
+    """Transcription result returned by STT providers."""
+
+    text: str
+    language: str
+    segments: list[Segment]
+
+
+# Decoder used for interim passes: (audio_data, sample_rate) -> result dict
+Transcriber = Callable[[bytes, int], TranscriptionResult]
 
 
 class STTError(Exception):
@@ -12,6 +34,164 @@ class STTError(Exception):
     pass
 
 
+class STTStream:
+    """Incremental transcription session returned by STTProvider.start_stream().
+
+    Audio is pushed chunk by chunk while it is being recorded, and partial()
+    returns the interim transcript so far. This default session produces no
+    interim text; providers with a streaming backend return a subclass.
+    """
+
+    def __init__(self, sample_rate: int) -> None:
+        """Initialize stream.
+
+        Args:
+            sample_rate: Sample rate of the pushed audio in Hz.
+        """
+        self.sample_rate = sample_rate
+
+    def push(self, chunk: bytes) -> None:
+        """Add a chunk of raw PCM audio (16-bit) to the stream.
+
+        Args:
+            chunk: Audio bytes.
+        """
+        return
+
+    def partial(self) -> str:
+        """Get the interim transcript of the audio pushed so far.
+
+        Returns:
+            Interim text (empty if none is available).
+        """
+        return ""
+
+    def close(self) -> None:
+        """End the session and wait for any background decoding to finish.
+
+        Call this before running the final transcription so interim passes
+        never overlap it.
+        """
+        return
+
+
+def agreed_prefix(previous: list[str], current: list[str]) -> list[str]:
+    """Get the words two consecutive hypotheses agree on (LocalAgreement-2).
+
+    Words are compared case-insensitively, ignoring trailing punctuation.
+
+    Args:
+        previous: Words of the previous hypothesis.
+        current: Words of the current hypothesis.
+
+    Returns:
+        Longest common prefix, using the words from the current hypothesis.
+    """
+    count = 0
+    for old, new in zip(previous, current):
+        if old.lower().rstrip(".,!?") != new.lower().rstrip(".,!?"):
+            break
+        count += 1
+    return current[:count]
+
+
+class LocalAgreementStream(STTStream):
+    """Interim transcripts from re-transcribing the growing audio buffer.
+
+    Every step_seconds of new audio, the whole buffer is transcribed again on
+    a background thread. Words are confirmed once two consecutive hypotheses
+    agree on them, so partial() only returns text that has stopped changing.
+    Decoding never blocks push() or partial().
+
+    Each pass costs as much as the buffer is long, so passes stop once the
+    buffer reaches max_seconds; spoken commands come early in an utterance.
+    """
+
+    def __init__(
+        self,
+        provider: STTProvider,
+        sample_rate: int,
+        step_seconds: float = 1.0,
+        transcribe: Optional[Transcriber] = None,  # noqa: UP045
+        max_seconds: float = 10.0,
+    ) -> None:
+        """Initialize stream.
+
+        Args:
+            provider: Provider used to transcribe the buffer.
+            sample_rate: Sample rate of the pushed audio in Hz.
+            step_seconds: Audio to collect between re-transcriptions.
+            transcribe: Decoder for interim passes. Defaults to the provider's
+                transcribe_audio_data(); pass a serialized one (e.g.
+                BatchedSTTService) when the final transcription may run
+                concurrently.
+            max_seconds: Buffer length after which no new passes start.
+        """
+        super().__init__(sample_rate)
+        self._transcribe = transcribe or provider.transcribe_audio_data
+        self._step_bytes = int(step_seconds * sample_rate) * 2
+        self._max_bytes = int(max_seconds * sample_rate) * 2
+        self._buffer = bytearray()
+        self._decoded_bytes = 0
+        self._hypothesis: list[str] = []
+        self._confirmed: list[str] = []
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None  # noqa: UP045
+        self._closed = False
+
+    def push(self, chunk: bytes) -> None:
+        """Add a chunk of raw PCM audio (16-bit) to the stream.
+
+        Args:
+            chunk: Audio bytes.
+        """
+        self._buffer += chunk
+
+    def partial(self) -> str:
+        """Get the confirmed transcript so far, starting a new pass if due.
+
+        Returns:
+            Confirmed text (empty until two passes agree).
+        """
+        idle = not self._closed and (self._worker is None or not self._worker.is_alive())
+        due = len(self._buffer) - self._decoded_bytes >= self._step_bytes
+        if idle and due and self._decoded_bytes < self._max_bytes:
+            self._decoded_bytes = min(len(self._buffer), self._max_bytes)
+            self._worker = threading.Thread(
+                target=self._decode,
+                args=(bytes(self._buffer[: self._decoded_bytes]),),
+                daemon=True,
+            )
+            self._worker.start()
+
+        with self._lock:
+            return " ".join(self._confirmed)
+
+    def close(self) -> None:
+        """Stop starting new passes and wait for the running one to finish."""
+        self._closed = True
+        if self._worker is not None:
+            self._worker.join()
+
+    def _decode(self, audio_data: bytes) -> None:
+        """Transcribe the buffer and confirm words agreed with the last pass.
+
+        Args:
+            audio_data: Audio buffer snapshot.
+        """
+        try:
+            result = self._transcribe(audio_data, self.sample_rate)
+        except STTError:
+            return
+
+        words = result.get("text", "").split()
+        with self._lock:
+            agreed = agreed_prefix(self._hypothesis, words)
+            if len(agreed) > len(self._confirmed):
+                self._confirmed = agreed
+            self._hypothesis = words
+
+
 class STTProvider(ABC):
     """Abstract base class for Speech-to-Text providers.
 
@@ -20,19 +200,19 @@ class STTProvider(ABC):
 
     Example:
         class MySTTProvider(STTProvider):
-            def transcribe(self, audio_path: str) -> dict[str, Any]:
+            def transcribe(self, audio_path: str) -> TranscriptionResult:
                 # Implementation here
                 pass
 
             def transcribe_audio_data(
                 self, audio_data: bytes, sample_rate: int
-            ) -> dict[str, Any]:
+            ) -> TranscriptionResult:
                 # Implementation here
                 pass
     """
 
     @abstractmethod
-    def transcribe(self, audio_path: str) -> dict[str, Any]:
+    def transcribe(self, audio_path: str) -> TranscriptionResult:
         """Transcribe audio file to text.
 
         Args:
@@ -61,7 +241,7 @@ class STTProvider(ABC):
     @abstractmethod
     def transcribe_audio_data(
         self, audio_data: bytes, sample_rate: int = 16000
-    ) -> dict[str, Any]:
+    ) -> TranscriptionResult:
         """Transcribe raw audio data to text.
 
         Args:
@@ -76,6 +256,125 @@ class STTProvider(ABC):
         """
         pass
 
+    def transcribe_batch(
+        self, audio_items: list[tuple[bytes, int]]
+    ) -> list[TranscriptionResult]:
+        """Transcribe several raw audio buffers in one call.
+
+        The default implementation transcribes each buffer in turn. Providers
+        whose backend can decode a batch at once should override this to
+        amortize per-call model overhead.
+
+        Args:
+            audio_items: List of (audio_data, sample_rate) tuples.
+
+        Returns:
+            List of transcription result dictionaries, in input order
+            (same format as transcribe()).
+
+        Raises:
+            STTError: If transcription fails.
+        """
+        return [
+            self.transcribe_audio_data(audio_data, sample_rate)
+            for audio_data, sample_rate in audio_items
+        ]
+
+    def start_stream(
+        self,
+        sample_rate: int = 16000,
+        transcribe: Optional[Transcriber] = None,  # noqa: UP045
+    ) -> STTStream:
+        """Start an incremental transcription session.
+
+        Used to look at interim transcripts while audio is still being
+        recorded. The final result should still come from
+        transcribe_audio_data(), after the stream is closed. The default
+        session never produces interim text.
+
+        Args:
+            sample_rate: Sample rate of the audio that will be pushed.
+            transcribe: Decoder for interim passes, for streams that
+                re-transcribe audio (defaults to transcribe_audio_data()).
+
+        Returns:
+            Stream to push audio chunks into.
+        """
+        return STTStream(sample_rate)
+
+    def transcribe_stream(
+        self,
+        chunks: Iterable[bytes],
+        sample_rate: int = 16000,
+        step_seconds: float = 1.0,
+    ) -> Iterator[str]:
+        """Transcribe audio as it arrives, yielding text that has settled.
+
+        The default implementation re-transcribes the growing buffer every
+        step_seconds of audio and yields the words that two consecutive
+        passes agree on (LocalAgreement-2). The last value yielded is the
+        transcript of the complete audio.
+
+        Args:
+            chunks: Raw audio chunks (PCM format, 16-bit), in order.
+            sample_rate: Sample rate in Hz.
+            step_seconds: Audio to collect between re-transcriptions.
+
+        Yields:
+            Confirmed transcript so far, each time it grows, then the final
+            transcript.
+
+        Raises:
+            STTError: If transcription fails.
+        """
+        step_bytes = int(step_seconds * sample_rate) * 2
+        buffer = bytearray()
+        decoded_bytes = 0
+        hypothesis: list[str] = []
+        confirmed: list[str] = []
+
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) - decoded_bytes < step_bytes:
+                continue
+            decoded_bytes = len(buffer)
+            words = self.transcribe_audio_data(bytes(buffer), sample_rate)["text"].split()
+            agreed = agreed_prefix(hypothesis, words)
+            hypothesis = words
+            if len(agreed) > len(confirmed):
+                confirmed = agreed
+                yield " ".join(confirmed)
+
+        if not buffer:
+            return
+
+        # Show the final pass as it decodes, once it goes past the confirmed text
+        shown, last, text = len(confirmed), None, ""
+        for text in self._final_transcripts(bytes(buffer), sample_rate):
+            if len(text.split()) > shown:
+                shown, last = len(text.split()), text
+                yield text
+        if text != last:
+            yield text
+
+    def _final_transcripts(self, audio_data: bytes, sample_rate: int) -> Iterator[str]:
+        """Transcribe the complete audio for transcribe_stream().
+
+        Providers whose backend decodes incrementally can override this to
+        yield the transcript as it grows.
+
+        Args:
+            audio_data: Raw audio bytes (PCM format, 16-bit).
+            sample_rate: Sample rate in Hz.
+
+        Yields:
+            Transcript so far; the last value is the full transcript.
+
+        Raises:
+            STTError: If transcription fails.
+        """
+        yield self.transcribe_audio_data(audio_data, sample_rate)["text"].strip()
+
     @abstractmethod
     def get_available_models(self) -> list[str]:
         """Get list of available models for this provider.
@@ -0,0 +1,167 @@
+"""Batched transcription shared by concurrent interview sessions."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from typing import Optional
+
+from conversation_agent.providers.stt.base import STTError, STTProvider, TranscriptionResult
+
+# Queued request: (audio_data, sample_rate, future); None stops the worker
+_Request = Optional[tuple[bytes, int, "Future[TranscriptionResult]"]]
+
+
+class BatchedSTTService:
+    """Collects transcription requests and runs them through one batched call.
+
+    When several interviews share an STT provider in one process, requests
+    that arrive within a short window are decoded together with
+    STTProvider.transcribe_batch(). A lone request goes through
+    transcribe_audio_data() unchanged.
+
+    The service only holds a weak reference to the provider. Its worker
+    thread stops when close() is called or the provider is garbage
+    collected.
+
+    Example:
+        service = BatchedSTTService.for_provider(provider)
+        result = service.submit(audio_data, 16000).result()
+        print(result["text"])
+    """
+
+    _services: weakref.WeakKeyDictionary[STTProvider, BatchedSTTService] = (
+        weakref.WeakKeyDictionary()
+    )
+    _services_lock = threading.Lock()
+
+    def __init__(
+        self, provider: STTProvider, window: float = 0.05, max_batch: int = 16
+    ) -> None:
+        """Initialize the service and start its worker thread.
+
+        Args:
+            provider: Provider that performs the transcription.
+            window: Time to wait for more requests after the first (seconds).
+            max_batch: Maximum number of requests decoded together.
+        """
+        self._provider_ref = weakref.ref(provider)
+        self.window = window
+        self.max_batch = max_batch
+        self._requests: queue.Queue[_Request] = queue.Queue()
+        # Guards _closed so no request is queued behind the stop sentinel
+        self._closed_lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._run, name="stt-batcher", daemon=True
+        )
+        self._worker.start()
+        weakref.finalize(provider, self._requests.put, None)
+
+    @property
+    def provider(self) -> STTProvider | None:
+        """Provider that performs the transcription (None once collected)."""
+        return self._provider_ref()
+
+    @classmethod
+    def for_provider(cls, provider: STTProvider) -> BatchedSTTService:
+        """Get the service shared by every session using this provider.
+
+        Args:
+            provider: STT provider instance.
+
+        Returns:
+            Shared service for the provider.
+        """
+        with cls._services_lock:
+            service = cls._services.get(provider)
+            if service is None:
+                service = cls(provider)
+                cls._services[provider] = service
+            return service
+
+    def submit(self, audio_data: bytes, sample_rate: int) -> Future[TranscriptionResult]:
+        """Queue audio for transcription.
+
+        Args:
+            audio_data: Raw audio bytes (PCM format, 16-bit).
+            sample_rate: Sample rate in Hz.
+
+        Returns:
+            Future resolving to the transcription result dictionary.
+
+        Raises:
+            STTError: If the service has been closed.
+        """
+        future: Future[TranscriptionResult] = Future()
+        with self._closed_lock:
+            if self._closed:
+                raise STTError("Batched STT service is closed")
+            self._requests.put((audio_data, sample_rate, future))
+        return future
+
+    def close(self) -> None:
+        """Stop the worker after the requests already queued are decoded."""
+        with self._closed_lock:
+            if not self._closed:
+                self._closed = True
+                self._requests.put(None)
+        provider = self.provider
+        if provider is not None:
+            with self._services_lock:
+                if self._services.get(provider) is self:
+                    del self._services[provider]
+        self._worker.join()
+
+    def _run(self) -> None:
+        """Worker loop: gather requests for one window, then decode them."""
+        running = True
+        while running:
+            request = self._requests.get()
+            if request is None:
+                return
+            batch = [request]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    running = False
+                    break
+                batch.append(request)
+            self._transcribe(batch)
+
+    def _transcribe(
+        self, batch: list[tuple[bytes, int, Future[TranscriptionResult]]]
+    ) -> None:
+        """Transcribe a batch and resolve each request's future.
+
+        Args:
+            batch: Requests as (audio_data, sample_rate, future) tuples.
+        """
+        provider = self.provider
+        try:
+            if provider is None:
+                raise STTError("STT provider is no longer available")
+            if len(batch) == 1:
+                audio_data, sample_rate, _ = batch[0]
+                results = [provider.transcribe_audio_data(audio_data, sample_rate)]
+            else:
+                results = provider.transcribe_batch(
+                    [(audio_data, sample_rate) for audio_data, sample_rate, _ in batch]
+                )
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
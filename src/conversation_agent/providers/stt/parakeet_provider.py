@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import inspect
 import logging
+import os
+import shutil
 import tempfile
+import threading
 import wave
-from pathlib import Path
-from typing import Any
+import weakref
+from typing import Any, Optional  # noqa: UP045
 
-from conversation_agent.providers.stt.base import STTError, STTProvider
+import numpy as np
+
+from conversation_agent.providers.stt.base import STTError, STTProvider, TranscriptionResult
 
 logger = logging.getLogger(__name__)
 
+# The temp WAV file goes to tmpfs when available, so it never touches the disk
+_TEMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 
 class ParakeetProvider(STTProvider):
     """Nvidia Parakeet-TDT Speech-to-Text provider.
@@ -43,48 +52,57 @@ class ParakeetProvider(STTProvider):
     ]
 
     # Supported languages (v3 model)
-    SUPPORTED_LANGUAGES = [
-        "en",
-        "es",
-        "fr",
-        "de",
-        "it",
-        "pt",
-        "pl",
-        "nl",
-        "cs",
-        "ro",
-        "hu",
-        "el",
-        "bg",
-        "hr",
-        "da",
-        "fi",
-        "sk",
-        "sl",
-        "sv",
-        "et",
-        "lt",
-        "lv",
-        "mt",
-        "ga",
-        "cy",
-    ]
+    SUPPORTED_LANGUAGES: frozenset[str] = frozenset(
+        [
+            "en",
+            "es",
+            "fr",
+            "de",
+            "it",
+            "pt",
+            "pl",
+            "nl",
+            "cs",
+            "ro",
+            "hu",
+            "el",
+            "bg",
+            "hr",
+            "da",
+            "fi",
+            "sk",
+            "sl",
+            "sv",
+            "et",
+            "lt",
+            "lv",
+            "mt",
+            "ga",
+            "cy",
+        ]
+    )
 
     def __init__(
         self,
         model_name: str = "nvidia/parakeet-tdt-0.6b-v3",
         language: str = "en",
-        enable_timestamps: bool = True,
+        enable_timestamps: bool = False,
         use_local_attention: bool = False,
+        compile_model: bool = False,
     ):
         """Initialize Parakeet provider.
 
         Args:
             model_name: Parakeet model identifier from HuggingFace.
             language: Language code (e.g., "en", "es"). Empty for auto-detect.
-            enable_timestamps: Extract word/segment timestamps (default: True).
+            enable_timestamps: Extract word/segment timestamps (default: False).
+                This runs an extra alignment pass, so it is off unless needed;
+                transcribe() can also turn it on per call.
             use_local_attention: Use local attention for long audio (default: False).
+            compile_model: Compile the encoder with torch.compile
+                (mode="reduce-overhead", which uses CUDA graphs) and warm it
+                up at load time (default: False). Set TORCHINDUCTOR_CACHE_DIR
+                to keep compiled kernels between runs.
 
         Raises:
             STTError: If model loading fails or invalid parameters.
@@ -98,14 +116,20 @@ class ParakeetProvider(STTProvider):
         if language and language not in self.SUPPORTED_LANGUAGES:
             logger.warning(
                 f"Language {language} may not be supported. "
-                f"Supported: {', '.join(self.SUPPORTED_LANGUAGES)}"
+                f"Supported: {', '.join(self.supported_languages())}"
             )
 
         self.model_name = model_name
         self.language = language
         self.enable_timestamps = enable_timestamps
         self.use_local_attention = use_local_attention
+        self.compile_model = compile_model
         self._model = None
+        # Whether model.transcribe() takes numpy arrays (NeMo 2.x "audio" arg)
+        self._accepts_arrays = False
+        # WAV file rewritten for each file-based transcription (created on first use)
+        self._wav_path: Optional[str] = None  # noqa: UP045
+        self._wav_lock = threading.Lock()
 
         # Lazy load model (load on first use)
         self._load_model()
@@ -129,6 +153,13 @@ class ParakeetProvider(STTProvider):
                 )
                 logger.info("Configured local attention for long-form audio")
 
+            self._accepts_arrays = (
+                "audio" in inspect.signature(self._model.transcribe).parameters
+            )
+
+            if self.compile_model:
+                self._compile()
+
             logger.info(f"Successfully loaded {self.model_name}")
 
         except ImportError as e:
@@ -138,11 +169,39 @@ class ParakeetProvider(STTProvider):
         except Exception as e:
             raise STTError(f"Failed to load Parakeet model '{self.model_name}': {e}") from e
 
-    def transcribe(self, audio_path: str) -> dict[str, Any]:
+    def _compile(self) -> None:
+        """Compile the encoder and run one warm-up transcription.
+
+        Short interview utterances are dominated by per-kernel launch
+        overhead, which CUDA graphs remove. Compilation happens on the first
+        call, so a 1 second silent clip is transcribed here rather than
+        delaying the first real answer.
+        """
+        import torch
+
+        self._model.eval()
+        self._model.encoder = torch.compile(
+            self._model.encoder, mode="reduce-overhead", dynamic=True
+        )
+        logger.info("Compiled Parakeet encoder with torch.compile")
+
+        if self._accepts_arrays:
+            self._model.transcribe(
+                [np.zeros(16000, dtype=np.float32)], batch_size=1, verbose=False
+            )
+
+    def transcribe(
+        self,
+        audio_path: str,
+        with_timestamps: Optional[bool] = None,  # noqa: UP045
+    ) -> TranscriptionResult:
         """Transcribe audio file to text.
 
         Args:
             audio_path: Path to audio file (.wav, .flac preferred).
+            with_timestamps: Extract segment timestamps for this call
+                (default: the provider's enable_timestamps setting). Without
+                timestamps the whole text is returned as a single segment.
 
         Returns:
             Dictionary with transcription results:
@@ -162,46 +221,65 @@ class ParakeetProvider(STTProvider):
             STTError: If transcription fails.
             FileNotFoundError: If audio file doesn't exist.
         """
-        if not Path(audio_path).exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if with_timestamps is None:
+            with_timestamps = self.enable_timestamps
 
         try:
             # Transcribe with optional timestamps
-            output = self._model.transcribe([audio_path], timestamps=self.enable_timestamps)
-
-            # Extract transcription text
-            text = output[0].text if hasattr(output[0], "text") else output[0]
-
-            # Build segments from timestamps if available
-            segments = []
-            if self.enable_timestamps and hasattr(output[0], "timestamp"):
-                segment_timestamps = output[0].timestamp.get("segment", [])
-                for seg in segment_timestamps:
-                    segments.append(
-                        {
-                            "start": seg.get("start", 0.0),
-                            "end": seg.get("end", 0.0),
-                            "text": seg.get("text", ""),
-                        }
-                    )
-            else:
-                # Fallback: single segment
-                segments = [{"start": 0.0, "end": 0.0, "text": text}]
-
-            return {
-                "text": text,
-                "language": self.language if self.language else "auto",
-                "segments": segments,
-            }
+            output = self._model.transcribe([audio_path], timestamps=with_timestamps)
+            return self._format_output(output[0], with_timestamps)
 
         except Exception as e:
+            # Only stat the file once the backend has failed to read it
+            if not os.path.exists(audio_path):
+                raise FileNotFoundError(f"Audio file not found: {audio_path}") from e
             raise STTError(f"Transcription failed for '{audio_path}': {e}") from e
 
+    def _format_output(self, output: Any, timestamps: bool) -> TranscriptionResult:
+        """Convert one NeMo transcription output to the result dictionary.
+
+        Args:
+            output: Hypothesis (or plain string) returned by model.transcribe().
+            timestamps: Whether the output was decoded with timestamps.
+
+        Returns:
+            Dictionary with transcription results (same format as transcribe()).
+        """
+        # Extract transcription text
+        text = output.text if hasattr(output, "text") else output
+
+        # Build segments from timestamps if available
+        segments = []
+        if timestamps and hasattr(output, "timestamp"):
+            segment_timestamps = output.timestamp.get("segment", [])
+            for seg in segment_timestamps:
+                segments.append(
+                    {
+                        "start": seg.get("start", 0.0),
+                        "end": seg.get("end", 0.0),
+                        "text": seg.get("text", ""),
+                    }
+                )
+        else:
+            # Fallback: single segment
+            segments = [{"start": 0.0, "end": 0.0, "text": text}]
+
+        return {
+            "text": text,
+            "language": self.language if self.language else "auto",
+            "segments": segments,
+        }
+
     def transcribe_audio_data(
         self, audio_data: bytes, sample_rate: int = 16000
-    ) -> dict[str, Any]:
+    ) -> TranscriptionResult:
         """Transcribe raw audio data to text.
 
+        16kHz audio is passed to NeMo as an in-memory array when the installed
+        NeMo version supports it. Otherwise it is written to a WAV file (on
+        tmpfs when available) that is reused for every call, and NeMo handles
+        resampling.
+
         Args:
             audio_data: Raw audio bytes (PCM format, 16-bit).
             sample_rate: Sample rate in Hz (Parakeet expects 16kHz).
@@ -213,28 +291,94 @@ class ParakeetProvider(STTProvider):
             STTError: If transcription fails.
         """
         try:
-            # Parakeet NeMo models expect file input, so write to temp file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                tmp_path = tmp_file.name
+            if self._accepts_arrays and sample_rate == 16000:
+                output = self._model.transcribe(
+                    [self._to_array(audio_data)],
+                    batch_size=1,
+                    timestamps=self.enable_timestamps,
+                )
+                return self._format_output(output[0], self.enable_timestamps)
 
-                # Write audio data to WAV file
-                with wave.open(tmp_path, "wb") as wav_file:
+            # Older NeMo models expect file input, so rewrite the temp WAV file
+            with self._wav_lock:
+                wav_path = self._temp_wav_path()
+                with wave.open(wav_path, "wb") as wav_file:
                     wav_file.setnchannels(1)  # Mono
                     wav_file.setsampwidth(2)  # 16-bit
                     wav_file.setframerate(sample_rate)
                     wav_file.writeframes(audio_data)
 
-            try:
-                # Transcribe the temporary file
-                result = self.transcribe(tmp_path)
-                return result
-            finally:
-                # Clean up temp file
-                Path(tmp_path).unlink(missing_ok=True)
+                return self.transcribe(wav_path)
 
         except Exception as e:
             raise STTError(f"Transcription failed for audio data: {e}") from e
 
+    def transcribe_batch(
+        self, audio_items: list[tuple[bytes, int]]
+    ) -> list[TranscriptionResult]:
+        """Transcribe several raw audio buffers with one batched model call.
+
+        Used by BatchedSTTService when several utterances are queued at once.
+        Falls back to per-buffer transcription when the installed NeMo
+        version can't take arrays or a buffer isn't 16kHz.
+
+        Args:
+            audio_items: List of (audio_data, sample_rate) tuples.
+
+        Returns:
+            List of transcription result dictionaries, in input order.
+
+        Raises:
+            STTError: If transcription fails.
+        """
+        if not audio_items:
+            return []
+
+        if (
+            not self._accepts_arrays
+            or len(audio_items) == 1
+            or any(sample_rate != 16000 for _, sample_rate in audio_items)
+        ):
+            return super().transcribe_batch(audio_items)
+
+        try:
+            outputs = self._model.transcribe(
+                [self._to_array(audio_data) for audio_data, _ in audio_items],
+                batch_size=len(audio_items),
+                timestamps=self.enable_timestamps,
+            )
+            return [self._format_output(output, self.enable_timestamps) for output in outputs]
+        except Exception as e:
+            raise STTError(f"Batch transcription failed: {e}") from e
+
+    def _temp_wav_path(self) -> str:
+        """Get the provider's temp WAV path, creating its directory on first use.
+
+        The directory is removed when the provider is garbage collected or the
+        interpreter exits.
+
+        Returns:
+            Path of the WAV file to write audio to.
+        """
+        if self._wav_path is None:
+            tmp_dir = tempfile.mkdtemp(prefix="parakeet-", dir=_TEMP_DIR)
+            weakref.finalize(self, shutil.rmtree, tmp_dir, ignore_errors=True)
+            self._wav_path = os.path.join(tmp_dir, "audio.wav")
+        return self._wav_path
+
+    @staticmethod
+    def _to_array(audio_data: bytes) -> np.ndarray:
+        """Convert 16-bit PCM bytes to float32 audio in [-1.0, 1.0].
+
+        Args:
+            audio_data: Raw audio bytes (PCM format, 16-bit).
+
+        Returns:
+            Float32 audio array.
+        """
+        samples = np.frombuffer(audio_data, dtype=np.int16)
+        return np.multiply(samples, np.float32(1.0 / 32768.0), dtype=np.float32)
+
     def get_available_models(self) -> list[str]:
         """Get list of available Parakeet models.
 
@@ -243,6 +387,15 @@ class ParakeetProvider(STTProvider):
         """
         return self.AVAILABLE_MODELS.copy()
 
+    @classmethod
+    def supported_languages(cls) -> list[str]:
+        """Get the supported language codes, sorted.
+
+        Returns:
+            List of language codes.
+        """
+        return sorted(cls.SUPPORTED_LANGUAGES)
+
     def set_language(self, language: str) -> None:
         """Set the language for transcription.
 
@@ -256,7 +409,7 @@ class ParakeetProvider(STTProvider):
         if language and language not in self.SUPPORTED_LANGUAGES:
             raise STTError(
                 f"Language '{language}' not supported. "
-                f"Supported: {', '.join(self.SUPPORTED_LANGUAGES)}"
+                f"Supported: {', '.join(self.supported_languages())}"
             )
 
         self.language = language
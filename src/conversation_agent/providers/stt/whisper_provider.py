@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Any
+import math
+import os
+from typing import Any, Optional  # noqa: UP045
 
 import numpy as np
 
-from conversation_agent.providers.stt.base import STTError, STTProvider
+try:
+    from scipy.signal import resample_poly  # Polyphase FIR resampling
+except ImportError:
+    resample_poly = None
+
+from conversation_agent.providers.stt.base import (
+    LocalAgreementStream,
+    STTError,
+    STTProvider,
+    STTStream,
+    Transcriber,
+    TranscriptionResult,
+)
 
 
 class WhisperProvider(STTProvider):
@@ -26,7 +39,11 @@ class WhisperProvider(STTProvider):
     AVAILABLE_MODELS = ["tiny", "base", "small", "medium", "large", "turbo"]
 
     def __init__(
-        self, model_size: str = "base", language: str = "en", device: str = "cpu"
+        self,
+        model_size: str = "base",
+        language: str = "en",
+        device: str = "cpu",
+        interim_transcripts: bool = False,
     ):
         """Initialize Whisper provider.
 
@@ -34,6 +51,9 @@ class WhisperProvider(STTProvider):
             model_size: Model size (tiny, base, small, medium, large, turbo).
             language: Language code for transcription (e.g., "en", "es", "fr").
             device: Device to use ("cpu" or "cuda").
+            interim_transcripts: Produce interim text in start_stream() by
+                re-decoding the recording in the background. Off by default,
+                since every pass re-decodes the whole buffer.
 
         Raises:
             STTError: If model loading fails or invalid parameters.
@@ -47,7 +67,10 @@ class WhisperProvider(STTProvider):
         self.model_size = model_size
         self.language = language
         self.device = device
+        self.interim_transcripts = interim_transcripts
         self._model = None
+        # Pinned host buffer for copying 30s windows to the GPU (cuda only)
+        self._pinned_audio = None
 
         # Lazy load model (load on first use)
         self._load_model()
@@ -69,7 +92,7 @@ class WhisperProvider(STTProvider):
         except Exception as e:
             raise STTError(f"Failed to load Whisper model '{self.model_size}': {e}") from e
 
-    def transcribe(self, audio_path: str) -> dict[str, Any]:
+    def transcribe(self, audio_path: str) -> TranscriptionResult:
         """Transcribe audio file to text.
 
         Args:
@@ -90,15 +113,12 @@ class WhisperProvider(STTProvider):
             STTError: If transcription fails.
             FileNotFoundError: If audio file doesn't exist.
         """
-        if not Path(audio_path).exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
-
         try:
             # Transcribe with Whisper
             result = self._model.transcribe(
                 audio_path,
                 language=self.language if self.language else None,
-                fp16=(self.device == "cuda"),  # Use FP16 on GPU
+                fp16=self._on_cuda,  # Use FP16 on GPU
             )
 
             return {
@@ -114,11 +134,14 @@ class WhisperProvider(STTProvider):
                 ],
             }
         except Exception as e:
+            # Only stat the file once the backend has failed to read it
+            if not os.path.exists(audio_path):
+                raise FileNotFoundError(f"Audio file not found: {audio_path}") from e
             raise STTError(f"Transcription failed for '{audio_path}': {e}") from e
 
     def transcribe_audio_data(
         self, audio_data: bytes, sample_rate: int = 16000
-    ) -> dict[str, Any]:
+    ) -> TranscriptionResult:
         """Transcribe raw audio data to text.
 
         Args:
@@ -134,24 +157,13 @@ class WhisperProvider(STTProvider):
         try:
             import whisper
 
-            # Convert bytes to numpy array
-            # Assuming 16-bit PCM audio
-            audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-
-            # Normalize to [-1.0, 1.0]
-            audio_array = audio_array / 32768.0
-
-            # Resample if needed (Whisper expects 16kHz)
-            if sample_rate != 16000:
-                audio_array = self._resample(audio_array, sample_rate, 16000)
+            audio_array = self._prepare_audio(audio_data, sample_rate)
 
             # Pad or trim to 30 seconds (Whisper processes in 30s chunks)
             audio_array = whisper.pad_or_trim(audio_array)
 
             # Create mel spectrogram
-            mel = whisper.log_mel_spectrogram(
-                audio_array, n_mels=self._model.dims.n_mels
-            ).to(self._model.device)
+            mel = self._log_mel_spectrogram(audio_array)
 
             # Detect language if not specified
             if not self.language:
@@ -161,7 +173,7 @@ class WhisperProvider(STTProvider):
                 detected_lang = self.language
 
             # Decode audio
-            options = whisper.DecodingOptions(language=detected_lang, fp16=(self.device == "cuda"))
+            options = whisper.DecodingOptions(language=detected_lang, fp16=self._on_cuda)
             result = whisper.decode(self._model, mel, options)
 
             return {
@@ -183,11 +195,128 @@ class WhisperProvider(STTProvider):
         except Exception as e:
             raise STTError(f"Transcription failed for audio data: {e}") from e
 
+    def transcribe_batch(
+        self, audio_items: list[tuple[bytes, int]]
+    ) -> list[TranscriptionResult]:
+        """Transcribe several raw audio buffers with one batched decode.
+
+        All buffers are stacked into a single mel-spectrogram batch so the
+        encoder/decoder run once. Falls back to per-buffer transcription when
+        the language is auto-detected, since a batch decodes in one language.
+
+        Args:
+            audio_items: List of (audio_data, sample_rate) tuples.
+
+        Returns:
+            List of transcription result dictionaries, in input order.
+
+        Raises:
+            STTError: If transcription fails.
+        """
+        if not audio_items:
+            return []
+
+        if not self.language or len(audio_items) == 1:
+            return super().transcribe_batch(audio_items)
+
+        try:
+            import whisper
+
+            batch = np.stack(
+                [
+                    whisper.pad_or_trim(self._prepare_audio(audio_data, sample_rate))
+                    for audio_data, sample_rate in audio_items
+                ]
+            )
+            mel = whisper.log_mel_spectrogram(
+                batch, n_mels=self._model.dims.n_mels
+            ).to(self._model.device)
+
+            options = whisper.DecodingOptions(
+                language=self.language, fp16=self._on_cuda
+            )
+            results = whisper.decode(self._model, mel, options)
+
+            return [
+                {
+                    "text": result.text,
+                    "language": self.language,
+                    "segments": [{"start": 0.0, "end": 30.0, "text": result.text}],
+                }
+                for result in results
+            ]
+        except ImportError as e:
+            raise STTError(
+                "Required libraries not installed. Install with: "
+                "pip install openai-whisper numpy"
+            ) from e
+        except Exception as e:
+            raise STTError(f"Batch transcription failed: {e}") from e
+
+    @property
+    def _on_cuda(self) -> bool:
+        """Whether the model runs on a CUDA device ("cuda", "cuda:1", ...)."""
+        return str(self.device).startswith("cuda")
+
+    def _log_mel_spectrogram(self, audio_array: np.ndarray) -> Any:
+        """Compute the log-mel spectrogram of a 30s window on the model's device.
+
+        On CUDA the audio goes through a reused pinned host buffer, so the
+        host-to-device copy is asynchronous and allocation-free, and the
+        spectrogram is computed on the GPU. On CPU it is computed directly.
+
+        Args:
+            audio_array: Float32 audio padded or trimmed to 30 seconds.
+
+        Returns:
+            Mel spectrogram tensor on the model's device.
+        """
+        import whisper
+
+        if not self._on_cuda:
+            return whisper.log_mel_spectrogram(
+                audio_array, n_mels=self._model.dims.n_mels
+            ).to(self._model.device)
+
+        import torch
+
+        if self._pinned_audio is None:
+            self._pinned_audio = torch.empty(
+                len(audio_array), dtype=torch.float32, pin_memory=True
+            )
+        self._pinned_audio.copy_(torch.from_numpy(audio_array))
+        audio = self._pinned_audio.to(self._model.device, non_blocking=True)
+        return whisper.log_mel_spectrogram(audio, n_mels=self._model.dims.n_mels)
+
+    def _prepare_audio(self, audio_data: bytes, sample_rate: int) -> np.ndarray:
+        """Convert 16-bit PCM bytes to 16kHz float32 audio in [-1.0, 1.0].
+
+        Args:
+            audio_data: Raw audio bytes (PCM format, 16-bit).
+            sample_rate: Sample rate in Hz.
+
+        Returns:
+            Float32 audio array at 16kHz.
+        """
+        # Convert 16-bit PCM to float32 in [-1.0, 1.0] in one pass, without
+        # an intermediate unscaled float32 copy
+        samples = np.frombuffer(audio_data, dtype=np.int16)
+        audio_array = np.multiply(samples, np.float32(1.0 / 32768.0), dtype=np.float32)
+
+        # Resample if needed (Whisper expects 16kHz)
+        if sample_rate != 16000:
+            audio_array = self._resample(audio_array, sample_rate, 16000)
+
+        return audio_array
+
     def _resample(
         self, audio: np.ndarray, orig_sr: int, target_sr: int
     ) -> np.ndarray:
         """Resample audio to target sample rate.
 
+        Uses scipy's polyphase filter (anti-aliased) when scipy is installed,
+        otherwise linear interpolation.
+
         Args:
             audio: Audio array.
             orig_sr: Original sample rate.
@@ -196,8 +325,12 @@ class WhisperProvider(STTProvider):
         Returns:
             Resampled audio array.
         """
+        if resample_poly is not None:
+            factor = math.gcd(orig_sr, target_sr)
+            resampled = resample_poly(audio, target_sr // factor, orig_sr // factor)
+            return resampled.astype(np.float32, copy=False)
+
         # Simple linear interpolation resampling
-        # For production, consider using librosa or scipy for better quality
         duration = len(audio) / orig_sr
         target_length = int(duration * target_sr)
 
@@ -206,6 +339,29 @@ class WhisperProvider(STTProvider):
 
         return resampled.astype(np.float32)
 
+    def start_stream(
+        self,
+        sample_rate: int = 16000,
+        transcribe: Optional[Transcriber] = None,  # noqa: UP045
+    ) -> STTStream:
+        """Start an incremental transcription session.
+
+        Whisper has no native streaming mode, so with interim_transcripts
+        enabled, interim text comes from re-decoding the growing buffer in the
+        background (LocalAgreement-2). Otherwise the session produces none.
+
+        Args:
+            sample_rate: Sample rate of the audio that will be pushed.
+            transcribe: Decoder for interim passes (defaults to
+                transcribe_audio_data()).
+
+        Returns:
+            Stream to push audio chunks into.
+        """
+        if not self.interim_transcripts:
+            return super().start_stream(sample_rate, transcribe)
+        return LocalAgreementStream(self, sample_rate, transcribe=transcribe)
+
     def get_available_models(self) -> list[str]:
         """Get list of available Whisper models.
 
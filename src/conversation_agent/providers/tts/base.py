@@ -99,6 +99,63 @@ class TTSProvider(ABC):
         """
         pass
 
+    def prefetch(self, text: str) -> None:
+        """Prepare audio for text that is about to be spoken.
+
+        Optional method. Providers that synthesize before playing can
+        override this to synthesize in the background, so a later speak()
+        with the same text only has to play it. The default does nothing.
+
+        Args:
+            text: The text that will be passed to speak() next.
+        """
+        return
+
+    def wait_until_done(self) -> None:
+        """Block until any audio from the last speak() call has finished playing.
+
+        Optional method. The default does nothing because speak() already
+        blocks until playback is complete; providers that play audio
+        asynchronously should override it.
+        """
+        return
+
+    def synth_to_bytes(self, text: str) -> bytes:
+        """Synthesize speech without playing it.
+
+        Optional method. Used together with play_bytes() to synthesize
+        repeated prompts once and replay them.
+
+        Args:
+            text: The text to synthesize.
+
+        Returns:
+            Raw audio data accepted by play_bytes().
+
+        Raises:
+            NotImplementedError: If provider doesn't support byte synthesis.
+            TTSError: If synthesis fails.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support synthesizing to bytes"
+        )
+
+    def play_bytes(self, audio_data: bytes) -> None:
+        """Play audio previously returned by synth_to_bytes().
+
+        Optional method. Should block until playback is complete.
+
+        Args:
+            audio_data: Raw audio data from synth_to_bytes().
+
+        Raises:
+            NotImplementedError: If provider doesn't support byte playback.
+            TTSError: If playback fails.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support playing raw audio"
+        )
+
     def save_to_file(self, text: str, filename: str) -> None:
         """Save speech to an audio file.
 
@@ -0,0 +1,91 @@
+"""Thread-safe LRU cache shared by the TTS providers."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from typing import Generic, Optional, TypeVar  # noqa: UP045
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded mapping that evicts its least recently used entry.
+
+    Lookups refresh an entry's position, so they are guarded by the same
+    lock as stores; a worker thread can fill the cache while callers read it.
+
+    Example:
+        cache = LRUCache(maxsize=2)
+        cache.put("a", b"...")
+        audio = cache.get("a")
+
+    Attributes:
+        maxsize: Maximum number of entries kept.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:  # noqa: UP045
+        """Look up an entry, marking it as most recently used.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            The cached value, or None if not cached
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Store an entry, evicting the least recently used one when full.
+
+        Args:
+            key: Entry key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:  # noqa: UP045
+        """Remove an entry.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            The removed value, or None if not cached
+        """
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over a snapshot of the keys, least recently used first."""
+        with self._lock:
+            return iter(list(self._entries))
@@ -0,0 +1,139 @@
+"""Piper voice model files: INT8 quantization and onnxruntime session setup."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional  # noqa: UP045
+
+from conversation_agent.providers.tts.base import TTSError
+
+
+def quantized_model_path(model_path: str | Path) -> Path:
+    """Get the path of a model's INT8 variant (e.g. voice.onnx -> voice_int8.onnx).
+
+    Args:
+        model_path: Path to the FP32 ONNX model
+
+    Returns:
+        Path where quantize_model() writes the INT8 model
+    """
+    path = Path(model_path)
+    return path.with_name(f"{path.stem}_int8{path.suffix}")
+
+
+def quantize_model(
+    model_path: str | Path,
+    output_path: Optional[str | Path] = None,  # noqa: UP045
+) -> Path:
+    """Quantize a Piper model's weights to INT8 with onnxruntime.
+
+    The voice config is unchanged, so the quantized model keeps using the
+    original .onnx.json file.
+
+    Args:
+        model_path: Path to the FP32 ONNX model
+        output_path: Where to write the INT8 model
+                    (default: quantized_model_path(model_path))
+
+    Returns:
+        Path of the quantized model
+
+    Raises:
+        TTSError: If the quantization tools are missing or quantization fails
+    """
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError as e:
+        raise TTSError(
+            "ONNX quantization tools not installed. Install with: pip install onnx onnxruntime"
+        ) from e
+
+    output = Path(output_path) if output_path else quantized_model_path(model_path)
+    try:
+        quantize_dynamic(str(model_path), str(output), weight_type=QuantType.QInt8)
+    except Exception as e:
+        raise TTSError(f"Failed to quantize {model_path}: {e}") from e
+    return output
+
+
+def _cpu_has_int8_dot_product() -> bool:
+    """Check whether the CPU has INT8 dot-product instructions.
+
+    These are AVX-VNNI/AVX512-VNNI on x86 and dotprod on ARM64. Without
+    them, quantized models can run slower than FP32. Only Linux is
+    detected; elsewhere this returns False.
+
+    Returns:
+        True if /proc/cpuinfo lists a VNNI or dotprod flag
+    """
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith(("flags", "Features")):
+                    flags = set(line.split(":", 1)[-1].split())
+                    return bool(flags & {"avx_vnni", "avx512_vnni", "asimddp"})
+    except OSError:
+        pass
+    return False
+
+
+def cuda_available() -> bool:
+    """Check whether onnxruntime can run models on a CUDA GPU.
+
+    Returns:
+        True if the installed onnxruntime (onnxruntime-gpu) has the CUDA
+        execution provider
+    """
+    import onnxruntime
+
+    return "CUDAExecutionProvider" in onnxruntime.get_available_providers()
+
+
+def select_model_file(
+    model_path: Path,
+    use_quantized: Optional[bool] = None,  # noqa: UP045
+    use_cuda: bool = False,
+) -> Path:
+    """Choose the model file to load.
+
+    Args:
+        model_path: Path to the FP32 ONNX model
+        use_quantized: Prefer the INT8 variant; if None, only on CPUs with
+            INT8 dot-product instructions
+        use_cuda: Whether the model will run on the GPU, where INT8
+            dynamic quantization isn't auto-selected
+
+    Returns:
+        The INT8 variant when enabled and present, otherwise model_path
+    """
+    if use_quantized is None:
+        use_quantized = not use_cuda and _cpu_has_int8_dot_product()
+
+    quantized = quantized_model_path(model_path)
+    if use_quantized and quantized.exists():
+        return quantized
+    return model_path
+
+
+def create_session(model_file: Path, providers: list[str], num_threads: int) -> Any:
+    """Create an onnxruntime session limited to num_threads threads.
+
+    PiperVoice.load() always uses default session options, so the session
+    is replaced after loading when a thread limit is set.
+
+    Args:
+        model_file: ONNX model to load
+        providers: Execution providers of the session being replaced
+        num_threads: onnxruntime intra-op thread count
+
+    Returns:
+        onnxruntime.InferenceSession for the voice
+    """
+    import onnxruntime
+
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = num_threads
+    return onnxruntime.InferenceSession(
+        str(model_file), sess_options=options, providers=providers
+    )
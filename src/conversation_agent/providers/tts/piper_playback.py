@@ -0,0 +1,157 @@
+"""Audio output for the Piper TTS provider."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+from collections.abc import Iterable
+from typing import Optional  # noqa: UP045
+
+import numpy as np
+import pyaudio
+
+from conversation_agent.providers.tts.base import TTSError
+
+logger = logging.getLogger(__name__)
+
+
+class PiperPlaybackMixin:
+    """Plays 16-bit mono PCM on a PortAudio stream kept open between utterances.
+
+    Audio is written in short chunks so stop() can interrupt it, and volume
+    is applied at playback time.
+    """
+
+    # Frames written per playback call; stop() takes effect between writes
+    PLAYBACK_CHUNK_FRAMES = 1024
+
+    sample_rate: int
+    _volume: float
+    _stop_requested: threading.Event
+    _is_speaking: bool
+
+    def _init_playback(self) -> None:
+        """Set up playback state; the device itself is opened on first use."""
+        # Reused int32 buffer for volume scaling; grows to the largest chunk seen
+        self._volume_scratch = np.empty(0, dtype=np.int32)
+        # PortAudio output kept open between utterances (opened on first playback)
+        self._pyaudio: Optional[pyaudio.PyAudio] = None  # noqa: UP045
+        self._stream: Optional[pyaudio.Stream] = None  # noqa: UP045
+        self._stream_rate: Optional[int] = None  # noqa: UP045
+
+    def _close_audio(self) -> None:
+        """Close the output stream and release PortAudio."""
+        self._close_stream()
+        if self._pyaudio is not None:
+            self._pyaudio.terminate()
+            self._pyaudio = None
+
+    def _play_audio(self, audio_data: bytes) -> None:
+        """Play PCM audio with volume control.
+
+        Args:
+            audio_data: Raw PCM audio bytes (16-bit mono)
+        """
+        if audio_data:
+            self._play_chunks([audio_data])
+
+    def _play_chunks(self, chunks: Iterable[bytes]) -> None:
+        """Play a sequence of PCM audio chunks on the output stream.
+
+        Chunks may come from a generator that is still synthesizing, so
+        playback starts with the first chunk.
+
+        Args:
+            chunks: Raw PCM audio bytes (16-bit mono), in playback order
+
+        Raises:
+            TTSError: If synthesis or playback fails
+        """
+        try:
+            stream = self._output_stream()
+
+            # Play audio in short writes so stop() can interrupt it
+            self._is_speaking = True
+            chunk_bytes = self.PLAYBACK_CHUNK_FRAMES * 2
+            for audio_data in chunks:
+                if not audio_data:
+                    continue
+                logger.debug("🔊 Playing %d bytes of audio", len(audio_data))
+
+                # Apply volume scaling
+                if self._volume != 1.0:
+                    audio_data = self._scale_volume(audio_data)
+
+                # Slice through a memoryview so each write doesn't copy
+                view = memoryview(audio_data)
+                for offset in range(0, len(view), chunk_bytes):
+                    if self._stop_requested.is_set():
+                        break
+                    stream.write(view[offset:offset + chunk_bytes])
+
+                if self._stop_requested.is_set():
+                    logger.debug("⏹️ Playback stopped")
+                    break
+
+        except TTSError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Audio playback failed: {e}", exc_info=True)
+            # Reopen the device on the next call rather than reuse a broken stream
+            with contextlib.suppress(Exception):
+                self._close_stream()
+            raise TTSError(f"Audio playback failed: {e}") from e
+        finally:
+            self._is_speaking = False
+
+    def _output_stream(self) -> pyaudio.Stream:
+        """Get the output stream, opening it on first use.
+
+        PortAudio setup enumerates devices, so the stream is kept open
+        between utterances. It is reopened if the sample rate has changed.
+
+        Returns:
+            PyAudio output stream for 16-bit mono audio
+        """
+        if self._stream is not None and self._stream_rate != self.sample_rate:
+            self._close_stream()
+
+        if self._stream is None:
+            if self._pyaudio is None:
+                self._pyaudio = pyaudio.PyAudio()
+            self._stream = self._pyaudio.open(
+                format=pyaudio.paInt16,
+                channels=1,  # Mono
+                rate=self.sample_rate,
+                output=True,
+            )
+            self._stream_rate = self.sample_rate
+        return self._stream
+
+    def _close_stream(self) -> None:
+        """Close the output stream, if open."""
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.stop_stream()
+            stream.close()
+
+    def _scale_volume(self, audio_data: bytes) -> bytes:
+        """Scale PCM audio by the current volume.
+
+        Uses Q15 fixed-point integer math in a reused int32 buffer, so
+        steady-state playback doesn't allocate an intermediate array per chunk.
+
+        Args:
+            audio_data: Raw PCM audio bytes (16-bit mono)
+
+        Returns:
+            Scaled PCM audio bytes (16-bit mono)
+        """
+        src = np.frombuffer(audio_data, dtype=np.int16)
+        if src.size > self._volume_scratch.size:
+            self._volume_scratch = np.empty(src.size * 2, dtype=np.int32)
+        samples = self._volume_scratch[: src.size]
+        np.multiply(src, round(self._volume * 32768), out=samples, dtype=np.int32)
+        samples >>= 15
+        return samples.astype(np.int16).tobytes()
@@ -6,25 +6,34 @@ Piper is fast, CPU-only, and produces natural-sounding speech (~9/10 quality).
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import threading
 import wave
 from pathlib import Path
 from typing import Optional  # noqa: UP045
 
-import numpy as np
-import pyaudio
 from piper import PiperVoice
 
 from conversation_agent.providers.tts.base import TTSError, TTSProvider
+from conversation_agent.providers.tts.lru_cache import LRUCache
+from conversation_agent.providers.tts.piper_model import (
+    create_session,
+    cuda_available,
+    select_model_file,
+)
+from conversation_agent.providers.tts.piper_playback import PiperPlaybackMixin
+from conversation_agent.providers.tts.piper_synthesis import PiperSynthesisMixin
 
 logger = logging.getLogger(__name__)
 
 
-class PiperTTSProvider(TTSProvider):
+class PiperTTSProvider(PiperSynthesisMixin, PiperPlaybackMixin, TTSProvider):
     """Piper neural TTS provider.
 
     High-quality neural text-to-speech using ONNX models.
-    Models are CPU-based and run efficiently without GPU.
+    Models run efficiently on CPU, and can optionally run on a CUDA GPU.
 
     Note: Unlike pyttsx3, voice selection requires model reload (expensive).
     Rate control is not supported - models have fixed prosody.
@@ -44,11 +53,21 @@ class PiperTTSProvider(TTSProvider):
         voice: Loaded Piper voice model (lazy-loaded).
     """
 
+    # Loaded voices kept for reuse by set_voice()/initialize() across all
+    # providers, keyed by (model file, config file, CUDA, thread limit)
+    MODEL_POOL_SIZE = 3
+    _model_pool: LRUCache[tuple[str, str, bool, Optional[int]], PiperVoice] = (  # noqa: UP045
+        LRUCache(MODEL_POOL_SIZE)
+    )
+
     def __init__(
         self,
         model_path: str,
         config_path: Optional[str] = None,  # noqa: UP045
         sample_rate: int = 22050,
+        use_quantized: Optional[bool] = None,  # noqa: UP045
+        num_threads: Optional[int] = None,  # noqa: UP045
+        use_cuda: bool = False,
     ) -> None:
         """Initialize Piper TTS provider.
 
@@ -57,6 +76,14 @@ class PiperTTSProvider(TTSProvider):
             config_path: Path to config file (.onnx.json).
                         If None, uses model_path + '.json'
             sample_rate: Audio sample rate (default: 22050 Hz)
+            use_quantized: Load the INT8 variant (<model>_int8.onnx, see
+                        quantize_model()) when it exists. If None, it is used
+                        only on CPUs with INT8 dot-product instructions.
+            num_threads: onnxruntime intra-op threads for synthesis. If None,
+                        onnxruntime uses one per physical core; set lower to
+                        leave cores free for STT and audio threads.
+            use_cuda: Run synthesis on a CUDA GPU. Requires onnxruntime-gpu;
+                        falls back to CPU with a warning when CUDA isn't available.
 
         Raises:
             TTSError: If model files not found
@@ -69,7 +96,7 @@ class PiperTTSProvider(TTSProvider):
 
         # Auto-detect config path
         if config_path is None:
-            self.config_path = Path(str(model_path) + ".json")
+            self.config_path = self.model_path.with_name(self.model_path.name + ".json")
         else:
             self.config_path = Path(config_path)
 
@@ -77,9 +104,23 @@ class PiperTTSProvider(TTSProvider):
             raise TTSError(f"Config not found: {self.config_path}")
 
         self.sample_rate = sample_rate
+        self.use_quantized = use_quantized
+        self.num_threads = num_threads
+        self.use_cuda = use_cuda
         self.voice: Optional[PiperVoice] = None  # noqa: UP045
         self._volume = 1.0
         self._is_speaking = False
+        self._stop_requested = threading.Event()
+        # Pool entries this provider loaded or reused; dropped on shutdown()
+        self._pool_keys: set[tuple[str, str, bool, Optional[int]]] = set()  # noqa: UP045
+        self._init_synthesis()
+        self._init_playback()
+        # Serializes speak_async() callers (created on first use, inside the loop)
+        self._speak_lock: Optional[asyncio.Semaphore] = None  # noqa: UP045
+        # get_available_voices() result, keyed by models directory and its mtime
+        self._voice_cache: Optional[  # noqa: UP045
+            tuple[tuple[str, int], list[dict[str, str]]]
+        ] = None
 
         logger.info("✅ PiperTTSProvider initialized")
         logger.info(f"   Model: {self.model_path}")
@@ -96,17 +137,38 @@ class PiperTTSProvider(TTSProvider):
             logger.info("⚠️ Voice model already loaded, skipping initialization")
             return
 
-        logger.info("📥 Loading Piper voice model...")
+        use_cuda = self.use_cuda and cuda_available()
+        if self.use_cuda and not use_cuda:
+            logger.warning("⚠️ CUDA not available to onnxruntime, running Piper on CPU")
+
+        model_file = select_model_file(self.model_path, self.use_quantized, use_cuda)
+        key = (str(model_file), str(self.config_path), use_cuda, self.num_threads)
+        self._pool_keys.add(key)
+        voice = self._model_pool.get(key)
+        if voice is not None:
+            logger.info("♻️ Reusing loaded Piper voice model %s", model_file)
+            self.voice = voice
+            return
+
+        logger.info("📥 Loading Piper voice model %s...", model_file)
         try:
-            self.voice = PiperVoice.load(
-                str(self.model_path),
+            voice = PiperVoice.load(
+                str(model_file),
                 config_path=str(self.config_path),
+                use_cuda=use_cuda,
             )
+            if self.num_threads:
+                voice.session = create_session(
+                    model_file, voice.session.get_providers(), self.num_threads
+                )
             logger.info("✅ Piper voice model loaded successfully")
         except Exception as e:
             logger.error(f"❌ Failed to load Piper model: {e}")
             raise TTSError(f"Failed to load Piper model: {e}") from e
 
+        self.voice = voice
+        self._model_pool.put(key, voice)
+
     def speak(self, text: str) -> None:
         """Synthesize and play text.
 
@@ -116,42 +178,88 @@ class PiperTTSProvider(TTSProvider):
         Raises:
             TTSError: If synthesis or playback fails
         """
-        logger.info(f"🎙️ PiperTTSProvider.speak() called with text: '{text}'")
-        logger.info(f"   Text length: {len(text)} characters")
-
-        if not text or not text.strip():
-            logger.warning("⚠️ Empty text provided, skipping speech")
+        # Callers emit empty text as a no-op, so return before doing any work
+        if not text or text.isspace():
             return
 
+        self._stop_requested.clear()
+        logger.debug("🎙️ PiperTTSProvider.speak() called with %d characters: %r", len(text), text)
+
         # Lazy load model on first speak
         if self.voice is None:
             logger.info("⏳ Model not loaded, initializing...")
             self.initialize()
 
         try:
-            logger.info("🎵 Synthesizing audio...")
-            # Synthesize returns a generator of AudioChunk objects
-            audio_bytes = b""
-            for audio_chunk in self.voice.synthesize(text):
-                # AudioChunk has 'audio_int16_bytes' property containing the raw PCM bytes
-                audio_bytes += audio_chunk.audio_int16_bytes
-
-            logger.info(f"✅ Synthesized {len(audio_bytes)} bytes of audio")
-
-            # Play the audio
-            logger.info("🔊 Playing audio...")
-            self._play_audio(audio_bytes)
-            logger.info("✅ Audio playback complete")
+            cached = self._cache_get(text)
+            prefetched = self._prefetched
+            if cached is not None:
+                logger.debug("🎵 Using cached audio...")
+                self._play_audio(cached)
+            elif prefetched is not None and prefetched[0] == text:
+                logger.debug("🎵 Using prefetched audio...")
+                self._prefetched = None
+                audio_bytes = prefetched[1].result()
+                self._cache_put(text, audio_bytes)
+                self._play_audio(audio_bytes)
+            else:
+                # Play each sentence as soon as it is synthesized
+                logger.debug("🎵 Synthesizing and playing audio...")
+                played = bytearray()
+                with contextlib.closing(self._stream_synthesis(text)) as audio:
+                    self._play_chunks(self._collect(audio, played))
+                # Only complete audio is cached; stop() cuts synthesis short
+                if not self._stop_requested.is_set():
+                    self._cache_put(text, bytes(played))
 
         except Exception as e:
             logger.error(f"❌ Failed to speak text: {e}", exc_info=True)
             raise TTSError(f"Failed to speak text: {e}") from e
 
+    async def speak_async(self, text: str) -> None:
+        """Speak text without blocking the event loop.
+
+        speak() runs in the loop's default executor. Concurrent callers are
+        queued so only one utterance is synthesized and played at a time;
+        parallel runs would split the CPU between two ONNX sessions and
+        interleave their audio. Cancelling the call stops playback.
+
+        Args:
+            text: Text to speak
+
+        Raises:
+            TTSError: If synthesis or playback fails
+        """
+        if self._speak_lock is None:
+            self._speak_lock = asyncio.Semaphore(1)
+
+        async with self._speak_lock:
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(None, self.speak, text)
+            except asyncio.CancelledError:
+                self.stop()
+                raise
+
+    def play_bytes(self, audio_data: bytes) -> None:
+        """Play audio returned by synth_to_bytes().
+
+        Args:
+            audio_data: Raw PCM audio bytes (16-bit mono)
+
+        Raises:
+            TTSError: If playback fails
+        """
+        self._stop_requested.clear()
+        if audio_data:
+            self._play_audio(audio_data)
+
     def set_voice(self, voice_id: str) -> None:
         """Set voice by loading a different model.
 
-        Warning: This is an expensive operation as it requires reloading
-        the ONNX model from disk (~100ms).
+        Warning: This is an expensive operation as it requires loading
+        the ONNX model from disk (~100ms). The last MODEL_POOL_SIZE models
+        stay loaded, so switching back to one of them is cheap.
 
         Args:
             voice_id: Path to .onnx model file
@@ -166,7 +274,7 @@ class PiperTTSProvider(TTSProvider):
         if not new_model_path.exists():
             raise TTSError(f"Model not found: {voice_id}")
 
-        new_config_path = Path(str(voice_id) + ".json")
+        new_config_path = new_model_path.with_name(new_model_path.name + ".json")
         if not new_config_path.exists():
             raise TTSError(f"Config not found: {new_config_path}")
 
@@ -174,8 +282,10 @@ class PiperTTSProvider(TTSProvider):
         self.model_path = new_model_path
         self.config_path = new_config_path
         self.voice = None  # Clear existing model
+        self._prefetched = None  # Synthesized with the old voice
+        self._cache.clear()
 
-        logger.info("🔄 Reloading model with new voice...")
+        logger.info("🔄 Loading model for new voice...")
         self.initialize()
         logger.info(f"✅ Voice changed to: {voice_id}")
 
@@ -202,57 +312,58 @@ class PiperTTSProvider(TTSProvider):
         Raises:
             TTSError: If volume out of range
         """
-        logger.info(f"🔊 Setting volume to {volume}")
+        logger.debug("🔊 Setting volume to %s", volume)
 
         if not 0.0 <= volume <= 1.0:
             logger.error(f"❌ Volume {volume} out of range (0.0-1.0)")
             raise TTSError(f"Volume {volume} out of range (0.0-1.0)")
 
         self._volume = volume
-        logger.info(f"✅ Volume set to {volume}")
 
     def get_available_voices(self) -> list[dict[str, str]]:
         """Get list of available Piper models.
 
-        Scans models/tts/piper/ for .onnx files.
+        Scans models/tts/piper/ for .onnx files. The result is cached until
+        the directory's modification time changes, i.e. until a model file is
+        added, removed or renamed.
 
         Returns:
             List of voice dictionaries with 'id', 'name', 'language' keys
         """
-        logger.info("🔍 Scanning for available Piper models...")
-
-        voices = []
         models_dir = Path("models/tts/piper")
-
-        if not models_dir.exists():
+        try:
+            key = (str(models_dir.absolute()), models_dir.stat().st_mtime_ns)
+        except OSError:
             logger.warning(f"⚠️ Models directory not found: {models_dir}")
-            return voices
+            return []
+
+        if self._voice_cache is not None and self._voice_cache[0] == key:
+            return list(self._voice_cache[1])
 
-        for model_file in models_dir.glob("*.onnx"):
+        logger.info("🔍 Scanning for available Piper models...")
+        voices = []
+        for model_file in sorted(models_dir.glob("*.onnx")):
             # Extract voice name from filename (e.g., en_US-lessac-medium)
             voice_name = model_file.stem
 
-            # Parse language from filename (e.g., en_US)
-            parts = voice_name.split("-")
-            language = parts[0] if parts else "unknown"
-
             voices.append({
                 "id": str(model_file),
                 "name": voice_name,
-                "language": language,
+                # Parse language from filename (e.g., en_US)
+                "language": voice_name.partition("-")[0] or "unknown",
             })
 
+        self._voice_cache = (key, voices)
         logger.info(f"✅ Found {len(voices)} Piper models")
-        return voices
+        return list(voices)
 
     def stop(self) -> None:
         """Stop current speech immediately.
 
-        Note: Current implementation does not support interruption
-        during playback. This is a limitation of the simple pyaudio
-        playback approach.
+        Safe to call from another thread. Playback is written in short
+        chunks, so it stops within one chunk (~50ms) of this call.
         """
-        logger.warning("⚠️ Stop not fully supported for Piper (playback blocking)")
+        self._stop_requested.set()
         self._is_speaking = False
 
     def save_to_file(self, text: str, filename: str) -> None:
@@ -275,76 +386,35 @@ class PiperTTSProvider(TTSProvider):
             self.initialize()
 
         try:
-            # Synthesize audio
+            # Write each chunk as it is synthesized; closing the file fills in
+            # the RIFF/data sizes, so the audio is never held in memory
             logger.info("🎵 Synthesizing audio...")
-            audio_bytes = b""
-            for audio_chunk in self.voice.synthesize(text):
-                # AudioChunk has 'audio_int16_bytes' property containing the raw PCM bytes
-                audio_bytes += audio_chunk.audio_int16_bytes
-
-            logger.info(f"✅ Synthesized {len(audio_bytes)} bytes")
-
-            # Write to WAV file
-            logger.info(f"💾 Writing to {filename}...")
+            chunks = self.voice.synthesize(text)
             with wave.open(filename, "wb") as wav_file:
                 wav_file.setnchannels(1)  # Mono
                 wav_file.setsampwidth(2)  # 16-bit
                 wav_file.setframerate(self.sample_rate)
-                wav_file.writeframes(audio_bytes)
+                for audio_chunk in chunks:
+                    # AudioChunk has 'audio_int16_bytes' property containing the raw PCM bytes
+                    wav_file.writeframesraw(audio_chunk.audio_int16_bytes)
 
             logger.info(f"✅ Saved to {filename}")
 
         except Exception as e:
             logger.error(f"❌ Failed to save to file: {e}", exc_info=True)
+            # Don't leave a truncated WAV file behind
+            Path(filename).unlink(missing_ok=True)
             raise TTSError(f"Failed to save to file: {e}") from e
 
-    def _play_audio(self, audio_data: bytes) -> None:
-        """Play PCM audio with volume control.
-
-        Args:
-            audio_data: Raw PCM audio bytes (16-bit mono)
-        """
-        logger.info(f"🔊 Playing {len(audio_data)} bytes of audio")
-
-        try:
-            # Apply volume scaling
-            if self._volume != 1.0:
-                logger.info(f"🎚️ Applying volume scaling: {self._volume}")
-                audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                audio_array = (audio_array * self._volume).astype(np.int16)
-                audio_data = audio_array.tobytes()
-
-            # Initialize PyAudio
-            p = pyaudio.PyAudio()
-
-            # Open stream
-            stream = p.open(
-                format=pyaudio.paInt16,
-                channels=1,  # Mono
-                rate=self.sample_rate,
-                output=True,
-            )
-
-            # Play audio
-            self._is_speaking = True
-            stream.write(audio_data)
-
-            # Cleanup
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
-            self._is_speaking = False
-
-            logger.info("✅ Audio playback complete")
-
-        except Exception as e:
-            self._is_speaking = False
-            logger.error(f"❌ Audio playback failed: {e}", exc_info=True)
-            raise TTSError(f"Audio playback failed: {e}") from e
-
     def shutdown(self) -> None:
         """Clean up resources."""
         logger.info("🧹 Shutting down PiperTTSProvider...")
+        self._shutdown_synthesis()
+        self._close_audio()
+        # Don't keep this provider's ONNX sessions loaded after it is gone
+        for key in self._pool_keys:
+            self._model_pool.pop(key)
+        self._pool_keys.clear()
         self.voice = None
         logger.info("✅ Shutdown complete")
 
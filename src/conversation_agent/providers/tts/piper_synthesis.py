@@ -0,0 +1,251 @@
+"""Background synthesis and audio caching for the Piper TTS provider."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional  # noqa: UP045
+
+from piper import PiperVoice
+
+from conversation_agent.providers.tts.base import TTSError
+from conversation_agent.providers.tts.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class PiperSynthesisMixin:
+    """Runs Piper synthesis on a single worker thread and caches the audio.
+
+    Synthesis calls never overlap on the voice model. Finished phrases are
+    kept in an LRU keyed by (model path, text), so repeated prompts replay
+    without running the model again.
+    """
+
+    # Synthesized phrases kept for replay without running the model again
+    CACHE_SIZE = 128
+
+    # Sentences synthesis may run ahead of playback when streaming
+    STREAM_QUEUE_CHUNKS = 2
+
+    model_path: Path
+    voice: Optional[PiperVoice]  # noqa: UP045
+
+    def _init_synthesis(self) -> None:
+        """Set up synthesis state; the worker thread starts on first use."""
+        # Single worker so synthesis calls never overlap on the voice model
+        self._executor: Optional[ThreadPoolExecutor] = None  # noqa: UP045
+        self._prefetched: Optional[tuple[str, Future[bytes]]] = None  # noqa: UP045
+        # LRU of synthesized audio keyed by (model path, text); volume is
+        # applied at playback, so cached audio stays valid across set_volume()
+        self._cache: LRUCache[tuple[str, str], bytes] = LRUCache(self.CACHE_SIZE)
+
+    def _shutdown_synthesis(self) -> None:
+        """Drop cached audio and stop the synthesis worker."""
+        self._prefetched = None
+        self._cache.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def warm_up(self) -> None:
+        """Run a short synthesis in the background to warm up onnxruntime.
+
+        The first inference on a new session is much slower than later ones
+        while onnxruntime picks kernels and packs weights. Running it on the
+        synthesis worker right after loading keeps that delay off the first
+        speak(), which simply queues behind it if called early.
+
+        Raises:
+            TTSError: If model loading fails
+        """
+        if self.voice is None:
+            self.initialize()
+        self._get_executor().submit(self._warm_up_session)
+
+    def _warm_up_session(self) -> None:
+        """Synthesize and discard one short phrase (runs on the synthesis worker)."""
+        try:
+            self._synthesize("Hello.")
+            logger.debug("🔥 Piper voice model warmed up")
+        except Exception as e:
+            logger.warning(f"⚠️ Piper warm-up failed: {e}")
+
+    def prefetch(self, text: str) -> None:
+        """Synthesize text in the background for a later speak() call.
+
+        Only the most recent prefetch is kept; speak() uses it when called
+        with the same text.
+
+        Args:
+            text: Text that will be spoken next
+        """
+        if not text or not text.strip():
+            return
+
+        if self._cache_get(text) is not None:
+            return
+
+        if self.voice is None:
+            self.initialize()
+
+        self._prefetched = (text, self._submit_synthesis(text))
+
+    def synth_to_bytes(self, text: str) -> bytes:
+        """Synthesize text without playing it.
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            Raw PCM audio bytes (16-bit mono)
+
+        Raises:
+            TTSError: If synthesis fails
+        """
+        if not text or not text.strip():
+            return b""
+
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
+        if self.voice is None:
+            self.initialize()
+
+        try:
+            audio_bytes = self._submit_synthesis(text).result()
+        except Exception as e:
+            raise TTSError(f"Failed to synthesize text: {e}") from e
+        self._cache_put(text, audio_bytes)
+        return audio_bytes
+
+    def _cache_get(self, text: str) -> Optional[bytes]:  # noqa: UP045
+        """Look up synthesized audio for text with the current voice.
+
+        Args:
+            text: Text that was synthesized
+
+        Returns:
+            Raw PCM audio bytes, or None if not cached
+        """
+        return self._cache.get((str(self.model_path), text))
+
+    def _cache_put(self, text: str, audio_bytes: bytes) -> None:
+        """Store synthesized audio, evicting the least recently used entry.
+
+        Args:
+            text: Text that was synthesized
+            audio_bytes: Raw PCM audio bytes (16-bit mono)
+        """
+        self._cache.put((str(self.model_path), text), audio_bytes)
+
+    @staticmethod
+    def _collect(chunks: Iterable[bytes], audio: bytearray) -> Iterator[bytes]:
+        """Pass audio chunks through, keeping a copy of everything yielded.
+
+        Args:
+            chunks: Raw PCM audio chunks
+            audio: Buffer the chunks are appended to
+
+        Yields:
+            The same chunks, unchanged
+        """
+        for chunk in chunks:
+            audio.extend(chunk)
+            yield chunk
+
+    def _submit_synthesis(self, text: str) -> Future[bytes]:
+        """Queue text for synthesis on the worker thread.
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            Future resolving to raw PCM audio bytes (16-bit mono)
+        """
+        return self._get_executor().submit(self._synthesize, text)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the synthesis worker, creating it on first use.
+
+        Returns:
+            Single-thread executor that runs all synthesis
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="piper-tts"
+            )
+        return self._executor
+
+    def _stream_synthesis(self, text: str) -> Iterator[bytes]:
+        """Synthesize text on the worker thread, yielding audio as it is ready.
+
+        Piper synthesizes one sentence at a time, so the first sentence can
+        be played while the rest are still being synthesized. The queue
+        between them is bounded, so synthesis stays at most
+        STREAM_QUEUE_CHUNKS sentences ahead of playback, and it stops early
+        if the caller stops iterating (e.g. after stop()).
+
+        Args:
+            text: Text to synthesize
+
+        Yields:
+            Raw PCM audio bytes (16-bit mono), one chunk per sentence
+
+        Raises:
+            TTSError: If synthesis fails
+        """
+        chunks: queue.Queue[Optional[bytes]] = queue.Queue(  # noqa: UP045
+            maxsize=self.STREAM_QUEUE_CHUNKS
+        )
+        abandoned = threading.Event()
+
+        def put(item: Optional[bytes]) -> bool:  # noqa: UP045
+            # Wait for room, unless playback has given up on the stream
+            while not abandoned.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for audio_chunk in self.voice.synthesize(text):
+                    if not put(audio_chunk.audio_int16_bytes):
+                        break
+            finally:
+                put(None)
+
+        future = self._get_executor().submit(produce)
+        try:
+            while (chunk := chunks.get()) is not None:
+                yield chunk
+        finally:
+            abandoned.set()
+
+        try:
+            future.result()
+        except Exception as e:
+            raise TTSError(f"Synthesis failed: {e}") from e
+
+    def _synthesize(self, text: str) -> bytes:
+        """Synthesize text to raw PCM audio.
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            Raw PCM audio bytes (16-bit mono)
+        """
+        # Synthesize returns a generator of AudioChunk objects; collect the
+        # raw PCM bytes and join once instead of re-copying on every chunk
+        return b"".join(
+            audio_chunk.audio_int16_bytes for audio_chunk in self.voice.synthesize(text)
+        )
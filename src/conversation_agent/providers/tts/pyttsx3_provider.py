@@ -7,13 +7,60 @@ across Windows (SAPI5), macOS (NSSpeechSynthesizer), and Linux (eSpeak).
 from __future__ import annotations
 
 import logging
+import platform
+import queue
+import re
+import threading
+import time
+import weakref
+from typing import Optional  # noqa: UP045
 
 import pyttsx3
 
 from conversation_agent.providers.tts.base import TTSError, TTSProvider
+from conversation_agent.utils.logging_config import LazyFormat
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on one utterance with the macOS workaround, in case the
+# engine never reports that it finished
+_UTTERANCE_TIMEOUT = 120.0
+
+# Whitespace after sentence-ending punctuation; speech is split at the first
+# one so the engine can start speaking before the rest is synthesized
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Words ending in a period that don't end a sentence ("Dr. Smith", "e.g. this")
+_ABBREVIATIONS = frozenset({
+    "dr.", "mr.", "mrs.", "ms.", "prof.", "st.", "jr.", "sr.", "vs.", "etc.",
+    "e.g.", "i.e.", "no.", "approx.",
+})
+
+# A split adds a short pause, so text is only split after a first sentence
+# of at least this many words. Shorter openings ("Hi.") gain little, and an
+# unlisted abbreviation then at worst pauses after a short fragment.
+_MIN_FIRST_SENTENCE_WORDS = 3
+
+
+def _split_first_sentence(text: str) -> list[str]:
+    """Split text after its first sentence.
+
+    Args:
+        text: Text to speak.
+
+    Returns:
+        [first sentence, rest], or [text] if there is no usable split point.
+    """
+    for match in _SENTENCE_END.finditer(text):
+        head = text[: match.start()]
+        words = head.split()
+        if words[-1].lower() in _ABBREVIATIONS:
+            continue
+        if len(words) < _MIN_FIRST_SENTENCE_WORDS:
+            break
+        return [head, text[match.end():]]
+    return [text]
+
 
 class Pyttsx3Provider(TTSProvider):
     """TTS provider using pyttsx3 for offline speech synthesis.
@@ -33,13 +80,18 @@ class Pyttsx3Provider(TTSProvider):
         engine: The pyttsx3 engine instance.
     """
 
-    def __init__(self, enable_macos_workaround: bool = True) -> None:
+    def __init__(self, enable_macos_workaround: bool = True, background: bool = False) -> None:
         """Initialize the pyttsx3 TTS provider.
 
         Args:
             enable_macos_workaround: Enable startLoop/iterate/endLoop pattern
                 on macOS instead of runAndWait(). This works around a known issue
                 where NSSpeechSynthesizer fails on subsequent calls. Default: True.
+            background: Speak on a worker thread. speak() then queues the text
+                and returns at once; call wait_until_done() before anything
+                that must not overlap the speech. The engine is driven from
+                the worker thread, which the macOS and Windows drivers may
+                not support. Default: False.
 
         Raises:
             TTSError: If pyttsx3 engine initialization fails.
@@ -48,26 +100,56 @@ class Pyttsx3Provider(TTSProvider):
 
         # Store workaround preference
         self._enable_macos_workaround = enable_macos_workaround
+        # Set by the engine when an utterance finishes (macOS workaround)
+        self._utterance_done = threading.Event()
+        self._pending_utterances = 0
+        # Installed system voices rarely change while running, so they are
+        # listed once here and again only on refresh_voices()
+        self._voices: Optional[list[dict[str, str]]] = None  # noqa: UP045
+        self._voice_ids: set[str] = set()
+        # Last rate/volume/voice written to the engine; unchanged values are
+        # not sent again, since each write is a native driver call
+        self._properties: dict[str, object] = {}
+        # Texts waiting for the background worker (None stops it)
+        self._speech_queue: Optional[queue.Queue[Optional[str]]] = None  # noqa: UP045
+        self._speech_error: Optional[TTSError] = None  # noqa: UP045
 
         try:
             self.engine = pyttsx3.init()
+            self.engine.connect(
+                "finished-utterance", lambda name, completed: self._utterance_finished()
+            )
             logger.info("✅ pyttsx3 engine initialized successfully")
 
+            try:
+                self.refresh_voices()
+            except TTSError as e:
+                logger.warning("⚠️ Could not list voices: %s", e)
+
             # Log current engine properties
             try:
                 rate = self.engine.getProperty("rate")
                 volume = self.engine.getProperty("volume")
                 voice = self.engine.getProperty("voice")
-                logger.info(f"   Default rate: {rate} WPM")
-                logger.info(f"   Default volume: {volume}")
-                logger.info(f"   Default voice: {voice}")
+                logger.info("   Default rate: %s WPM", rate)
+                logger.info("   Default volume: %s", volume)
+                logger.info("   Default voice: %s", voice)
             except Exception as e:
-                logger.warning(f"⚠️ Could not retrieve engine properties: {e}")
+                logger.warning("⚠️ Could not retrieve engine properties: %s", e)
 
         except Exception as e:
-            logger.error(f"❌ Failed to initialize pyttsx3 engine: {e}")
+            logger.error("❌ Failed to initialize pyttsx3 engine: %s", e)
             raise TTSError(f"Failed to initialize pyttsx3 engine: {e}") from e
 
+        if background:
+            self._speech_queue = queue.Queue()
+            threading.Thread(
+                target=self._run_speech_queue,
+                args=(weakref.ref(self), self._speech_queue),
+                name="pyttsx3-speech",
+                daemon=True,
+            ).start()
+
     def speak(self, text: str) -> None:
         """Speak the given text aloud.
 
@@ -78,100 +160,146 @@ class Pyttsx3Provider(TTSProvider):
         Args:
             text: The text to speak.
 
+        In background mode the text is queued and this returns immediately.
+
         Raises:
-            TTSError: If speech synthesis fails.
+            TTSError: If speech synthesis fails. In background mode, a failure
+                is raised by the next speak() or wait_until_done() call.
         """
-        logger.info(f"🎙️ Pyttsx3Provider.speak() called with text: '{text}'")
-        logger.info(f"   Text length: {len(text)} characters")
+        logger.debug("🎙️ Pyttsx3Provider.speak() called with %d characters: %r", len(text), text)
 
         if not text or not text.strip():
             logger.warning("⚠️ Empty text provided, skipping speech")
             return  # Don't speak empty text
 
-        try:
-            import platform
-            import time
+        if self._speech_queue is not None:
+            self._raise_speech_error()
+            self._speech_queue.put(text)
+            return
 
-            logger.info("📝 Calling engine.say()...")
-            self.engine.say(text)
+        self._say(text)
 
-            # macOS workaround: Use startLoop/iterate/endLoop instead of runAndWait
-            if self._enable_macos_workaround and platform.system() == 'Darwin':
-                logger.info("🍎 macOS detected - using startLoop/iterate/endLoop pattern")
+    def wait_until_done(self) -> None:
+        """Block until all queued speech has been spoken (background mode).
 
-                # Start the event loop without blocking
-                self.engine.startLoop(False)
+        Raises:
+            TTSError: If a queued utterance failed.
+        """
+        if self._speech_queue is not None:
+            self._speech_queue.join()
+            self._raise_speech_error()
 
-                # Estimate speech duration based on text length and rate
-                # Average word length: 5 characters + 1 space = 6 chars
-                # Rate is in words per minute
-                rate = self.engine.getProperty("rate") or 150
-                estimated_words = len(text) / 6.0
-                estimated_seconds = (estimated_words / rate) * 60.0
+    @staticmethod
+    def _run_speech_queue(
+        provider_ref: weakref.ref[Pyttsx3Provider],
+        speech_queue: queue.Queue[Optional[str]],  # noqa: UP045
+    ) -> None:
+        """Speak queued texts until a None sentinel arrives (worker thread).
 
-                # Dynamic buffer: 20% overhead + minimum 1s for engine startup
-                # Longer texts need proportionally more time for natural pauses
-                buffer = max(1.0, estimated_seconds * 0.2)
-                timeout = estimated_seconds + buffer
+        Only holds a weak reference while idle, so the provider can still be
+        garbage collected and send the sentinel from __del__.
 
-                logger.debug(
-                    f"Estimated speech duration: {estimated_seconds:.2f}s "
-                    f"(buffer: {buffer:.2f}s, timeout: {timeout:.2f}s)"
-                )
+        Args:
+            provider_ref: Weak reference to the provider
+            speech_queue: Queue that speak() puts texts on
+        """
+        while True:
+            text = speech_queue.get()
+            try:
+                provider = provider_ref()
+                if text is None or provider is None:
+                    return
+                try:
+                    provider._say(text)
+                except TTSError as e:
+                    provider._speech_error = e
+                del provider
+            finally:
+                speech_queue.task_done()
+
+    def _raise_speech_error(self) -> None:
+        """Raise, once, the last error from the background worker.
 
-                # Iterate for the estimated duration
-                start_time = time.time()
-                iteration_count = 0
+        Raises:
+            TTSError: If a queued utterance failed.
+        """
+        error, self._speech_error = self._speech_error, None
+        if error is not None:
+            raise error
 
-                while time.time() - start_time < timeout:
-                    self.engine.iterate()
-                    iteration_count += 1
+    def _say(self, text: str) -> None:
+        """Speak text on the current thread, blocking until it finishes.
 
-                    # Minimal delay every 10 iterations to prevent CPU spinning
-                    if iteration_count % 10 == 0:
-                        time.sleep(0.001)  # 1ms
+        Args:
+            text: The text to speak.
 
-                elapsed = time.time() - start_time
-                logger.info(
-                    f"✅ Speech completed after {iteration_count} iterations "
-                    f"({elapsed:.2f}s)"
-                )
+        Raises:
+            TTSError: If speech synthesis fails.
+        """
+        # Queue the first sentence as its own utterance; drivers that render a
+        # whole utterance before playing it then start speaking sooner
+        parts = _split_first_sentence(text.strip())
+        try:
+            logger.debug("📝 Calling engine.say() for %d part(s)...", len(parts))
+            self._utterance_done.clear()
+            self._pending_utterances = len(parts)
+            for part in parts:
+                self.engine.say(part)
+
+            # macOS workaround: Use startLoop/iterate/endLoop instead of runAndWait
+            if self._enable_macos_workaround and platform.system() == "Darwin":
+                logger.debug("🍎 macOS detected - using startLoop/iterate/endLoop pattern")
+
+                # Start the event loop without blocking
+                self.engine.startLoop(False)
+
+                # Pump the loop until the engine reports the last utterance finished
+                deadline = time.monotonic() + _UTTERANCE_TIMEOUT
+                while not self._utterance_done.is_set() and time.monotonic() < deadline:
+                    self.engine.iterate()
+                    self._utterance_done.wait(0.02)
+
+                if not self._utterance_done.is_set():
+                    logger.warning("⚠️ Speech did not finish within %.0fs", _UTTERANCE_TIMEOUT)
 
                 # End the loop
                 self.engine.endLoop()
-                logger.info("✅ Event loop ended")
 
             else:
                 # Standard runAndWait for non-macOS or when workaround is disabled
-                logger.info("⏳ Calling engine.runAndWait() - blocking until speech completes...")
+                logger.debug("⏳ Calling engine.runAndWait() - blocking until speech completes...")
                 self.engine.runAndWait()
-                logger.info("✅ engine.runAndWait() completed - speech finished")
+                logger.debug("✅ engine.runAndWait() completed - speech finished")
 
         except Exception as e:
-            logger.error(f"❌ Failed to speak text: {e}", exc_info=True)
+            logger.error("❌ Failed to speak text: %s", e, exc_info=True)
             raise TTSError(f"Failed to speak text: {e}") from e
 
+    def _utterance_finished(self) -> None:
+        """Count a finished utterance; set _utterance_done after the last one."""
+        self._pending_utterances -= 1
+        if self._pending_utterances <= 0:
+            self._utterance_done.set()
+
     def set_voice(self, voice_id: str) -> None:
         """Set the voice to use for speech synthesis.
 
+        Voice IDs are checked against the voices listed at startup; call
+        refresh_voices() first if voices were installed since then.
+
         Args:
             voice_id: The voice identifier from available voices.
 
         Raises:
             TTSError: If voice ID is invalid or not available.
         """
-        try:
-            voices = self.engine.getProperty("voices")
-            voice_ids = [voice.id for voice in voices]
-
-            if voice_id not in voice_ids:
-                raise TTSError(
-                    f"Voice '{voice_id}' not found. Available voices: {voice_ids}"
-                )
+        if voice_id not in self._voice_ids:
+            raise TTSError(
+                f"Voice '{voice_id}' not found. Available voices: {sorted(self._voice_ids)}"
+            )
 
-            self.engine.setProperty("voice", voice_id)
-        except TTSError:
-            raise
+        try:
+            self._set_property("voice", voice_id)
         except Exception as e:
             raise TTSError(f"Failed to set voice: {e}") from e
 
@@ -185,17 +313,16 @@ class Pyttsx3Provider(TTSProvider):
         Raises:
             TTSError: If rate setting fails.
         """
-        logger.info(f"🎚️ Setting TTS rate to {rate} WPM")
+        logger.debug("🎚️ Setting TTS rate to %d WPM", rate)
 
         if rate < 50 or rate > 400:
-            logger.error(f"❌ Rate {rate} out of range (50-400 WPM)")
+            logger.error("❌ Rate %s out of range (50-400 WPM)", rate)
             raise TTSError(f"Rate {rate} out of range. Use 50-400 WPM.")
 
         try:
-            self.engine.setProperty("rate", rate)
-            logger.info(f"✅ Rate set to {rate} WPM")
+            self._set_property("rate", rate)
         except Exception as e:
-            logger.error(f"❌ Failed to set rate: {e}")
+            logger.error("❌ Failed to set rate: %s", e)
             raise TTSError(f"Failed to set rate: {e}") from e
 
     def set_volume(self, volume: float) -> None:
@@ -207,24 +334,36 @@ class Pyttsx3Provider(TTSProvider):
         Raises:
             TTSError: If volume is out of range.
         """
-        logger.info(f"🔊 Setting TTS volume to {volume}")
+        logger.debug("🔊 Setting TTS volume to %s", volume)
 
         if volume < 0.0 or volume > 1.0:
-            logger.error(f"❌ Volume {volume} out of range (0.0-1.0)")
+            logger.error("❌ Volume %s out of range (0.0-1.0)", volume)
             raise TTSError(f"Volume {volume} out of range. Use 0.0-1.0.")
 
         try:
-            self.engine.setProperty("volume", volume)
-            logger.info(f"✅ Volume set to {volume}")
+            self._set_property("volume", volume)
         except Exception as e:
-            logger.error(f"❌ Failed to set volume: {e}")
+            logger.error("❌ Failed to set volume: %s", e)
             raise TTSError(f"Failed to set volume: {e}") from e
 
+    def _set_property(self, name: str, value: object) -> None:
+        """Set an engine property unless it already has this value.
+
+        Args:
+            name: pyttsx3 property name
+            value: New value
+        """
+        if name in self._properties and self._properties[name] == value:
+            return
+        self.engine.setProperty(name, value)
+        self._properties[name] = value
+
     def get_available_voices(self) -> list[dict[str, str]]:
         """Get list of available voices.
 
         Returns:
             List of voice dictionaries with 'id', 'name', 'language' keys.
+            The engine is only queried again after refresh_voices().
 
         Example:
             [
@@ -235,9 +374,22 @@ class Pyttsx3Provider(TTSProvider):
                 }
             ]
         """
+        if self._voices is None:
+            return self.refresh_voices()
+        return list(self._voices)
+
+    def refresh_voices(self) -> list[dict[str, str]]:
+        """Re-read the installed voices from the engine.
+
+        Returns:
+            List of voice dictionaries, as from get_available_voices().
+
+        Raises:
+            TTSError: If the engine can't list its voices.
+        """
         try:
             voices = self.engine.getProperty("voices")
-            return [
+            self._voices = [
                 {
                     "id": voice.id,
                     "name": voice.name,
@@ -249,13 +401,33 @@ class Pyttsx3Provider(TTSProvider):
             ]
         except Exception as e:
             raise TTSError(f"Failed to get available voices: {e}") from e
+        self._voice_ids = {voice["id"] for voice in self._voices}
+        logger.debug(
+            "🔊 %d voices: %s",
+            len(self._voices),
+            LazyFormat(lambda: ", ".join(sorted(self._voice_ids))),
+        )
+        return list(self._voices)
 
     def stop(self) -> None:
-        """Stop current speech immediately."""
+        """Stop current speech immediately, dropping any queued speech."""
+        if self._speech_queue is not None:
+            while True:
+                try:
+                    self._speech_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._speech_queue.task_done()
+
         try:
             self.engine.stop()
         except Exception as e:
             raise TTSError(f"Failed to stop speech: {e}") from e
+        finally:
+            # stop() drops queued utterances without finished-utterance
+            # events, so release the macOS loop in speak() directly
+            self._pending_utterances = 0
+            self._utterance_done.set()
 
     def save_to_file(self, text: str, filename: str) -> None:
         """Save speech to an audio file.
@@ -279,6 +451,8 @@ class Pyttsx3Provider(TTSProvider):
     def __del__(self) -> None:
         """Clean up the pyttsx3 engine on deletion."""
         try:
+            if getattr(self, "_speech_queue", None) is not None:
+                self._speech_queue.put(None)
             if hasattr(self, "engine"):
                 self.engine.stop()
         except Exception:
@@ -2,6 +2,6 @@
 
 from __future__ import annotations
 
-from conversation_agent.utils.logging_config import setup_logging
+from conversation_agent.utils.logging_config import LazyFormat, get_logger, setup_logging
 
-__all__ = ["setup_logging"]
+__all__ = ["LazyFormat", "get_logger", "setup_logging"]
@@ -6,10 +6,14 @@ and optional file logging for debugging.
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
 
 class ColoredFormatter(logging.Formatter):
@@ -25,11 +29,93 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    # Level names wrapped in their colors, built once
+    COLORED_LEVELS = {level: f"{color}{level}\033[0m" for level, color in COLORS.items()}
+
+    def __init__(
+        self,
+        fmt: Optional[str] = None,  # noqa: UP045
+        datefmt: Optional[str] = None,  # noqa: UP045
+        stream: Optional[TextIO] = None,  # noqa: UP045
+    ) -> None:
+        """Initialize the formatter.
+
+        Args:
+            fmt: Log format string
+            datefmt: Date format string
+            stream: Stream the handler writes to. Colors are only added if
+                it is a terminal; None always adds them.
+        """
+        super().__init__(fmt, datefmt)
+        isatty = getattr(stream, "isatty", None)
+        use_color = stream is None or (isatty is not None and isatty())
+
+        # One plain formatter per level with the colored name baked into the
+        # format string, so records are never modified. Records are shared
+        # by every handler, so changing levelname would leak the color
+        # codes into the log file.
+        self._level_formatters: dict[str, logging.Formatter] = {}
+        if use_color:
+            self._level_formatters = {
+                level: logging.Formatter(
+                    self._fmt.replace("%(levelname)s", colored), datefmt
+                )
+                for level, colored in self.COLORED_LEVELS.items()
+            }
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors."""
-        log_color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{log_color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        formatter = self._level_formatters.get(record.levelname)
+        if formatter is None:
+            return super().format(record)
+        return formatter.format(record)
+
+
+class LazyFormat:
+    """Defer building an expensive log argument until the record is emitted.
+
+    Pass an instance as a %-style argument; the callable only runs if a
+    handler formats the message, so filtered-out records cost nothing. It
+    runs at most once, however many handlers format the record.
+
+    Example:
+        logger.debug("Voices: %s", LazyFormat(lambda: ", ".join(voice_ids)))
+    """
+
+    __slots__ = ("_build", "_text")
+
+    def __init__(self, build: Callable[[], object]) -> None:
+        """Store the callable that builds the argument.
+
+        Args:
+            build: Zero-argument callable returning the value to log
+        """
+        self._build = build
+        self._text: Optional[str] = None  # noqa: UP045
+
+    def __str__(self) -> str:
+        """Build and format the argument, reusing the first result."""
+        if self._text is None:
+            self._text = str(self._build())
+        return self._text
+
+
+# Background thread writing the log file (see setup_logging())
+_listener: Optional[QueueListener] = None  # noqa: UP045
+
+
+def stop_file_logging() -> None:
+    """Flush queued records to the log file and stop its writer thread.
+
+    Registered with atexit, so the log file is complete when the program
+    exits. Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
 
 
 def setup_logging(
@@ -44,12 +130,15 @@ def setup_logging(
         log_file: Optional path to log file for persistent logging
         enable_colors: Whether to use colored output (disable for file output)
     """
+    global _listener
+
     # Create root logger
     logger = logging.getLogger("conversation_agent")
     logger.setLevel(level)
 
     # Remove existing handlers
     logger.handlers.clear()
+    stop_file_logging()
 
     # Console handler with colors
     console_handler = logging.StreamHandler(sys.stdout)
@@ -57,7 +146,7 @@ def setup_logging(
 
     if enable_colors:
         console_format = "%(levelname)s: %(message)s"
-        console_handler.setFormatter(ColoredFormatter(console_format))
+        console_handler.setFormatter(ColoredFormatter(console_format, stream=sys.stdout))
     else:
         console_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         console_handler.setFormatter(logging.Formatter(console_format))
@@ -71,7 +160,16 @@ def setup_logging(
         file_handler.setLevel(logging.DEBUG)  # Always log everything to file
         file_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         file_handler.setFormatter(logging.Formatter(file_format))
-        logger.addHandler(file_handler)
+
+        # Log calls only enqueue the record; a listener thread does the disk
+        # writes, so the interview loop never waits on file I/O
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+        logger.addHandler(QueueHandler(log_queue))
+
+
+atexit.register(stop_file_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
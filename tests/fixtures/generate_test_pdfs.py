@@ -5,15 +5,25 @@ from pathlib import Path
 from fpdf import FPDF
 
 
+def _make_pdf() -> FPDF:
+    """Create a PDF with its first page added and the question font set.
+
+    Returns:
+        FPDF document ready for question lines
+    """
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+    return pdf
+
+
 def create_sample_questionnaire(output_path: Path) -> None:
     """Create a sample questionnaire PDF with valid questions.
 
     Args:
         output_path: Path where the PDF should be saved
     """
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
+    pdf = _make_pdf()
 
     questions = [
         "What is your full name?",
@@ -51,9 +61,7 @@ def create_malformed_questionnaire(output_path: Path) -> None:
     Args:
         output_path: Path where the PDF should be saved
     """
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
+    pdf = _make_pdf()
 
     # Mix of valid questions, empty lines, and short text
     lines = [
@@ -80,11 +88,8 @@ def create_multipage_questionnaire(output_path: Path) -> None:
     Args:
         output_path: Path where the PDF should be saved
     """
-    pdf = FPDF()
-
     # Page 1
-    pdf.add_page()
-    pdf.set_font("Arial", size=12)
+    pdf = _make_pdf()
     pdf.cell(0, 10, "What is your educational background?", ln=True)
     pdf.cell(0, 10, "What certifications do you hold?", ln=True)
     pdf.cell(0, 10, "What is your greatest professional achievement?", ln=True)
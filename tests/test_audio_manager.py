@@ -84,6 +84,198 @@ class TestAudioManager:
         assert 0.0 <= amplitude <= 1.0
         assert amplitude > 0.0  # Non-silent audio
 
+    def test_calculate_amplitude_full_range(self):
+        """Test silence is 0.0 and full-scale audio is 1.0 at both bit depths."""
+        audio_mgr = AudioManager()
+        assert audio_mgr._calculate_amplitude(np.zeros(64, dtype=np.int16).tobytes()) == 0.0
+        assert audio_mgr._calculate_amplitude(
+            np.full(64, -32768, dtype=np.int16).tobytes()
+        ) == 1.0
+
+        audio_mgr_8bit = AudioManager(format_bits=8)
+        assert audio_mgr_8bit._calculate_amplitude(bytes([128] * 64)) == 0.0
+        assert audio_mgr_8bit._calculate_amplitude(bytes([0] * 64)) == 1.0
+
+    def test_record_until_silence_tracks_rms(self):
+        """Test RMS level is accumulated while recording."""
+        audio_mgr = AudioManager(chunk_size=4)
+        loud = np.array([1000, -1000, 1000, -1000], dtype=np.int16).tobytes()
+        silent = np.zeros(4, dtype=np.int16).tobytes()
+        stream = Mock()
+        stream.read.side_effect = [loud, silent, silent]
+        audio_mgr.pyaudio.open.return_value = stream
+
+        audio_data = audio_mgr.record_until_silence(
+            silence_duration=8 / audio_mgr.sample_rate
+        )
+
+        assert audio_data == loud + silent + silent
+        # Trailing silence window is excluded from the speech statistics
+        assert audio_mgr.get_last_speech_bytes() == len(loud)
+        assert audio_mgr.get_last_rms() == pytest.approx(1000.0)
+
+    def test_record_until_silence_on_chunk_stops_early(self):
+        """Test an on_chunk callback returning True ends the recording."""
+        audio_mgr = AudioManager(chunk_size=4)
+        loud = np.array([1000, -1000, 1000, -1000], dtype=np.int16).tobytes()
+        stream = Mock()
+        stream.read.return_value = loud
+        audio_mgr.pyaudio.open.return_value = stream
+        seen = []
+
+        audio_data = audio_mgr.record_until_silence(
+            on_chunk=lambda chunk: seen.append(chunk) or len(seen) == 2
+        )
+
+        assert audio_data == loud * 2
+        assert stream.read.call_count == 2
+
+    def test_record_until_silence_no_speech_timeout(self):
+        """Test recording gives up early when no speech is heard."""
+        audio_mgr = AudioManager(chunk_size=4)
+        stream = Mock()
+        stream.read.return_value = np.zeros(4, dtype=np.int16).tobytes()
+        audio_mgr.pyaudio.open.return_value = stream
+
+        audio_data = audio_mgr.record_until_silence(
+            silence_duration=40 / audio_mgr.sample_rate,
+            no_speech_timeout=8 / audio_mgr.sample_rate,
+        )
+
+        assert audio_data == b""
+        assert stream.read.call_count == 2
+        assert audio_mgr.get_last_speech_bytes() == 0
+
+    def test_trailing_silence_counted_after_speech(self):
+        """Test silence before speech doesn't end a recording with no_speech_timeout."""
+        audio_mgr = AudioManager(chunk_size=4)
+        quiet = np.zeros(4, dtype=np.int16).tobytes()
+        loud = np.full(4, 8000, dtype=np.int16).tobytes()
+        stream = Mock()
+        stream.read.side_effect = [quiet, quiet, quiet, loud, quiet, quiet]
+        audio_mgr.pyaudio.open.return_value = stream
+
+        audio_data = audio_mgr.record_until_silence(
+            silence_duration=8 / audio_mgr.sample_rate,
+            no_speech_timeout=40 / audio_mgr.sample_rate,
+        )
+
+        assert audio_data == quiet * 3 + loud + quiet * 2
+        assert audio_mgr.get_last_speech_bytes() == 32
+
+    def test_trim_to_speech(self):
+        """Test silence around the speech is cut, keeping the padding."""
+        audio_mgr = AudioManager(chunk_size=4)
+        quiet = np.zeros(4, dtype=np.int16).tobytes()
+        loud = np.full(4, 8000, dtype=np.int16).tobytes()
+        stream = Mock()
+        stream.read.side_effect = [quiet, quiet, quiet, loud, loud, quiet, quiet, quiet]
+        audio_mgr.pyaudio.open.return_value = stream
+
+        audio_data = audio_mgr.record_until_silence(
+            silence_duration=12 / audio_mgr.sample_rate,
+            no_speech_timeout=1.0,
+        )
+
+        assert audio_mgr.trim_to_speech(audio_data, padding=0.0) == loud * 2
+        assert (
+            audio_mgr.trim_to_speech(audio_data, padding=4 / audio_mgr.sample_rate)
+            == quiet + loud * 2 + quiet
+        )
+
+    def test_trim_to_speech_without_speech(self):
+        """Test audio is returned unchanged when no speech was detected."""
+        audio_mgr = AudioManager()
+
+        assert audio_mgr.trim_to_speech(b"\x00" * 8) == b"\x00" * 8
+
+    def test_prewarm_stream_reused_by_recording(self):
+        """Test a prewarmed stream is started and used by the next recording."""
+        audio_mgr = AudioManager(chunk_size=4)
+        stream = Mock()
+        stream.read.return_value = np.zeros(4, dtype=np.int16).tobytes()
+        audio_mgr.pyaudio.open.reset_mock()
+        audio_mgr.pyaudio.open.return_value = stream
+
+        audio_mgr.prewarm()
+        audio_mgr.record_until_silence(silence_duration=4 / audio_mgr.sample_rate)
+
+        audio_mgr.pyaudio.open.assert_called_once()
+        assert audio_mgr.pyaudio.open.call_args.kwargs["start"] is False
+        stream.start_stream.assert_called_once()
+
+    def test_wait_for_silence_returns_on_quiet_chunks(self):
+        """Test wait_for_silence stops after three quiet chunks."""
+        audio_mgr = AudioManager()
+        loud = np.full(320, 8000, dtype=np.int16).tobytes()
+        quiet = np.zeros(320, dtype=np.int16).tobytes()
+        stream = Mock()
+        stream.read.side_effect = [loud, quiet, quiet, quiet, loud]
+        audio_mgr.pyaudio.open.return_value = stream
+
+        assert audio_mgr.wait_for_silence(max_wait=0.5) is True
+        assert stream.read.call_count == 4
+        stream.stop_stream.assert_called_once()
+
+    def test_wait_for_silence_times_out(self):
+        """Test wait_for_silence gives up after max_wait."""
+        audio_mgr = AudioManager()
+        stream = Mock()
+        stream.read.return_value = np.full(320, 8000, dtype=np.int16).tobytes()
+        audio_mgr.pyaudio.open.return_value = stream
+
+        assert audio_mgr.wait_for_silence(max_wait=0.1) is False
+        assert stream.read.call_count == 5
+
+    def test_wait_for_speech_detects_loud_chunks(self):
+        """Test wait_for_speech returns after three loud chunks."""
+        audio_mgr = AudioManager()
+        loud = np.full(320, 8000, dtype=np.int16).tobytes()
+        quiet = np.zeros(320, dtype=np.int16).tobytes()
+        stream = Mock()
+        stream.read.side_effect = [quiet, loud, loud, loud, quiet]
+        audio_mgr.pyaudio.open.return_value = stream
+
+        assert audio_mgr.wait_for_speech(max_wait=1.0) is True
+        assert stream.read.call_count == 4
+
+    def test_speech_frames_become_recording_preroll(self):
+        """Test audio heard by wait_for_speech starts the next recording."""
+        audio_mgr = AudioManager()
+        loud = np.full(320, 8000, dtype=np.int16).tobytes()
+        chunk = np.full(1024, 8000, dtype=np.int16).tobytes()
+        stream = Mock()
+        stream.read.side_effect = [loud, loud, loud, chunk]
+        audio_mgr.pyaudio.open = Mock(return_value=stream)
+
+        assert audio_mgr.wait_for_speech(max_wait=1.0) is True
+        stream.stop_stream.assert_not_called()
+
+        audio_data = audio_mgr.record_until_silence(on_chunk=lambda data: data == chunk)
+
+        assert audio_data == loud * 3 + chunk
+        audio_mgr.pyaudio.open.assert_called_once()
+        stream.start_stream.assert_not_called()
+
+    def test_wait_for_speech_stop_event(self):
+        """Test wait_for_speech returns False once the stop event is set."""
+        import threading
+
+        audio_mgr = AudioManager()
+        stream = Mock()
+        audio_mgr.pyaudio.open.return_value = stream
+        done = threading.Event()
+        done.set()
+
+        assert audio_mgr.wait_for_speech(stop_event=done) is False
+        stream.read.assert_not_called()
+
+    def test_get_last_rms_before_recording(self):
+        """Test RMS is zero before any recording."""
+        audio_mgr = AudioManager()
+
+        assert audio_mgr.get_last_rms() == 0.0
+
     def test_save_to_wav_invalid_extension(self):
         """Test saving with invalid file extension."""
         audio_mgr = AudioManager()
@@ -547,3 +547,41 @@ class TestLogFile:
             mock_logging.assert_called_once()
             call_kwargs = mock_logging.call_args.kwargs
             assert call_kwargs["log_file"] == log_file
+
+
+class TestQuantizeTTSCommand:
+    """Test the 'quantize-tts' command."""
+
+    def test_quantize_tts_writes_int8_model(self, cli_runner: CliRunner, tmp_path: Path):
+        """Test the model is quantized next to the original."""
+        model = tmp_path / "voice.onnx"
+        model.write_bytes(b"fp32")
+
+        def quantize(source):
+            output = tmp_path / "voice_int8.onnx"
+            output.write_bytes(b"int8")
+            return output
+
+        with patch(
+            "conversation_agent.providers.tts.piper_model.quantize_model",
+            side_effect=quantize,
+        ) as mock_quantize:
+            result = cli_runner.invoke(cli, ["quantize-tts", "--model", str(model)])
+
+        assert result.exit_code == 0
+        mock_quantize.assert_called_once_with(model)
+        assert "voice_int8.onnx" in result.output
+
+    def test_quantize_tts_failure(self, cli_runner: CliRunner, tmp_path: Path):
+        """Test quantization errors exit with an error."""
+        model = tmp_path / "voice.onnx"
+        model.write_bytes(b"fp32")
+
+        with patch(
+            "conversation_agent.providers.tts.piper_model.quantize_model",
+            side_effect=Exception("onnx not installed"),
+        ):
+            result = cli_runner.invoke(cli, ["quantize-tts", "--model", str(model)])
+
+        assert result.exit_code == 1
+        assert "Quantization failed" in result.output
@@ -242,6 +242,22 @@ class TestIntentRecognizer:
             intent, _ = recognizer.recognize(text)
             assert intent != UserIntent.ANSWER, f"Should not be answer: {text}"
 
+    def test_recognize_answer_starting_with_question_word_prefix(self):
+        """Test words that merely begin with a question word are answers."""
+        recognizer = IntentRecognizer()
+
+        for text in ["Whatever works for me", "However you prefer it"]:
+            intent, _ = recognizer.recognize(text)
+            assert intent == UserIntent.ANSWER, f"Failed for: {text}"
+
+    def test_is_likely_answer_counts_words_not_spaces(self):
+        """Test the short-phrase check counts words, however they are separated."""
+        recognizer = IntentRecognizer()
+
+        assert not recognizer._is_likely_answer("red  car")
+        assert not recognizer._is_likely_answer(" blue car ")
+        assert recognizer._is_likely_answer("a red\tsports car")
+
     # Context-aware recognition
     def test_recognize_with_context_boost(self):
         """Test context boosts confidence for expected intents."""
@@ -258,6 +274,21 @@ class TestIntentRecognizer:
         assert intent_ctx == UserIntent.CONFIRM_YES
         assert confidence_ctx >= confidence  # Context boosts confidence
 
+    def test_exact_match_fast_path_matches_patterns(self):
+        """Test single-word fast path agrees with the full pattern pipeline."""
+        from conversation_agent.core.intent_recognizer import _EXACT_INTENTS
+
+        contexts = [None, UserIntent.START, UserIntent.CONFIRM_YES, UserIntent.QUIT]
+        for threshold in (0.7, 0.95):
+            recognizer = IntentRecognizer(confidence_threshold=threshold)
+            for word in _EXACT_INTENTS:
+                for text in (word, f"{word.capitalize()}."):
+                    for context in contexts:
+                        expected = recognizer._recognize_patterns(
+                            text.lower(), context
+                        )
+                        assert recognizer.recognize(text, context) == expected, text
+
     # Edge cases
     def test_recognize_ambiguous_text(self):
         """Test handling of ambiguous text."""
@@ -4,7 +4,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from conversation_agent.core.conversation_state import ConversationState
+from conversation_agent.core.conversation_state import ConversationState, UserIntent
 from conversation_agent.core.interview import InterviewOrchestrator
 from conversation_agent.models.interview import InterviewSession
 
@@ -17,6 +17,8 @@ class TestInterviewOrchestrator:
         """Create mock TTS provider."""
         tts = Mock()
         tts.speak = Mock()
+        # Provider without byte synthesis: every prompt goes through speak()
+        tts.synth_to_bytes.side_effect = NotImplementedError
         return tts
 
     @pytest.fixture
@@ -32,6 +34,9 @@ class TestInterviewOrchestrator:
         with patch("conversation_agent.core.interview.AudioManager") as mock:
             audio_manager = Mock()
             audio_manager.record_until_silence.return_value = b"fake_audio_data"
+            audio_manager.get_last_rms.return_value = 0.0
+            audio_manager.get_last_speech_bytes.return_value = 0
+            audio_manager.trim_to_speech.side_effect = lambda audio_data: audio_data
             audio_manager.get_sample_rate.return_value = 16000
             audio_manager.channels = 1  # Add channels attribute for logging
             mock.return_value = audio_manager
@@ -342,6 +347,22 @@ class TestInterviewOrchestrator:
         assert orchestrator.intent_recognizer is not None
         assert orchestrator.intent_recognizer.confidence_threshold == 0.7
 
+    def test_intent_recognizer_built_on_first_use(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test the intent recognizer is only constructed when first needed."""
+        with patch("conversation_agent.core.interview.IntentRecognizer") as recognizer_cls:
+            recognizer_cls.return_value.recognize.return_value = (UserIntent.SKIP, 0.9)
+            orchestrator = InterviewOrchestrator(
+                tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+            )
+            recognizer_cls.assert_not_called()
+
+            assert orchestrator._recognize("skip") == (UserIntent.SKIP, 0.9)
+            assert orchestrator._recognize("Skip") == (UserIntent.SKIP, 0.9)
+            recognizer_cls.assert_called_once_with()
+            recognizer_cls.return_value.recognize.assert_called_once()
+
     def test_questions_loaded_from_pdf(self, mock_tts, mock_stt, sample_pdf_path):
         """Test questions are loaded from PDF."""
         orchestrator = InterviewOrchestrator(
@@ -396,7 +417,7 @@ class TestInterviewOrchestrator:
 
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         orchestrator._save_turn(start_time)
 
         assert len(orchestrator.session.turns) == 1
@@ -419,7 +440,7 @@ class TestInterviewOrchestrator:
 
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         orchestrator._skip_question(start_time)
 
         assert len(orchestrator.session.turns) == 1
@@ -440,3 +461,300 @@ class TestInterviewOrchestrator:
         assert mock_tts.speak.called
         call_args = mock_tts.speak.call_args[0][0]
         assert call_args == orchestrator.closing
+
+    def test_listen_for_response_rejects_quiet_audio(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test low-RMS audio is treated as silence without transcribing."""
+        import numpy as np
+
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        quiet = np.full(16000, 10, dtype=np.int16).tobytes()  # 1s, amplitude 10
+        orchestrator.audio_manager.record_until_silence.return_value = quiet
+        orchestrator.audio_manager.get_last_rms.return_value = 10.0
+
+        assert orchestrator._listen_for_response() == ""
+        mock_stt.transcribe_audio_data.assert_not_called()
+
+    def test_listen_for_response_transcribes_speech(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test audio passing the quality checks is transcribed."""
+        import numpy as np
+
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        loud = np.tile(np.array([3000, -3000], dtype=np.int16), 16000).tobytes()
+        orchestrator.audio_manager.record_until_silence.return_value = loud
+        orchestrator.audio_manager.get_last_rms.return_value = 3000.0
+        mock_stt.transcribe_audio_data.return_value = {
+            "text": "I work as a software engineer",
+            "language": "en",
+        }
+
+        assert orchestrator._listen_for_response() == "I work as a software engineer"
+        mock_stt.transcribe_audio_data.assert_called_once()
+
+    def test_recognize_reuses_cached_result(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test repeated utterances are recognized only once."""
+        from conversation_agent.core.conversation_state import UserIntent
+
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+
+        first = orchestrator._recognize("Yes", context_intent=UserIntent.CONFIRM_YES)
+        second = orchestrator._recognize(" yes ", context_intent=UserIntent.CONFIRM_YES)
+
+        assert first == second == (UserIntent.CONFIRM_YES, 1.0)
+        assert orchestrator._recognize_cached.cache_info().hits == 1
+
+    def test_confirm_answer_uses_short_listen_window(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test confirmation waits for speech, then stops on a short silence."""
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        orchestrator.state_machine.transition_to(ConversationState.GREETING)
+        orchestrator.state_machine.transition_to(ConversationState.QUESTIONING)
+        orchestrator.current_response_text = "Software engineer"
+        orchestrator.audio_manager.get_last_rms.return_value = 3000.0
+        mock_stt.transcribe_audio_data.return_value = {"text": "Yep.", "language": "en"}
+
+        assert orchestrator._confirm_answer() is True
+        orchestrator.audio_manager.record_until_silence.assert_called_with(
+            silence_threshold=0.01,
+            silence_duration=0.8,
+            max_duration=5.0,
+            no_speech_timeout=3.0,
+        )
+
+    def test_confirm_answer_quiet_audio_retries(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test confirmation with no usable audio counts as a retry."""
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        orchestrator.state_machine.transition_to(ConversationState.GREETING)
+        orchestrator.state_machine.transition_to(ConversationState.QUESTIONING)
+        orchestrator.current_response_text = "Software engineer"
+
+        assert orchestrator._confirm_answer() is False
+        assert orchestrator.retry_count == 1
+        mock_stt.transcribe_audio_data.assert_not_called()
+
+    def test_listen_for_response_rejects_hallucination(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test known Whisper hallucinations on short audio are treated as silence."""
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        orchestrator.audio_manager.record_until_silence.return_value = b"\x00" * 32000
+        orchestrator.audio_manager.get_last_rms.return_value = 3000.0
+        mock_stt.transcribe_audio_data.return_value = {"text": "Thank You", "language": "en"}
+
+        assert orchestrator._listen_for_response() == ""
+
+    def test_process_question_prefetches_next_question(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test the next question is handed to the TTS provider for prefetch."""
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        next_question = orchestrator.questions[1]
+
+        with patch.object(orchestrator, "_listen_for_response", return_value="skip"):
+            orchestrator._process_question(0, orchestrator.questions[0])
+
+        mock_tts.prefetch.assert_called_once_with(
+            f"Question {next_question.number}. {next_question.text}"
+        )
+        assert orchestrator.session.turns[0].skipped is True
+
+    def test_recognize_empty_text_skips_recognizer(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test empty transcriptions are UNKNOWN without running the recognizer."""
+        from conversation_agent.core.conversation_state import UserIntent
+
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+
+        assert orchestrator._recognize("  ", context_intent=UserIntent.START) == (
+            UserIntent.UNKNOWN,
+            0.0,
+        )
+        assert orchestrator._recognize_cached.cache_info().misses == 0
+
+    def test_canned_prompts_replay_synthesized_audio(self, mock_stt, sample_pdf_path):
+        """Test fixed prompts are synthesized once and replayed as audio."""
+        tts = Mock()
+        tts.synth_to_bytes.side_effect = lambda text: text.encode()
+        orchestrator = InterviewOrchestrator(
+            tts_provider=tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        synth_calls = tts.synth_to_bytes.call_count
+
+        orchestrator._provide_clarification()
+        orchestrator._handle_closing()
+
+        assert tts.synth_to_bytes.call_count == synth_calls
+        tts.play_bytes.assert_any_call(b"Let me repeat the question.")
+        tts.play_bytes.assert_called_with(orchestrator.closing.encode())
+
+    def test_questions_presynthesized_in_background(self, mock_stt, sample_pdf_path):
+        """Test question audio is synthesized ahead and replayed when asked."""
+        tts = Mock()
+        tts.synth_to_bytes.side_effect = lambda text: text.encode()
+        orchestrator = InterviewOrchestrator(
+            tts_provider=tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        orchestrator._presynth_thread.join(timeout=1.0)
+
+        question = orchestrator.questions[0]
+        orchestrator.current_question = question
+        orchestrator._ask_question()
+
+        tts.speak.assert_not_called()
+        tts.play_bytes.assert_called_once_with(
+            f"Question {question.number}. {question.text}".encode()
+        )
+
+    def test_command_spotter_stops_on_partial_command(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test recording stops once an interim transcript contains a command."""
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        stream = mock_stt.start_stream.return_value
+        stream.partial.return_value = "skip"
+        chunk = b"\x00" * 8000  # 0.25s at 16kHz mono
+
+        with orchestrator._command_spotter() as on_chunk:
+            assert on_chunk(chunk) is False  # Not checked before 500ms of audio
+            assert on_chunk(chunk) is True
+            stream.close.assert_not_called()
+
+        stream.close.assert_called_once()
+        assert mock_stt.start_stream.call_args.args == (16000,)
+
+    def test_command_spotter_decodes_through_batching_service(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test interim decodes are serialized with the final transcription."""
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        mock_stt.transcribe_audio_data.return_value = {"text": "skip"}
+
+        with orchestrator._command_spotter():
+            transcribe = mock_stt.start_stream.call_args.kwargs["transcribe"]
+            assert transcribe(b"\x00\x00", 16000) == {"text": "skip"}
+
+        mock_stt.transcribe_audio_data.assert_called_once_with(b"\x00\x00", 16000)
+
+    def test_accept_as_answer_without_confirmation(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test answers are accepted directly when confirmation is disabled."""
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts,
+            stt_provider=mock_stt,
+            pdf_path=sample_pdf_path,
+            enable_confirmation=False,
+        )
+
+        assert orchestrator._accept_as_answer("Software engineer") is True
+        assert orchestrator.current_response_text == "Software engineer"
+
+    def test_listen_for_response_no_speech_skips_checks(
+        self, mock_tts, mock_stt, sample_pdf_path
+    ):
+        """Test an empty recording returns immediately without STT."""
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        orchestrator.audio_manager.record_until_silence.return_value = b""
+
+        assert orchestrator._listen_for_response() == ""
+        orchestrator.audio_manager.get_last_rms.assert_not_called()
+        mock_stt.transcribe_audio_data.assert_not_called()
+        assert orchestrator.last_audio_size == 0
+
+    def test_ask_question_barge_in_stops_tts(self, mock_tts, mock_stt, sample_pdf_path):
+        """Test speech during a question stops TTS playback."""
+        import threading
+
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts,
+            stt_provider=mock_stt,
+            pdf_path=sample_pdf_path,
+            enable_barge_in=True,
+        )
+        orchestrator.current_question = orchestrator.questions[0]
+        orchestrator.audio_manager.wait_for_speech.return_value = True
+        stopped = threading.Event()
+        mock_tts.stop.side_effect = stopped.set
+        # Playback runs until the barge-in watcher stops it
+        mock_tts.speak.side_effect = lambda text: stopped.wait(timeout=1.0)
+
+        assert orchestrator._ask_question() is True
+        mock_tts.stop.assert_called_once()
+
+    def test_greeting_barge_in_then_start(self, mock_tts, mock_stt, sample_pdf_path):
+        """Test the user can answer over the greeting and the interview starts."""
+        import threading
+
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts,
+            stt_provider=mock_stt,
+            pdf_path=sample_pdf_path,
+            enable_barge_in=True,
+        )
+        orchestrator.audio_manager.wait_for_speech.return_value = True
+        stopped = threading.Event()
+        mock_tts.stop.side_effect = stopped.set
+        mock_tts.speak.side_effect = lambda text: stopped.wait(timeout=1.0)
+        mock_stt.transcribe_audio_data.return_value = {"text": "ready", "language": "en"}
+
+        orchestrator._handle_greeting()
+
+        mock_tts.stop.assert_called_once()
+        mock_tts.speak.assert_called_once_with(orchestrator.greeting)
+
+    def test_greeting_spotter_stops_on_ready(self, mock_tts, mock_stt, sample_pdf_path):
+        """Test the greeting recording ends once the user says they're ready."""
+        from conversation_agent.core.interview_prompts import _GREETING_STOP_INTENTS
+
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        mock_stt.start_stream.return_value.partial.return_value = "yes let's begin"
+        chunk = b"\x00" * 16000  # 0.5s at 16kHz mono
+
+        with orchestrator._command_spotter(_GREETING_STOP_INTENTS, UserIntent.START) as on_chunk:
+            assert on_chunk(chunk) is True
+
+    def test_greeting_times_out(self, mock_tts, mock_stt, sample_pdf_path, mocker):
+        """Test the session ends if the user never confirms they're ready."""
+        orchestrator = InterviewOrchestrator(
+            tts_provider=mock_tts, stt_provider=mock_stt, pdf_path=sample_pdf_path
+        )
+        mocker.patch("conversation_agent.core.interview_prompts._GREETING_TIMEOUT", 0.0)
+        orchestrator.state_machine.transition_to(ConversationState.GREETING)
+
+        orchestrator._handle_greeting()
+
+        orchestrator.audio_manager.record_until_silence.assert_not_called()
+        assert orchestrator.state_machine.current_state == ConversationState.COMPLETE
@@ -0,0 +1,153 @@
+"""Tests for logging configuration."""
+
+from __future__ import annotations
+
+import io
+import logging
+from unittest.mock import Mock
+
+import pytest
+
+from conversation_agent.utils import logging_config
+from conversation_agent.utils.logging_config import (
+    ColoredFormatter,
+    LazyFormat,
+    setup_logging,
+    stop_file_logging,
+)
+
+
+def _make_record(level: int = logging.WARNING) -> logging.LogRecord:
+    """Build a log record for formatter tests."""
+    return logging.LogRecord(
+        "conversation_agent.tests", level, __file__, 1, "Disk %s", ("full",), None
+    )
+
+
+class TestColoredFormatter:
+    """Test ColoredFormatter output."""
+
+    def test_non_tty_stream_is_plain(self):
+        """Test no ANSI codes are written to a stream that isn't a terminal."""
+        formatter = ColoredFormatter("%(levelname)s: %(message)s", stream=io.StringIO())
+
+        assert formatter.format(_make_record()) == "WARNING: Disk full"
+
+    def test_tty_stream_is_colored(self):
+        """Test the level name is colored on a terminal."""
+        stream = Mock()
+        stream.isatty.return_value = True
+        formatter = ColoredFormatter("%(levelname)s: %(message)s", stream=stream)
+
+        assert formatter.format(_make_record()) == "\033[33mWARNING\033[0m: Disk full"
+
+    def test_no_stream_is_colored(self):
+        """Test colors are always added when no stream is given."""
+        formatter = ColoredFormatter("%(levelname)s: %(message)s", stream=None)
+
+        assert formatter.format(_make_record(logging.ERROR)) == (
+            "\033[31mERROR\033[0m: Disk full"
+        )
+
+    def test_format_leaves_record_unchanged(self):
+        """Test formatting doesn't write color codes into the shared record."""
+        formatter = ColoredFormatter("%(levelname)s: %(message)s", stream=None)
+        record = _make_record()
+
+        formatter.format(record)
+
+        assert record.levelname == "WARNING"
+
+    def test_file_handler_output_has_no_color(self, tmp_path):
+        """Test a file handler next to a colored console handler writes plain text."""
+        log_file = tmp_path / "agent.log"
+        console = logging.StreamHandler(io.StringIO())
+        console.setFormatter(ColoredFormatter("%(levelname)s: %(message)s", stream=None))
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+        logger = logging.getLogger("conversation_agent.tests.colors")
+        logger.propagate = False
+        logger.addHandler(console)
+        logger.addHandler(file_handler)
+
+        try:
+            logger.warning("Disk %s", "full")
+        finally:
+            logger.removeHandler(console)
+            logger.removeHandler(file_handler)
+            file_handler.close()
+
+        assert "\033[" in console.stream.getvalue()
+        assert log_file.read_text() == "WARNING - Disk full\n"
+
+
+class TestLazyFormat:
+    """Test LazyFormat deferred log arguments."""
+
+    def test_not_built_when_filtered_out(self, caplog):
+        """Test the callable is skipped for records below the logger level."""
+        build = Mock(return_value="expensive")
+        logger = logging.getLogger("conversation_agent.tests.lazy")
+
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            logger.debug("Value: %s", LazyFormat(build))
+
+        build.assert_not_called()
+        assert caplog.records == []
+
+    def test_built_once_when_emitted(self, caplog):
+        """Test the callable runs exactly once for an emitted record."""
+        build = Mock(return_value="expensive")
+        logger = logging.getLogger("conversation_agent.tests.lazy")
+
+        with caplog.at_level(logging.DEBUG, logger=logger.name):
+            logger.debug("Value: %s", LazyFormat(build))
+
+        build.assert_called_once_with()
+        assert caplog.messages == ["Value: expensive"]
+
+
+class TestSetupLogging:
+    """Test setup_logging() file logging through the background listener."""
+
+    @pytest.fixture(autouse=True)
+    def restore_logger(self):
+        """Leave the package logger as it was before the test."""
+        logger = logging.getLogger("conversation_agent")
+        handlers, level = logger.handlers[:], logger.level
+        yield
+        stop_file_logging()
+        logger.handlers[:] = handlers
+        logger.setLevel(level)
+
+    def test_file_written_after_stop(self, tmp_path):
+        """Test records reach the log file once the listener is stopped."""
+        log_file = tmp_path / "logs" / "agent.log"
+        setup_logging("INFO", log_file=log_file, enable_colors=False)
+
+        logging.getLogger("conversation_agent.tests").debug("Debug %d", 1)
+        logging.getLogger("conversation_agent.tests").info("Info %d", 2)
+        stop_file_logging()
+
+        lines = log_file.read_text().splitlines()
+        # The logger level (INFO) drops the debug record before it is queued
+        assert len(lines) == 1
+        assert lines[0].endswith("conversation_agent.tests - INFO - Info 2")
+        assert logging_config._listener is None
+
+    def test_setup_again_stops_old_listener(self, tmp_path):
+        """Test a second setup_logging() flushes and replaces the old listener."""
+        first_file = tmp_path / "first.log"
+        setup_logging("INFO", log_file=first_file, enable_colors=False)
+        first_listener = logging_config._listener
+        logging.getLogger("conversation_agent.tests").info("First")
+
+        second_file = tmp_path / "second.log"
+        setup_logging("INFO", log_file=second_file, enable_colors=False)
+        logging.getLogger("conversation_agent.tests").info("Second")
+        stop_file_logging()
+
+        assert first_listener._thread is None  # Stopped
+        assert logging_config._listener is None
+        assert first_file.read_text().rstrip().endswith("First")
+        assert second_file.read_text().rstrip().endswith("Second")
@@ -0,0 +1,151 @@
+"""Tests for interview data models."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+from pydantic_core import SchemaSerializer, SchemaValidator
+
+from conversation_agent.models import (
+    ConversationTurn,
+    InterviewSession,
+    Question,
+    Response,
+)
+
+
+class TestTrustedConstruction:
+    """Test the make_trusted() factories."""
+
+    def test_trusted_models_match_validated(self):
+        """Test trusted construction gives the same data as validation."""
+        question = Question.make_trusted(1, "What is your name?", source_line=3)
+        response = Response.make_trusted("Jane", confidence=0.9, retry_count=1)
+        turn = ConversationTurn.make_trusted(question, response, duration_seconds=2.5)
+
+        validated = ConversationTurn(
+            question=Question(id=question.id, number=1, text="What is your name?", source_line=3),
+            response=Response(
+                text="Jane", confidence=0.9, retry_count=1, timestamp=response.timestamp
+            ),
+            duration_seconds=2.5,
+        )
+
+        assert turn.model_dump() == validated.model_dump()
+
+    def test_defaults_are_filled(self):
+        """Test fields left out get their defaults and aren't marked as set."""
+        response = Response.make_trusted("Jane")
+
+        assert response.clarification_requested is False
+        assert response.timestamp is not None
+        assert response.model_fields_set == {"text", "confidence", "retry_count"}
+        assert Question.make_trusted(2, "Where do you live?").id is not None
+
+    def test_trusted_turn_in_session(self):
+        """Test trusted turns count towards session statistics."""
+        session = InterviewSession(questionnaire_path="/tmp/q.pdf")
+        question = Question.make_trusted(1, "What is your name?")
+
+        session.add_turn(
+            ConversationTurn.make_trusted(question, Response.make_trusted("Jane"))
+        )
+        session.add_turn(ConversationTurn.make_trusted(question, skipped=True))
+
+        assert session.answered_questions == 1
+        assert session.skipped_questions == 1
+
+
+class TestImmutableTurns:
+    """Test questions, responses and turns can't change once recorded."""
+
+    def test_turn_is_frozen(self):
+        """Test assigning to a recorded turn fails."""
+        turn = ConversationTurn(question=Question(number=1, text="What is your name?"))
+
+        with pytest.raises(ValidationError):
+            turn.skipped = True
+        with pytest.raises(ValidationError):
+            turn.question.text = "Changed?"
+
+    def test_unknown_fields_rejected(self):
+        """Test misspelled fields are rejected instead of silently dropped."""
+        with pytest.raises(ValidationError):
+            Response(text="Jane", retries=2)
+
+    def test_session_still_accumulates_turns(self):
+        """Test the session itself stays mutable."""
+        session = InterviewSession(questionnaire_path="/tmp/q.pdf")
+        session.add_turn(ConversationTurn(question=Question(number=1, text="Name?")))
+        session.mark_completed()
+
+        assert session.total_questions == 1
+        assert session.completed is True
+
+
+class TestSessionCounts:
+    """Test answered/skipped counts kept as turns are added."""
+
+    def test_counts_loaded_sessions(self):
+        """Test sessions created with turns (e.g. from JSON) are counted."""
+        question = Question(number=1, text="What is your name?")
+        session = InterviewSession(questionnaire_path="/tmp/q.pdf")
+        session.add_turn(ConversationTurn(question=question, response=Response(text="Jane")))
+        session.add_turn(ConversationTurn(question=question, skipped=True))
+        session.add_turn(ConversationTurn(question=question))
+
+        loaded = InterviewSession.model_validate_json(session.model_dump_json())
+
+        assert (loaded.answered_questions, loaded.skipped_questions) == (1, 1)
+        assert loaded.total_questions == 3
+        assert "_answered" not in session.model_dump()
+
+    def test_skipped_with_response_counts_as_skipped(self):
+        """Test a skipped turn isn't counted as answered even with a response."""
+        session = InterviewSession(questionnaire_path="/tmp/q.pdf")
+        session.add_turn(
+            ConversationTurn(
+                question=Question(number=1, text="What is your name?"),
+                response=Response(text="Jane"),
+                skipped=True,
+            )
+        )
+
+        assert (session.answered_questions, session.skipped_questions) == (0, 1)
+
+
+class TestSessionDuration:
+    """Test total_duration_seconds."""
+
+    def test_duration_from_monotonic_clock(self, mocker):
+        """Test live sessions are timed with the monotonic clock."""
+        clock = mocker.patch(
+            "conversation_agent.models.interview.time.monotonic_ns", return_value=10**9
+        )
+        session = InterviewSession(questionnaire_path="/tmp/q.pdf")
+        clock.return_value = 4 * 10**9
+        assert session.total_duration_seconds == 3.0
+
+        session.mark_completed()
+        clock.return_value = 9 * 10**9
+        assert session.total_duration_seconds == 3.0
+
+    def test_duration_with_explicit_start_time(self):
+        """Test sessions created with start/end times use the wall clock."""
+        session = InterviewSession(
+            questionnaire_path="/tmp/q.pdf",
+            start_time=datetime(2025, 1, 1, 10, 0, 0),
+            end_time=datetime(2025, 1, 1, 10, 5, 0),
+        )
+
+        assert session.total_duration_seconds == 300.0
+
+
+@pytest.mark.parametrize("model", [Question, Response, ConversationTurn, InterviewSession])
+def test_schema_built_at_import(model):
+    """Test validators and serializers are built at import, not on first use."""
+    assert model.__pydantic_complete__
+    assert isinstance(model.__pydantic_validator__, SchemaValidator)
+    assert isinstance(model.__pydantic_serializer__, SchemaSerializer)
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import gc
+import os
 import sys
+import wave
 from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
@@ -29,7 +32,7 @@ class TestParakeetProvider:
             )
             assert provider.model_name == "nvidia/parakeet-tdt-0.6b-v3"
             assert provider.language == "en"
-            assert provider.enable_timestamps is True
+            assert provider.enable_timestamps is False
             assert provider.use_local_attention is False
 
     def test_initialization_custom_model(self):
@@ -91,10 +94,13 @@ class TestParakeetProvider:
 
     def test_transcribe_file_not_found(self):
         """Test error when audio file doesn't exist."""
-        with patch("nemo.collections.asr.models.ASRModel.from_pretrained"):
+        with patch.object(ParakeetProvider, "_load_model"):
             provider = ParakeetProvider()
-            with pytest.raises(FileNotFoundError):
-                provider.transcribe("/nonexistent/audio.wav")
+        provider._model = Mock()
+        provider._model.transcribe.side_effect = RuntimeError("could not open file")
+
+        with pytest.raises(FileNotFoundError):
+            provider.transcribe("/nonexistent/audio.wav")
 
     def test_transcribe_no_timestamps(self, tmp_path):
         """Test transcription without timestamps."""
@@ -154,6 +160,88 @@ class TestParakeetProvider:
         assert "text" in result
         assert result["text"] == "Test transcription."
 
+    def test_transcribe_audio_data_in_memory(self):
+        """Test 16kHz audio is passed to NeMo as an array, without a temp file."""
+        mock_output = Mock()
+        mock_output.text = "Test transcription."
+        mock_output.timestamp = {"segment": []}
+
+        with patch.object(ParakeetProvider, "_load_model"):
+            provider = ParakeetProvider(enable_timestamps=True)
+        provider._model = MagicMock()
+        provider._model.transcribe.return_value = [mock_output]
+        provider._accepts_arrays = True
+        pcm = np.array([0, 16384, -32768], dtype=np.int16)
+
+        with patch("tempfile.mkdtemp") as mock_mkdtemp:
+            result = provider.transcribe_audio_data(pcm.tobytes(), sample_rate=16000)
+
+        assert result["text"] == "Test transcription."
+        mock_mkdtemp.assert_not_called()
+        call = provider._model.transcribe.call_args
+        np.testing.assert_array_equal(call.args[0][0], np.array([0.0, 0.5, -1.0], dtype=np.float32))
+        assert call.kwargs == {"batch_size": 1, "timestamps": True}
+
+    def test_transcribe_with_timestamps_per_call(self, tmp_path):
+        """Test timestamps are off by default and can be requested per call."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_bytes(b"fake audio")
+        mock_output = Mock(text="Hello world.")
+        mock_output.timestamp = {"segment": [{"start": 0.2, "end": 1.1, "text": "Hello world."}]}
+
+        with patch.object(ParakeetProvider, "_load_model"):
+            provider = ParakeetProvider()
+        provider._model = MagicMock()
+        provider._model.transcribe.return_value = [mock_output]
+
+        plain = provider.transcribe(str(audio_file))
+        assert provider._model.transcribe.call_args.kwargs["timestamps"] is False
+        assert plain["segments"] == [{"start": 0.0, "end": 0.0, "text": "Hello world."}]
+
+        timed = provider.transcribe(str(audio_file), with_timestamps=True)
+        assert provider._model.transcribe.call_args.kwargs["timestamps"] is True
+        assert timed["segments"] == [{"start": 0.2, "end": 1.1, "text": "Hello world."}]
+        assert provider.enable_timestamps is False
+
+    def test_transcribe_audio_data_reuses_temp_file(self):
+        """Test the file fallback rewrites one WAV file and removes it with the provider."""
+        with patch.object(ParakeetProvider, "_load_model"):
+            provider = ParakeetProvider()
+        provider._model = MagicMock()
+        provider._model.transcribe.return_value = ["Test."]
+
+        provider.transcribe_audio_data(b"\x00\x00" * 100, sample_rate=8000)
+        provider.transcribe_audio_data(b"\x00\x00" * 50, sample_rate=8000)
+
+        paths = [call.args[0][0] for call in provider._model.transcribe.call_args_list]
+        assert paths[0] == paths[1]
+        with wave.open(paths[1], "rb") as wav_file:
+            assert wav_file.getnframes() == 50
+            assert wav_file.getframerate() == 8000
+
+        tmp_dir = os.path.dirname(paths[0])
+        del provider
+        gc.collect()
+        assert not os.path.exists(tmp_dir)
+
+    def test_transcribe_batch_single_model_call(self):
+        """Test queued utterances are decoded with one batched model call."""
+        outputs = [Mock(text="First.", timestamp={}), Mock(text="Second.", timestamp={})]
+
+        with patch.object(ParakeetProvider, "_load_model"):
+            provider = ParakeetProvider(enable_timestamps=False)
+        provider._model = MagicMock()
+        provider._model.transcribe.return_value = outputs
+        provider._accepts_arrays = True
+        pcm = np.zeros(160, dtype=np.int16).tobytes()
+
+        results = provider.transcribe_batch([(pcm, 16000), (pcm, 16000)])
+
+        assert [result["text"] for result in results] == ["First.", "Second."]
+        provider._model.transcribe.assert_called_once()
+        assert len(provider._model.transcribe.call_args.args[0]) == 2
+        assert provider._model.transcribe.call_args.kwargs["batch_size"] == 2
+
     def test_transcribe_audio_data_failure(self):
         """Test error handling for audio data transcription failure."""
         mock_model = MagicMock()
@@ -221,6 +309,23 @@ class TestParakeetProvider:
         )
         assert provider.use_local_attention is True
 
+    def test_compile_model_warms_up(self):
+        """Test the encoder is compiled and a warm-up clip is transcribed."""
+        torch = MagicMock()
+        with patch.object(ParakeetProvider, "_load_model"):
+            provider = ParakeetProvider(compile_model=True)
+        provider._model = MagicMock()
+        provider._accepts_arrays = True
+        encoder = provider._model.encoder
+
+        with patch.dict(sys.modules, {"torch": torch}):
+            provider._compile()
+
+        torch.compile.assert_called_once_with(encoder, mode="reduce-overhead", dynamic=True)
+        assert provider._model.encoder is torch.compile.return_value
+        (clips,), _ = provider._model.transcribe.call_args
+        assert len(clips[0]) == 16000
+
     def test_timestamps_enabled(self, tmp_path):
         """Test timestamp extraction when enabled."""
         audio_file = tmp_path / "test.wav"
@@ -285,3 +390,5 @@ class TestParakeetProvider:
                 # Should not raise
                 provider.set_language(lang)
                 assert provider.get_language() == lang
+
+        assert ParakeetProvider.supported_languages() == sorted(expected_languages)
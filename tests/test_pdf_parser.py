@@ -1,5 +1,6 @@
 """Unit tests for PDF parser."""
 
+import importlib.machinery
 from pathlib import Path
 
 import pytest
@@ -163,6 +164,80 @@ class TestPDFQuestionParser:
         assert len(question_ids) == len(set(question_ids))
 
 
+class TestParseCache:
+    """Test suite for memoized PDF text extraction."""
+
+    @pytest.fixture
+    def questionnaire(self, tmp_path):
+        """Write a small questionnaire PDF and start from an empty cache."""
+        from fpdf import FPDF
+
+        from conversation_agent.core import pdf_parser
+
+        pdf = FPDF()
+        pdf.add_page()
+        pdf.set_font("Helvetica", size=12)
+        pdf.cell(0, 10, "What is your full name?", new_x="LMARGIN", new_y="NEXT")
+        pdf.cell(0, 10, "Where do you live?", new_x="LMARGIN", new_y="NEXT")
+        pdf_path = tmp_path / "cached.pdf"
+        pdf.output(str(pdf_path))
+
+        pdf_parser._cached_page_texts.cache_clear()
+        yield pdf_path
+        pdf_parser._cached_page_texts.cache_clear()
+
+    def test_repeated_parse_uses_cache(self, questionnaire, mocker):
+        """Test parsing the same file twice extracts its text once."""
+        from conversation_agent.core import pdf_parser
+
+        extract = mocker.spy(pdf_parser, "_extract_pypdf_page_texts")
+        parser = PDFQuestionParser(backend="pypdf")
+
+        first = parser.parse(questionnaire)
+        second = parser.parse(questionnaire)
+
+        assert extract.call_count == 1
+        assert [q.text for q in first] == [q.text for q in second]
+        # Fresh Question objects each time
+        assert {q.id for q in first}.isdisjoint(q.id for q in second)
+
+    def test_modified_file_is_reparsed(self, questionnaire, mocker):
+        """Test a changed file invalidates the cached text."""
+        import os
+
+        from conversation_agent.core import pdf_parser
+
+        extract = mocker.spy(pdf_parser, "_extract_pypdf_page_texts")
+        parser = PDFQuestionParser(backend="pypdf")
+
+        parser.parse(questionnaire)
+        stat = questionnaire.stat()
+        os.utime(questionnaire, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        parser.parse(questionnaire)
+
+        assert extract.call_count == 2
+
+    def test_disk_cache_survives_memory_cache(self, questionnaire, tmp_path, mocker):
+        """Test extracted text is reused from the on-disk cache."""
+        from conversation_agent.core import pdf_parser
+
+        cache_dir = tmp_path / "cache"
+        parser = PDFQuestionParser(backend="pypdf", cache_dir=cache_dir)
+        first = parser.parse(questionnaire)
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        # Simulate a new process: empty memory cache, extraction unavailable
+        pdf_parser._cached_page_texts.cache_clear()
+        mocker.patch.object(
+            pdf_parser, "_extract_pypdf_page_texts", side_effect=AssertionError("re-parsed")
+        )
+        second = parser.parse(questionnaire)
+
+        assert [(q.text, q.source_line) for q in second] == [
+            (q.text, q.source_line) for q in first
+        ]
+
+
 class TestPDFValidation:
     """Test suite for PDF validation."""
 
@@ -308,3 +383,64 @@ class TestEdgeCases:
         # Should handle long questions without errors
         questions = parser.parse(pdf_path)
         assert len(questions) >= 1
+
+    @pytest.mark.skipif(
+        importlib.machinery.PathFinder.find_spec("pyaudio") is None,
+        reason="spawned workers import conversation_agent, which needs PyAudio",
+    )
+    def test_parallel_extraction_matches_serial(self, tmp_path):
+        """Test large PDFs extracted in worker processes parse like serial extraction."""
+        from fpdf import FPDF
+
+        pdf = FPDF()
+        pdf.set_font("Helvetica", size=12)
+        for page in range(40):
+            pdf.add_page()
+            pdf.cell(0, 10, f"Section {page + 1}", new_x="LMARGIN", new_y="NEXT")
+            pdf.cell(0, 10, f"What did you do in year {page + 1}?", new_x="LMARGIN", new_y="NEXT")
+
+        pdf_path = tmp_path / "large.pdf"
+        pdf.output(str(pdf_path))
+
+        serial = PDFQuestionParser(max_workers=1, backend="pypdf").parse(pdf_path)
+        parallel = PDFQuestionParser(max_workers=2, backend="pypdf").parse(pdf_path)
+
+        assert len(parallel) == 40
+        assert [(q.number, q.text, q.source_line) for q in parallel] == [
+            (q.number, q.text, q.source_line) for q in serial
+        ]
+
+    def test_page_extraction_failure_is_logged(self, caplog):
+        """Test a page that fails to extract is logged and skipped."""
+        from unittest.mock import Mock
+
+        from conversation_agent.core.pdf_parser import _extract_page_text
+
+        page = Mock()
+        page.extract_text.side_effect = RuntimeError("bad content stream")
+
+        with caplog.at_level("WARNING", logger="conversation_agent.core.pdf_parser"):
+            assert _extract_page_text(page, 2) is None
+
+        assert "Failed to extract text from page 3: bad content stream" in caplog.text
+
+    def test_unknown_backend(self):
+        """Test that an unknown extraction backend is rejected."""
+        with pytest.raises(ValueError, match="Unknown PDF backend"):
+            PDFQuestionParser(backend="poppler")
+
+    @pytest.mark.parametrize(
+        "fixture_name",
+        ["sample_questionnaire", "malformed_questionnaire", "multipage_questionnaire"],
+    )
+    def test_pdfium_backend_matches_pypdf(self, fixture_name, request):
+        """Test PDFium extraction yields the same questions as pypdf."""
+        pytest.importorskip("pypdfium2")
+        pdf_path = request.getfixturevalue(fixture_name)
+
+        pdfium_questions = PDFQuestionParser(backend="pdfium").parse(pdf_path)
+        pypdf_questions = PDFQuestionParser(backend="pypdf").parse(pdf_path)
+
+        assert [(q.text, q.source_line) for q in pdfium_questions] == [
+            (q.text, q.source_line) for q in pypdf_questions
+        ]
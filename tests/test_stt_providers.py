@@ -16,9 +16,15 @@ sys.modules["nemo"] = MagicMock()
 sys.modules["nemo.collections"] = MagicMock()
 sys.modules["nemo.collections.asr"] = MagicMock()
 sys.modules["nemo.collections.asr.models"] = MagicMock()
+sys.modules["faster_whisper"] = MagicMock()
 
 from conversation_agent.config import STTConfig  # noqa: E402
-from conversation_agent.providers.stt import STTError, STTProvider, WhisperProvider  # noqa: E402
+from conversation_agent.providers.stt import (  # noqa: E402
+    FasterWhisperProvider,
+    STTError,
+    STTProvider,
+    WhisperProvider,
+)
 
 
 class TestSTTProviderInterface:
@@ -187,6 +193,167 @@ class TestWhisperProvider:
         assert result["language"] == "en"
         assert len(result["segments"]) == 1
 
+    @pytest.mark.parametrize("device", ["cuda", "cuda:1"])
+    @patch("whisper.log_mel_spectrogram")
+    @patch("whisper.load_model")
+    def test_cuda_mel_uses_pinned_buffer(self, mock_load_model, mock_log_mel, device):
+        """Test CUDA audio is staged through one reused pinned buffer."""
+        mock_load_model.return_value = Mock(device=device)
+        mock_load_model.return_value.dims.n_mels = 80
+        provider = WhisperProvider(device=device)
+        torch = MagicMock()
+        audio_array = np.zeros(480000, dtype=np.float32)
+
+        with patch.dict(sys.modules, {"torch": torch}):
+            provider._log_mel_spectrogram(audio_array)
+            provider._log_mel_spectrogram(audio_array)
+
+        torch.empty.assert_called_once_with(480000, dtype=torch.float32, pin_memory=True)
+        pinned = torch.empty.return_value
+        assert pinned.copy_.call_count == 2
+        pinned.to.assert_called_with(device, non_blocking=True)
+        mock_log_mel.assert_called_with(pinned.to.return_value, n_mels=80)
+
+    @patch("whisper.DecodingOptions")
+    @patch("whisper.decode")
+    @patch("whisper.log_mel_spectrogram")
+    @patch("whisper.pad_or_trim")
+    @patch("whisper.load_model")
+    def test_transcribe_batch_single_decode(
+        self,
+        mock_load_model,
+        mock_pad_or_trim,
+        mock_log_mel,
+        mock_decode,
+        mock_decoding_options,
+    ):
+        """Test batch transcription decodes all buffers in one call."""
+        mock_model = Mock()
+        mock_model.dims.n_mels = 80
+        mock_load_model.return_value = mock_model
+        mock_pad_or_trim.side_effect = lambda audio: np.zeros(480000, dtype=np.float32)
+        mock_mel = Mock()
+        mock_mel.to.return_value = mock_mel
+        mock_log_mel.return_value = mock_mel
+        mock_decode.return_value = [Mock(text="first"), Mock(text="second")]
+
+        provider = WhisperProvider(language="en")
+        audio_data = np.zeros(1600, dtype=np.int16).tobytes()
+
+        results = provider.transcribe_batch([(audio_data, 16000), (audio_data, 16000)])
+
+        assert [r["text"] for r in results] == ["first", "second"]
+        assert mock_log_mel.call_args[0][0].shape == (2, 480000)
+        mock_decode.assert_called_once()
+
+    @patch("whisper.load_model")
+    def test_transcribe_batch_default_loops(self, mock_load_model):
+        """Test base batch implementation transcribes each buffer."""
+        mock_load_model.return_value = Mock()
+        provider = WhisperProvider(language="")
+
+        with patch.object(
+            provider, "transcribe_audio_data", side_effect=[{"text": "a"}, {"text": "b"}]
+        ) as mock_transcribe:
+            results = provider.transcribe_batch([(b"\x00\x00", 16000), (b"\x00\x00", 8000)])
+
+        assert results == [{"text": "a"}, {"text": "b"}]
+        mock_transcribe.assert_any_call(b"\x00\x00", 8000)
+
+    @patch("whisper.load_model")
+    def test_start_stream_confirms_agreed_words(self, mock_load_model):
+        """Test interim text only includes words two passes agree on."""
+        mock_load_model.return_value = Mock()
+        provider = WhisperProvider(interim_transcripts=True)
+        hypotheses = iter([{"text": "skip the"}, {"text": "Skip this question"}])
+        more_audio = b"\x00\x00" * 16000
+
+        with patch.object(
+            provider, "transcribe_audio_data", side_effect=lambda *a: next(hypotheses)
+        ):
+            stream = provider.start_stream(16000)
+            stream.push(b"\x00\x00" * 16000)
+            assert stream.partial() == ""  # First pass starts, nothing agreed yet
+            stream._worker.join()
+            stream.push(more_audio)
+            stream.partial()
+            stream._worker.join()
+
+            assert stream.partial() == "Skip"
+
+    @patch("whisper.load_model")
+    def test_stream_close_waits_and_stops_decoding(self, mock_load_model):
+        """Test close() joins the running pass and no new pass starts after it."""
+        mock_load_model.return_value = Mock()
+        provider = WhisperProvider(interim_transcripts=True)
+        transcribe = Mock(return_value={"text": "skip"})
+
+        stream = provider.start_stream(16000, transcribe=transcribe)
+        stream.push(b"\x00\x00" * 16000)
+        stream.partial()
+        stream.close()
+
+        assert not stream._worker.is_alive()
+        stream.push(b"\x00\x00" * 16000)
+        stream.partial()
+        transcribe.assert_called_once()
+        mock_load_model.return_value.transcribe.assert_not_called()
+
+    @patch("whisper.load_model")
+    def test_start_stream_without_interim_transcripts(self, mock_load_model):
+        """Test interim decoding is opt-in: the default stream never decodes."""
+        mock_load_model.return_value = Mock()
+        provider = WhisperProvider()
+        transcribe = Mock(return_value={"text": "skip"})
+
+        stream = provider.start_stream(16000, transcribe=transcribe)
+        stream.push(b"\x00\x00" * 32000)
+
+        assert stream.partial() == ""
+        stream.close()
+        transcribe.assert_not_called()
+
+    def test_local_agreement_stream_stops_at_max_seconds(self):
+        """Test no pass decodes more than max_seconds of audio."""
+        from conversation_agent.providers.stt import LocalAgreementStream
+
+        transcribe = Mock(return_value={"text": "skip"})
+        stream = LocalAgreementStream(
+            Mock(), 16000, transcribe=transcribe, max_seconds=2.0
+        )
+        for _ in range(5):
+            stream.push(b"\x00\x00" * 16000)  # 1s
+            stream.partial()
+            stream._worker.join()
+        stream.close()
+
+        decoded = [len(call.args[0]) for call in transcribe.call_args_list]
+        assert decoded == [32000, 64000]
+
+    @patch("whisper.load_model")
+    def test_transcribe_stream_yields_settled_text(self, mock_load_model):
+        """Test transcribe_stream yields agreed prefixes then the final text."""
+        mock_load_model.return_value = Mock()
+        provider = WhisperProvider()
+        hypotheses = [
+            {"text": "I work"},
+            {"text": "I work as a"},
+            {"text": "I work as an engineer"},
+        ]
+        chunk = b"\x00\x00" * 8000  # 0.5s
+
+        with patch.object(provider, "transcribe_audio_data", side_effect=hypotheses):
+            results = list(provider.transcribe_stream([chunk] * 4, 16000))
+
+        assert results == ["I work", "I work as an engineer"]
+
+    def test_agreed_prefix(self):
+        """Test LocalAgreement prefix ignores case and trailing punctuation."""
+        from conversation_agent.providers.stt.base import agreed_prefix
+
+        assert agreed_prefix(["Hello,", "world"], ["hello", "there"]) == ["hello"]
+        assert agreed_prefix([], ["hello"]) == []
+
     @patch("whisper.load_model")
     def test_get_available_models(self, mock_load_model):
         """Test getting available models."""
@@ -256,6 +423,199 @@ class TestWhisperProvider:
         # Check that output length is approximately correct
         expected_length = int(len(audio_44k) * 16000 / 44100)
         assert abs(len(audio_16k) - expected_length) < 10
+        assert audio_16k.dtype == np.float32
+
+    @patch("whisper.load_model")
+    def test_prepare_audio_scales_pcm(self, mock_load_model):
+        """Test 16-bit PCM is converted to float32 in [-1.0, 1.0]."""
+        mock_load_model.return_value = Mock()
+        provider = WhisperProvider()
+        pcm = np.array([-32768, -16384, 0, 16384, 32767], dtype=np.int16)
+
+        audio = provider._prepare_audio(pcm.tobytes(), 16000)
+
+        assert audio.dtype == np.float32
+        np.testing.assert_array_equal(audio, pcm.astype(np.float32) / 32768.0)
+
+    @patch("whisper.load_model")
+    def test_resample_interpolation_fallback(self, mock_load_model):
+        """Test resampling falls back to linear interpolation without scipy."""
+        mock_load_model.return_value = Mock()
+        provider = WhisperProvider()
+        audio_8k = np.linspace(-1.0, 1.0, 8000, dtype=np.float32)
+
+        with patch("conversation_agent.providers.stt.whisper_provider.resample_poly", None):
+            audio_16k = provider._resample(audio_8k, 8000, 16000)
+
+        assert len(audio_16k) == 16000
+        assert audio_16k.dtype == np.float32
+        assert audio_16k[0] == -1.0 and audio_16k[-1] == 1.0
+
+
+class TestFasterWhisperProvider:
+    """Test faster-whisper provider implementation."""
+
+    @patch("faster_whisper.WhisperModel")
+    def test_compute_type_follows_device(self, mock_model_cls):
+        """Test INT8 is used on CPU and FP16 on CUDA by default."""
+        assert FasterWhisperProvider().compute_type == "int8"
+        assert FasterWhisperProvider(device="cuda").compute_type == "float16"
+        mock_model_cls.assert_called_with("base", device="cuda", compute_type="float16")
+
+    @patch("faster_whisper.WhisperModel")
+    def test_transcribe_audio_data(self, mock_model_cls):
+        """Test raw audio is transcribed from a float32 array with VAD and greedy decoding."""
+        segments = [
+            Mock(start=0.0, end=1.2, text=" Hello"),
+            Mock(start=1.2, end=2.0, text=" world"),
+        ]
+        mock_model_cls.return_value.transcribe.return_value = (
+            iter(segments),
+            Mock(language="en"),
+        )
+        provider = FasterWhisperProvider(language="en")
+        pcm = np.array([0, 16384], dtype=np.int16).tobytes()
+
+        result = provider.transcribe_audio_data(pcm, sample_rate=16000)
+
+        assert result["text"] == " Hello world"
+        assert result["language"] == "en"
+        assert result["segments"][1] == {"start": 1.2, "end": 2.0, "text": " world"}
+        call = mock_model_cls.return_value.transcribe.call_args
+        np.testing.assert_array_equal(call.args[0], np.array([0.0, 0.5], dtype=np.float32))
+        assert call.kwargs == {"language": "en", "beam_size": 1, "vad_filter": True}
+
+    @patch("faster_whisper.WhisperModel")
+    def test_transcribe_audio_data_failure(self, mock_model_cls):
+        """Test decoding errors are raised as STTError."""
+        mock_model_cls.return_value.transcribe.side_effect = RuntimeError("ctranslate2 error")
+        provider = FasterWhisperProvider()
+
+        with pytest.raises(STTError, match="Transcription failed for audio data"):
+            provider.transcribe_audio_data(b"\x00\x00", 16000)
+
+    @patch("faster_whisper.WhisperModel")
+    def test_transcribe_stream_yields_final_segments(self, mock_model_cls):
+        """Test the final pass is shown segment by segment once past the confirmed text."""
+        provider = FasterWhisperProvider()
+        segments = [
+            Mock(text=" I work"),
+            Mock(text=" as an"),
+            Mock(text=" engineer."),
+        ]
+        mock_model_cls.return_value.transcribe.return_value = (iter(segments), Mock())
+        hypotheses = [{"text": "I work as"}, {"text": "I work as a"}]
+        chunk = b"\x00\x00" * 16000
+
+        with patch.object(provider, "transcribe_audio_data", side_effect=hypotheses):
+            results = list(provider.transcribe_stream([chunk] * 2, 16000))
+
+        assert results == ["I work as", "I work as an", "I work as an engineer."]
+
+    @patch("faster_whisper.WhisperModel")
+    def test_get_provider_faster_whisper(self, mock_model_cls):
+        """Test selecting faster-whisper through STTConfig."""
+        provider = STTConfig(provider="faster-whisper", model_size="small").get_provider()
+
+        assert isinstance(provider, FasterWhisperProvider)
+        assert provider.get_model_size() == "small"
+
+
+class TestBatchedSTTService:
+    """Test cases for BatchedSTTService."""
+
+    def test_single_request_uses_transcribe_audio_data(self):
+        """Test a lone request is transcribed without batching."""
+        from conversation_agent.providers.stt import BatchedSTTService
+
+        provider = Mock()
+        provider.transcribe_audio_data.return_value = {"text": "hello"}
+        service = BatchedSTTService(provider, window=0.01)
+
+        assert service.submit(b"\x00\x00", 16000).result(timeout=1.0) == {"text": "hello"}
+        provider.transcribe_batch.assert_not_called()
+
+    def test_concurrent_requests_are_batched(self):
+        """Test requests arriving within the window share one batch call."""
+        from conversation_agent.providers.stt import BatchedSTTService
+
+        provider = Mock()
+        provider.transcribe_batch.return_value = [{"text": "a"}, {"text": "b"}]
+        service = BatchedSTTService(provider, window=0.5)
+
+        first = service.submit(b"\x01\x00", 16000)
+        second = service.submit(b"\x02\x00", 16000)
+
+        assert first.result(timeout=2.0) == {"text": "a"}
+        assert second.result(timeout=2.0) == {"text": "b"}
+        provider.transcribe_batch.assert_called_once_with(
+            [(b"\x01\x00", 16000), (b"\x02\x00", 16000)]
+        )
+
+    def test_errors_propagate_to_futures(self):
+        """Test a failed transcription raises from the request's future."""
+        from conversation_agent.providers.stt import BatchedSTTService
+
+        provider = Mock()
+        provider.transcribe_audio_data.side_effect = STTError("decode failed")
+        service = BatchedSTTService(provider, window=0.01)
+
+        with pytest.raises(STTError, match="decode failed"):
+            service.submit(b"\x00\x00", 16000).result(timeout=1.0)
+
+    def test_for_provider_shares_service(self):
+        """Test sessions using the same provider get the same service."""
+        from conversation_agent.providers.stt import BatchedSTTService
+
+        provider = Mock()
+
+        assert BatchedSTTService.for_provider(provider) is BatchedSTTService.for_provider(
+            provider
+        )
+
+    def test_close_stops_worker(self):
+        """Test close() drains queued requests and ends the worker thread."""
+        from conversation_agent.providers.stt import BatchedSTTService
+
+        provider = Mock()
+        provider.transcribe_audio_data.return_value = {"text": "hello"}
+        service = BatchedSTTService(provider, window=0.01)
+        future = service.submit(b"\x00\x00", 16000)
+
+        service.close()
+
+        assert future.result(timeout=1.0) == {"text": "hello"}
+        assert not service._worker.is_alive()
+
+    def test_submit_after_close_raises(self):
+        """Test submit() on a closed service fails instead of hanging."""
+        from conversation_agent.providers.stt import BatchedSTTService
+
+        provider = Mock()
+        service = BatchedSTTService.for_provider(provider)
+        service.close()
+        service.close()  # Idempotent
+
+        with pytest.raises(STTError, match="closed"):
+            service.submit(b"\x00\x00", 16000)
+        assert BatchedSTTService.for_provider(provider) is not service
+
+    def test_worker_exits_when_provider_is_collected(self):
+        """Test the service doesn't keep its provider or worker alive."""
+        import gc
+
+        from conversation_agent.providers.stt import BatchedSTTService
+
+        provider = Mock()
+        service = BatchedSTTService.for_provider(provider)
+        worker = service._worker
+
+        del provider
+        gc.collect()
+        worker.join(timeout=1.0)
+
+        assert service.provider is None
+        assert not worker.is_alive()
 
 
 class TestSTTConfig:
@@ -379,21 +739,21 @@ class TestSTTConfig:
         config = STTConfig(provider="parakeet")
 
         assert config.parakeet_model == "nvidia/parakeet-tdt-0.6b-v3"
-        assert config.parakeet_enable_timestamps is True
+        assert config.parakeet_enable_timestamps is False
         assert config.parakeet_local_attention is False
 
     def test_parakeet_config_env_vars(self, monkeypatch):
         """Test Parakeet config from environment variables."""
         monkeypatch.setenv("STT_PROVIDER", "parakeet")
         monkeypatch.setenv("STT_PARAKEET_MODEL", "nvidia/parakeet-rnnt-1.1b")
-        monkeypatch.setenv("STT_PARAKEET_ENABLE_TIMESTAMPS", "false")
+        monkeypatch.setenv("STT_PARAKEET_ENABLE_TIMESTAMPS", "true")
         monkeypatch.setenv("STT_PARAKEET_LOCAL_ATTENTION", "true")
 
         config = STTConfig()
 
         assert config.provider == "parakeet"
         assert config.parakeet_model == "nvidia/parakeet-rnnt-1.1b"
-        assert config.parakeet_enable_timestamps is False
+        assert config.parakeet_enable_timestamps is True
         assert config.parakeet_local_attention is True
 
     @patch("nemo.collections.asr.models.ASRModel.from_pretrained")
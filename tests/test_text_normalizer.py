@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from conversation_agent.config import NormalizationConfig
 from conversation_agent.core.text_normalizer import TextNormalizer
 
@@ -123,6 +125,13 @@ class TestTextNormalizerPhones:
         result = normalizer.normalize(text)
         assert result == "call 1-415-555-1234"
 
+    def test_phone_mixed_case_and_whitespace(self):
+        """Test digit words are converted regardless of case and spacing."""
+        normalizer = TextNormalizer()
+        text = "call Five FIVE five\tone  two three four"
+        result = normalizer.normalize(text)
+        assert result == "call 555-1234"
+
     def test_international_phone(self):
         """Test international phone with plus: +1-415-555-1234."""
         normalizer = TextNormalizer()
@@ -372,3 +381,90 @@ class TestTextNormalizerEdgeCases:
 
         # Ensure first result wasn't affected
         assert result1 == "john.smith@gmail.com"
+
+    def test_stdlib_re_fallback(self, monkeypatch):
+        """Test normalization works without the optional re2 and ahocorasick engines."""
+        from conversation_agent.core import text_normalizer
+
+        monkeypatch.setattr(text_normalizer, "re2", None)
+        monkeypatch.setattr(text_normalizer, "ahocorasick", None)
+        normalizer = TextNormalizer()
+
+        text = "email john dot smith at gmail dot com or call five five five one two three four"
+        result = normalizer.normalize(text)
+        assert result == "email john.smith@gmail.com or call 555-1234"
+
+        # Unicode whitespace separates digit words like an ASCII space
+        assert normalizer.normalize("five\u2003five five one two three four") == "555-1234"
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "too at\u2003b.c",
+            "john\u00a0dot smith at gmail\u2003dot com",
+            "call five\u2003five five one two three four",
+            "call five\x1cfive five one two three four",
+            "mail j\vat b.c",
+            "caf\u00e9john at b.c",
+            "\u212a at b.c",
+        ],
+    )
+    def test_re2_matches_stdlib_re(self, monkeypatch, text):
+        """Test RE2 and the standard library give identical results."""
+        pytest.importorskip("re2")
+        from conversation_agent.core import text_normalizer
+
+        monkeypatch.setattr(text_normalizer, "ahocorasick", None)
+        with_re2 = TextNormalizer()
+        monkeypatch.setattr(text_normalizer, "re2", None)
+        stdlib_only = TextNormalizer()
+
+        assert with_re2._normalize_emails(text) == stdlib_only._normalize_emails(text)
+        assert with_re2._normalize_phone_numbers(text) == stdlib_only._normalize_phone_numbers(
+            text
+        )
+
+    def test_non_ascii_whitespace_uses_unicode_rules(self):
+        """Test Unicode whitespace separates spoken words whichever engine is installed."""
+        normalizer = TextNormalizer()
+        assert normalizer.normalize("too at\u2003b.c") == "too@b.c"
+
+    def test_digit_word_automaton_matches_regex(self, monkeypatch):
+        """Test the Aho-Corasick phone path agrees with the regex path."""
+        pytest.importorskip("ahocorasick")
+        from conversation_agent.core import text_normalizer
+
+        texts = [
+            "call five five five one two three four",
+            "Call PLUS one four one five five five five one two three four now",
+            "surplus one eight hundred five five five zero one zero one",
+            "phone too five five five one two three four, or four five",
+            "one_two three four five six seven eight",
+        ]
+        automaton = TextNormalizer()
+        monkeypatch.setattr(text_normalizer, "ahocorasick", None)
+        regex_only = TextNormalizer()
+
+        for text in texts:
+            assert automaton.normalize(text) == regex_only.normalize(text)
+
+    def test_single_scan_matches_separate_passes(self, monkeypatch):
+        """Test the fused email/phone scan gives the same result as two passes."""
+        from conversation_agent.core import text_normalizer
+
+        monkeypatch.setattr(text_normalizer, "re2", None)
+        monkeypatch.setattr(text_normalizer, "ahocorasick", None)
+        normalizer = TextNormalizer()
+        assert normalizer._fused_pattern is not None
+
+        texts = [
+            "email john dot smith at gmail dot com or call five five five one two three four",
+            # Email local part starting inside a run of digit words
+            "email john one two three at gmail dot com",
+            # Email domain ending in a digit word, followed by more digit words
+            "write to x at one dot one five five five one two three four",
+            "I worked at a startup for three years",
+        ]
+        for text in texts:
+            expected = normalizer._normalize_phone_numbers(normalizer._normalize_emails(text))
+            assert normalizer.normalize(text) == expected
@@ -5,6 +5,11 @@ This module tests the TTS provider interface and concrete implementations.
 
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -16,6 +21,7 @@ from conversation_agent.providers.tts import (
     TTSError,
     TTSProvider,
 )
+from conversation_agent.providers.tts.piper_model import quantized_model_path
 
 
 class TestTTSProviderInterface:
@@ -94,6 +100,85 @@ class TestPyttsx3Provider:
         provider.engine.say.assert_called_once_with("Hello, world!")
         provider.engine.runAndWait.assert_called_once()
 
+    def test_speak_macos_waits_for_finished_utterance(self, mock_engine):
+        """On macOS, speak() pumps the event loop until the utterance finishes."""
+        with patch("pyttsx3.init", return_value=mock_engine):
+            provider = Pyttsx3Provider()
+        event, on_finished = mock_engine.connect.call_args.args
+        assert event == "finished-utterance"
+        iterations = []
+
+        def iterate():
+            iterations.append(1)
+            if len(iterations) == 3:
+                on_finished("utterance", True)
+
+        mock_engine.iterate.side_effect = iterate
+
+        with patch("platform.system", return_value="Darwin"):
+            provider.speak("Hello, world!")
+
+        assert len(iterations) == 3
+        mock_engine.startLoop.assert_called_once_with(False)
+        mock_engine.endLoop.assert_called_once()
+        mock_engine.runAndWait.assert_not_called()
+
+    def test_speak_queues_first_sentence_separately(self, mock_engine):
+        """speak() queues the first sentence on its own and waits for both parts."""
+        with patch("pyttsx3.init", return_value=mock_engine):
+            provider = Pyttsx3Provider()
+        _, on_finished = mock_engine.connect.call_args.args
+        mock_engine.iterate.side_effect = lambda: on_finished("utterance", True)
+
+        with patch("platform.system", return_value="Darwin"):
+            provider.speak("Hello there, my friend. How are you? I'm fine.")
+
+        assert [c.args[0] for c in mock_engine.say.call_args_list] == [
+            "Hello there, my friend.",
+            "How are you? I'm fine.",
+        ]
+        assert mock_engine.iterate.call_count == 2
+
+    def test_speak_macos_stop_ends_multi_sentence_wait(self, mock_engine):
+        """On macOS, stop() after the first utterance ends speak() at once."""
+        with patch("pyttsx3.init", return_value=mock_engine):
+            provider = Pyttsx3Provider()
+        _, on_finished = mock_engine.connect.call_args.args
+        iterations = []
+
+        def iterate():
+            iterations.append(1)
+            if len(iterations) == 1:
+                on_finished("utterance", True)
+                provider.stop()  # Barge-in drops the second utterance
+
+        mock_engine.iterate.side_effect = iterate
+
+        start = time.monotonic()
+        with patch("platform.system", return_value="Darwin"):
+            provider.speak("Hello there my friend. How are you today?")
+
+        assert time.monotonic() - start < 1.0
+        assert len(iterations) == 1
+        mock_engine.endLoop.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            (
+                "Please see Dr. Smith first. Then wait.",
+                ["Please see Dr. Smith first.", "Then wait."],
+            ),
+            ("Use tools, e.g. hammers and saws.", ["Use tools, e.g. hammers and saws."]),
+            ("Hi. What is your name?", ["Hi. What is your name?"]),
+        ],
+    )
+    def test_split_first_sentence(self, text, expected):
+        """The first-sentence split skips abbreviations and very short openings."""
+        from conversation_agent.providers.tts.pyttsx3_provider import _split_first_sentence
+
+        assert _split_first_sentence(text) == expected
+
     def test_speak_empty_text(self, provider):
         """speak() with empty text does nothing."""
         provider.speak("")
@@ -119,6 +204,22 @@ class TestPyttsx3Provider:
         with pytest.raises(TTSError, match="Voice .* not found"):
             provider.set_voice("invalid_voice")
 
+    def test_set_voice_uses_cached_ids(self, provider):
+        """set_voice() validates against voices listed at startup."""
+        provider.engine.getProperty.reset_mock()
+        provider.set_voice("voice2")
+        provider.engine.getProperty.assert_not_called()
+
+    def test_refresh_voices_picks_up_new_voice(self, provider):
+        """refresh_voices() makes newly installed voices selectable."""
+        provider.engine.getProperty.return_value = [Mock(id="voice3", languages=["de_DE"])]
+        with pytest.raises(TTSError, match="not found"):
+            provider.set_voice("voice3")
+
+        provider.refresh_voices()
+        provider.set_voice("voice3")
+        provider.engine.setProperty.assert_called_with("voice", "voice3")
+
     def test_set_rate_success(self, provider):
         """set_rate() sets rate within valid range."""
         provider.set_rate(150)
@@ -137,6 +238,23 @@ class TestPyttsx3Provider:
         provider.set_volume(0.8)
         provider.engine.setProperty.assert_called_with("volume", 0.8)
 
+    def test_unchanged_properties_not_resent(self, provider):
+        """set_rate()/set_volume()/set_voice() skip values already set."""
+        provider.set_rate(150)
+        provider.set_rate(150)
+        provider.set_volume(0.8)
+        provider.set_volume(0.8)
+        provider.set_voice("voice1")
+        provider.set_voice("voice1")
+        provider.set_rate(180)
+
+        assert [c.args for c in provider.engine.setProperty.call_args_list] == [
+            ("rate", 150),
+            ("volume", 0.8),
+            ("voice", "voice1"),
+            ("rate", 180),
+        ]
+
     def test_set_volume_out_of_range(self, provider):
         """set_volume() raises TTSError for invalid volumes."""
         with pytest.raises(TTSError, match="out of range"):
@@ -163,9 +281,65 @@ class TestPyttsx3Provider:
             Mock(id="voice3", name="Voice 3", spec=["id", "name"])
         ]
 
-        voices = provider.get_available_voices()
+        voices = provider.refresh_voices()
         assert voices[0]["language"] == "unknown"
 
+    def test_get_available_voices_cached(self, provider):
+        """get_available_voices() only queries the engine once."""
+        first = provider.get_available_voices()
+        first.clear()
+
+        assert len(provider.get_available_voices()) == 2
+        voice_queries = [
+            c for c in provider.engine.getProperty.call_args_list if c.args == ("voices",)
+        ]
+        assert len(voice_queries) == 1
+
+    def test_background_speak_returns_before_speech(self, mock_engine):
+        """In background mode speak() queues and wait_until_done() blocks."""
+        release = threading.Event()
+        spoken = []
+
+        def run_and_wait():
+            release.wait(timeout=2)
+            spoken.append(mock_engine.say.call_args[0][0])
+
+        mock_engine.runAndWait.side_effect = run_and_wait
+        with patch("pyttsx3.init", return_value=mock_engine):
+            provider = Pyttsx3Provider(enable_macos_workaround=False, background=True)
+
+        provider.speak("One.")
+        provider.speak("Two.")
+        assert spoken == []
+
+        release.set()
+        provider.wait_until_done()
+        assert spoken == ["One.", "Two."]
+
+    def test_background_stop_drops_queued_speech(self, mock_engine):
+        """stop() drops queued texts and background errors surface later."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def run_and_wait():
+            started.set()
+            release.wait(timeout=2)
+            raise RuntimeError("driver error")
+
+        mock_engine.runAndWait.side_effect = run_and_wait
+        with patch("pyttsx3.init", return_value=mock_engine):
+            provider = Pyttsx3Provider(enable_macos_workaround=False, background=True)
+
+        provider.speak("One.")
+        started.wait(timeout=2)
+        provider.speak("Two.")
+        provider.stop()
+        release.set()
+
+        with pytest.raises(TTSError, match="driver error"):
+            provider.wait_until_done()
+        mock_engine.say.assert_called_once_with("One.")
+
     def test_stop(self, provider):
         """stop() calls engine.stop()."""
         provider.stop()
@@ -194,6 +368,13 @@ class TestPyttsx3Provider:
 class TestPiperTTSProvider:
     """Tests for Piper TTS provider."""
 
+    @pytest.fixture(autouse=True)
+    def clear_model_pool(self):
+        """Keep loaded voices from leaking between tests."""
+        PiperTTSProvider._model_pool.clear()
+        yield
+        PiperTTSProvider._model_pool.clear()
+
     @pytest.fixture
     def mock_model_files(self, tmp_path):
         """Create mock model files."""
@@ -281,27 +462,204 @@ class TestPiperTTSProvider:
         mock_piper_class.load.assert_called_once()  # Only loaded once
 
     @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
-    @patch.object(PiperTTSProvider, "_play_audio")
+    @patch.object(PiperTTSProvider, "_play_chunks")
     def test_speak_synthesizes_and_plays(
         self, mock_play, mock_piper_class, provider, mock_piper_voice
     ):
         """speak() synthesizes and plays audio."""
         mock_piper_class.load.return_value = mock_piper_voice
+        played = []
+        mock_play.side_effect = played.extend
 
         provider.speak("Hello world")
 
         mock_piper_voice.synthesize.assert_called_once_with("Hello world")
         mock_play.assert_called_once()
+        assert played == [b"\x00\x01" * 100]
+
+    @patch("conversation_agent.providers.tts.piper_playback.pyaudio.PyAudio")
+    def test_speak_streams_sentences_to_one_stream(
+        self, mock_pyaudio_class, provider, mock_piper_voice
+    ):
+        """speak() plays each synthesized sentence as it arrives, on one stream."""
+        first, second = Mock(), Mock()
+        first.audio_int16_bytes = b"\x01\x00" * 10
+        second.audio_int16_bytes = b"\x02\x00" * 10
+        writes = []
+        first_played = threading.Event()
+
+        def write(data):
+            writes.append(data)
+            first_played.set()
+
+        mock_stream = mock_pyaudio_class.return_value.open.return_value
+        mock_stream.write.side_effect = write
+
+        def synthesize(text):
+            yield first
+            # The first sentence plays while the second is still being synthesized
+            assert first_played.wait(timeout=5)
+            yield second
+
+        mock_piper_voice.synthesize.side_effect = synthesize
+        provider.voice = mock_piper_voice
+
+        provider.speak("First sentence. Second sentence.")
+
+        assert writes == [first.audio_int16_bytes, second.audio_int16_bytes]
+        mock_pyaudio_class.return_value.open.assert_called_once()
+
+    @patch("conversation_agent.providers.tts.piper_playback.pyaudio.PyAudio")
+    def test_speak_synthesis_stays_bounded_ahead(
+        self, mock_pyaudio_class, provider, mock_piper_voice
+    ):
+        """Synthesis runs at most a few sentences ahead and stops with playback."""
+        produced = []
+        mock_stream = mock_pyaudio_class.return_value.open.return_value
+
+        def synthesize(text):
+            for _ in range(10):
+                produced.append(1)
+                chunk = Mock()
+                chunk.audio_int16_bytes = b"\x01\x00" * 10
+                yield chunk
+
+        def write(data):
+            time.sleep(0.2)  # Give synthesis time to run ahead
+            assert len(produced) <= provider.STREAM_QUEUE_CHUNKS + 2
+            provider.stop()
+
+        mock_piper_voice.synthesize.side_effect = synthesize
+        mock_stream.write.side_effect = write
+        provider.voice = mock_piper_voice
+
+        provider.speak("One. Two. Three.")
+
+        mock_stream.write.assert_called_once()
+        # The worker is free again rather than blocked on the full queue
+        mock_piper_voice.synthesize.side_effect = None
+        assert provider._submit_synthesis("Next.").result(timeout=5) == b"\x00\x01" * 100
+        assert len(produced) < 10
+
+    @patch("conversation_agent.providers.tts.piper_playback.pyaudio.PyAudio")
+    def test_output_stream_reused_until_shutdown(self, mock_pyaudio_class, provider):
+        """PyAudio and its stream are opened once and closed on shutdown."""
+        mock_stream = mock_pyaudio_class.return_value.open.return_value
+
+        provider.play_bytes(b"\x00\x01" * 100)
+        provider.play_bytes(b"\x00\x01" * 100)
+
+        mock_pyaudio_class.assert_called_once()
+        mock_pyaudio_class.return_value.open.assert_called_once()
+        assert mock_stream.write.call_count == 2
+        mock_stream.close.assert_not_called()
+
+        provider.sample_rate = 16000
+        provider.play_bytes(b"\x00\x01" * 100)
+        mock_stream.close.assert_called_once()
+        assert mock_pyaudio_class.return_value.open.call_args.kwargs["rate"] == 16000
+
+        provider.shutdown()
+        assert mock_stream.close.call_count == 2
+        mock_pyaudio_class.return_value.terminate.assert_called_once()
 
     def test_speak_empty_text(self, provider):
         """speak() with empty text does nothing."""
         provider.speak("")
-        # Should not raise, just log warning
+        # Should not raise or load the model
         assert provider.voice is None  # Model not loaded
 
         provider.speak("   ")
         assert provider.voice is None
 
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    @patch.object(PiperTTSProvider, "_play_audio")
+    def test_speak_uses_prefetched_audio(
+        self, mock_play, mock_piper_class, provider, mock_piper_voice
+    ):
+        """speak() plays prefetched audio without synthesizing again."""
+        mock_piper_class.load.return_value = mock_piper_voice
+
+        provider.prefetch("Question 2. Where do you live?")
+        provider.speak("Okay, let's try again.")
+        provider.speak("Question 2. Where do you live?")
+
+        assert mock_piper_voice.synthesize.call_count == 2
+        mock_play.assert_called_with(b"\x00\x01" * 100)
+        assert provider._prefetched is None
+
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    @patch.object(PiperTTSProvider, "_play_audio")
+    def test_speak_replays_cached_audio(
+        self, mock_play, mock_piper_class, provider, mock_piper_voice
+    ):
+        """Repeated phrases are played from the cache without synthesizing again."""
+        mock_piper_class.load.return_value = mock_piper_voice
+
+        with patch.object(PiperTTSProvider, "_play_chunks", side_effect=list):
+            provider.speak("Sorry, I didn't catch that.")
+        provider.speak("Sorry, I didn't catch that.")
+        assert provider.synth_to_bytes("Sorry, I didn't catch that.") == b"\x00\x01" * 100
+
+        mock_piper_voice.synthesize.assert_called_once()
+        mock_play.assert_called_once_with(b"\x00\x01" * 100)
+
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    def test_cache_evicts_least_recently_used(
+        self, mock_piper_class, provider, mock_piper_voice
+    ):
+        """The cache keeps at most CACHE_SIZE phrases, dropping the oldest."""
+        mock_piper_class.load.return_value = mock_piper_voice
+        provider._cache.maxsize = 2
+
+        provider.synth_to_bytes("One.")
+        provider.synth_to_bytes("Two.")
+        provider.synth_to_bytes("One.")  # Refreshes "One."
+        provider.synth_to_bytes("Three.")
+
+        assert provider._cache_get("One.") is not None
+        assert provider._cache_get("Two.") is None
+        assert mock_piper_voice.synthesize.call_count == 3
+
+    def test_cache_concurrent_get_and_put(self, provider):
+        """Lookups racing with evictions on another thread never raise."""
+        provider._cache.maxsize = 2
+        errors = []
+
+        def put_many():
+            try:
+                for i in range(2000):
+                    provider._cache_put(str(i % 5), b"\x00")
+            except Exception as e:  # pragma: no cover - only on failure
+                errors.append(e)
+
+        writer = threading.Thread(target=put_many)
+        writer.start()
+        try:
+            while writer.is_alive():
+                for i in range(5):
+                    provider._cache_get(str(i))
+        except Exception as e:  # pragma: no cover - only on failure
+            errors.append(e)
+        writer.join()
+
+        assert errors == []
+        assert len(provider._cache) <= 2
+
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    @patch.object(PiperTTSProvider, "_play_audio")
+    def test_synth_to_bytes_and_play_bytes(
+        self, mock_play, mock_piper_class, provider, mock_piper_voice
+    ):
+        """synth_to_bytes() returns audio that play_bytes() plays unchanged."""
+        mock_piper_class.load.return_value = mock_piper_voice
+
+        audio = provider.synth_to_bytes("Okay, let's try again.")
+        provider.play_bytes(audio)
+
+        assert audio == b"\x00\x01" * 100
+        mock_play.assert_called_once_with(audio)
+
     @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
     def test_speak_lazy_initializes(
         self, mock_piper_class, provider, mock_piper_voice
@@ -349,6 +707,52 @@ class TestPiperTTSProvider:
         assert provider.voice is not None  # Reloaded by initialize()
         mock_piper_class.load.assert_called()  # Reloaded
 
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    def test_set_voice_reuses_pooled_model(self, mock_piper_class, provider, tmp_path):
+        """Switching back to a recent voice reuses its loaded model."""
+        mock_piper_class.load.side_effect = lambda *args, **kwargs: MagicMock()
+        original = provider.model_path
+        new_model = tmp_path / "new_model.onnx"
+        new_model.write_bytes(b"new model")
+        (tmp_path / "new_model.onnx.json").write_text("{}")
+
+        provider.initialize()
+        first_voice = provider.voice
+        provider.set_voice(str(new_model))
+        provider.set_voice(str(original))
+
+        assert provider.voice is first_voice
+        assert mock_piper_class.load.call_count == 2
+
+    def test_model_pool_is_bounded(self, tmp_path):
+        """Only MODEL_POOL_SIZE loaded models are kept."""
+        providers = []
+        with patch("conversation_agent.providers.tts.piper_provider.PiperVoice"):
+            for i in range(PiperTTSProvider.MODEL_POOL_SIZE + 1):
+                model = tmp_path / f"voice{i}.onnx"
+                model.write_bytes(b"model")
+                (tmp_path / f"voice{i}.onnx.json").write_text("{}")
+                providers.append(PiperTTSProvider(str(model), use_quantized=False))
+                providers[-1].initialize()
+
+        pooled = [Path(key[0]).name for key in PiperTTSProvider._model_pool]
+        assert pooled == ["voice1.onnx", "voice2.onnx", "voice3.onnx"]
+
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    def test_shutdown_releases_pooled_models(self, mock_piper_class, provider, tmp_path):
+        """shutdown() drops every pooled voice the provider loaded."""
+        other = tmp_path / "other.onnx"
+        other.write_bytes(b"model")
+        (tmp_path / "other.onnx.json").write_text("{}")
+        provider.initialize()
+        provider.set_voice(str(other))
+        assert len(PiperTTSProvider._model_pool) == 2
+
+        provider.shutdown()
+
+        assert len(PiperTTSProvider._model_pool) == 0
+        assert provider.voice is None
+
     def test_set_voice_invalid_path(self, provider):
         """set_voice() raises TTSError for invalid path."""
         with pytest.raises(TTSError, match="Model not found"):
@@ -373,7 +777,14 @@ class TestPiperTTSProvider:
         with pytest.raises(TTSError, match="out of range"):
             provider.set_volume(-0.1)
 
-    @patch("conversation_agent.providers.tts.piper_provider.pyaudio.PyAudio")
+    @patch("conversation_agent.providers.tts.piper_playback.pyaudio.PyAudio")
+    def test_play_audio_empty_skips_device(self, mock_pyaudio_class, provider):
+        """_play_audio() with no audio doesn't open the output device."""
+        provider.set_volume(0.5)
+        provider._play_audio(b"")
+        mock_pyaudio_class.assert_not_called()
+
+    @patch("conversation_agent.providers.tts.piper_playback.pyaudio.PyAudio")
     def test_play_audio_with_volume(self, mock_pyaudio_class, provider):
         """_play_audio() applies volume scaling."""
         import numpy as np
@@ -397,7 +808,34 @@ class TestPiperTTSProvider:
         written_audio = mock_stream.write.call_args[0][0]
         assert written_audio != audio_data  # Should be scaled
 
-    @patch("conversation_agent.providers.tts.piper_provider.pyaudio.PyAudio")
+    def test_scale_volume_fixed_point(self, provider):
+        """Volume scaling keeps 16-bit samples in range at full and half scale."""
+        import numpy as np
+
+        audio_data = np.array([1000, -1000, 32767, -32768], dtype=np.int16).tobytes()
+
+        provider.set_volume(0.5)
+        half = np.frombuffer(provider._scale_volume(audio_data), dtype=np.int16)
+        provider.set_volume(1.0)
+        full = np.frombuffer(provider._scale_volume(audio_data), dtype=np.int16)
+
+        np.testing.assert_array_equal(half, [500, -500, 16383, -16384])
+        np.testing.assert_array_equal(full, [1000, -1000, 32767, -32768])
+
+    def test_scale_volume_reuses_buffer(self, provider):
+        """Volume scaling reuses its int32 buffer once it is large enough."""
+        import numpy as np
+
+        provider.set_volume(0.5)
+        provider._scale_volume(np.full(400, 1000, dtype=np.int16).tobytes())
+        scratch = provider._volume_scratch
+
+        small = provider._scale_volume(np.full(100, -1000, dtype=np.int16).tobytes())
+
+        assert provider._volume_scratch is scratch
+        np.testing.assert_array_equal(np.frombuffer(small, dtype=np.int16), [-500] * 100)
+
+    @patch("conversation_agent.providers.tts.piper_playback.pyaudio.PyAudio")
     def test_play_audio_failure(self, mock_pyaudio_class, provider):
         """_play_audio() raises TTSError on playback failure."""
         mock_pyaudio_class.side_effect = Exception("Playback failed")
@@ -418,6 +856,85 @@ class TestPiperTTSProvider:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
+    def test_speak_async_serializes_calls(self, provider):
+        """speak_async() runs one speak() at a time off the event loop."""
+        active = []
+        overlapped = []
+
+        def speak(text):
+            active.append(text)
+            overlapped.append(len(active) > 1)
+            time.sleep(0.02)
+            active.remove(text)
+
+        async def main():
+            await asyncio.gather(provider.speak_async("One."), provider.speak_async("Two."))
+
+        with patch.object(provider, "speak", side_effect=speak) as mock_speak:
+            asyncio.run(main())
+
+        assert mock_speak.call_count == 2
+        assert overlapped == [False, False]
+
+    def test_speak_async_cancel_stops_playback(self, provider):
+        """Cancelling speak_async() stops the utterance in progress."""
+        started = threading.Event()
+
+        def speak(text):
+            started.set()
+            provider._stop_requested.wait(timeout=2)
+
+        async def main():
+            task = asyncio.ensure_future(provider.speak_async("Hello."))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with patch.object(provider, "speak", side_effect=speak):
+            asyncio.run(main())
+
+        assert provider._stop_requested.is_set()
+
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    def test_save_to_file_streams_chunks(
+        self, mock_piper_class, provider, mock_piper_voice, tmp_path
+    ):
+        """save_to_file() writes every synthesized chunk with a valid header."""
+        import wave
+
+        mock_piper_voice.synthesize.return_value = [
+            Mock(audio_int16_bytes=b"\x01\x00" * 30),
+            Mock(audio_int16_bytes=b"\x02\x00" * 20),
+        ]
+        mock_piper_class.load.return_value = mock_piper_voice
+
+        output_path = tmp_path / "output.wav"
+        provider.save_to_file("One. Two.", str(output_path))
+
+        with wave.open(str(output_path), "rb") as wav_file:
+            assert wav_file.getnframes() == 50
+            assert wav_file.getframerate() == provider.sample_rate
+            assert wav_file.readframes(50) == b"\x01\x00" * 30 + b"\x02\x00" * 20
+
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    def test_save_to_file_removes_partial_file(
+        self, mock_piper_class, provider, mock_piper_voice, tmp_path
+    ):
+        """save_to_file() deletes the file if synthesis fails part way."""
+
+        def synthesize(text):
+            yield Mock(audio_int16_bytes=b"\x01\x00" * 30)
+            raise RuntimeError("ONNX error")
+
+        mock_piper_voice.synthesize.side_effect = synthesize
+        mock_piper_class.load.return_value = mock_piper_voice
+        output_path = tmp_path / "output.wav"
+
+        with pytest.raises(TTSError, match="Failed to save"):
+            provider.save_to_file("One. Two.", str(output_path))
+        assert not output_path.exists()
+
     def test_save_to_file_invalid_format(self, provider):
         """save_to_file() raises TTSError for non-WAV files."""
         with pytest.raises(TTSError, match="only supports .wav"):
@@ -462,6 +979,29 @@ class TestPiperTTSProvider:
         finally:
             os.chdir(original_cwd)
 
+    def test_get_available_voices_rescans_on_change(self, tmp_path, monkeypatch):
+        """get_available_voices() is cached until the models directory changes."""
+        models_dir = tmp_path / "models" / "tts" / "piper"
+        models_dir.mkdir(parents=True)
+        model_path = models_dir / "en_US-voice1.onnx"
+        model_path.write_bytes(b"fake")
+        (models_dir / "en_US-voice1.onnx.json").write_text("{}")
+        monkeypatch.chdir(tmp_path)
+        provider = PiperTTSProvider(model_path=str(model_path))
+
+        with patch.object(Path, "glob", wraps=models_dir.glob) as mock_glob:
+            assert [v["name"] for v in provider.get_available_voices()] == ["en_US-voice1"]
+            assert len(provider.get_available_voices()) == 1
+            assert mock_glob.call_count == 1
+
+            (models_dir / "en_GB-voice2.onnx").write_bytes(b"fake")
+            os.utime(models_dir, ns=(0, models_dir.stat().st_mtime_ns + 1))
+            assert [v["name"] for v in provider.get_available_voices()] == [
+                "en_GB-voice2",
+                "en_US-voice1",
+            ]
+            assert mock_glob.call_count == 2
+
     def test_get_available_voices_no_models_dir(self, provider):
         """get_available_voices() returns empty list if directory missing."""
         voices = provider.get_available_voices()
@@ -474,6 +1014,120 @@ class TestPiperTTSProvider:
         provider.stop()
         assert provider._is_speaking is False
 
+    @patch("conversation_agent.providers.tts.piper_playback.pyaudio.PyAudio")
+    def test_stop_interrupts_playback(self, mock_pyaudio_class, provider):
+        """Playback stops writing chunks once stop() is called."""
+        mock_stream = Mock()
+        mock_stream.write.side_effect = lambda data: provider.stop()
+        mock_pyaudio_class.return_value.open.return_value = mock_stream
+
+        provider._play_audio(b"\x00\x01" * provider.PLAYBACK_CHUNK_FRAMES * 4)
+
+        mock_stream.write.assert_called_once()
+
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    def test_initialize_prefers_quantized_model(
+        self, mock_piper_class, mock_model_files, mock_piper_voice
+    ):
+        """initialize() loads <model>_int8.onnx when quantized models are enabled."""
+        model_path, config_path = mock_model_files
+        quantized = quantized_model_path(model_path)
+        quantized.write_bytes(b"int8 model")
+
+        PiperTTSProvider(model_path, config_path, use_quantized=True).initialize()
+        PiperTTSProvider(model_path, config_path, use_quantized=False).initialize()
+
+        loaded = [call.args[0] for call in mock_piper_class.load.call_args_list]
+        assert loaded == [str(quantized), model_path]
+        assert mock_piper_class.load.call_args.kwargs["config_path"] == config_path
+
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    def test_initialize_auto_quantized_follows_cpu(
+        self, mock_piper_class, mock_model_files
+    ):
+        """By default the INT8 model is used only with INT8 dot-product support."""
+        model_path, config_path = mock_model_files
+        quantized_model_path(model_path).write_bytes(b"int8 model")
+
+        for has_vnni in (True, False):
+            with patch(
+                "conversation_agent.providers.tts.piper_model._cpu_has_int8_dot_product",
+                return_value=has_vnni,
+            ):
+                PiperTTSProvider(model_path, config_path).initialize()
+
+        loaded = [call.args[0] for call in mock_piper_class.load.call_args_list]
+        assert loaded == [str(quantized_model_path(model_path)), model_path]
+
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    def test_warm_up_runs_on_synthesis_worker(
+        self, mock_piper_class, provider, mock_piper_voice
+    ):
+        """warm_up() loads the model and synthesizes once on the worker thread."""
+        threads = []
+        mock_piper_voice.synthesize.side_effect = lambda text: (
+            threads.append(threading.current_thread().name) or iter([])
+        )
+        mock_piper_class.load.return_value = mock_piper_voice
+
+        provider.warm_up()
+        provider._executor.submit(lambda: None).result()
+
+        assert provider.voice is mock_piper_voice
+        assert len(threads) == 1 and threads[0].startswith("piper-tts")
+
+    @patch("onnxruntime.get_available_providers")
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    def test_initialize_uses_cuda_when_available(
+        self, mock_piper_class, mock_available, mock_model_files
+    ):
+        """initialize() loads on CUDA when requested and falls back to CPU."""
+        model_path, config_path = mock_model_files
+        quantized_model_path(model_path).write_bytes(b"int8 model")
+
+        with patch(
+            "conversation_agent.providers.tts.piper_model._cpu_has_int8_dot_product",
+            return_value=True,
+        ):
+            mock_available.return_value = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+            PiperTTSProvider(model_path, config_path, use_cuda=True).initialize()
+            mock_available.return_value = ["CPUExecutionProvider"]
+            PiperTTSProvider(model_path, config_path, use_cuda=True).initialize()
+
+        first, second = mock_piper_class.load.call_args_list
+        # INT8 dynamic quantization is a CPU optimization, so the GPU gets FP32
+        assert first.args[0] == model_path
+        assert first.kwargs["use_cuda"] is True
+        assert second.args[0] == str(quantized_model_path(model_path))
+        assert second.kwargs["use_cuda"] is False
+
+    @patch("onnxruntime.InferenceSession")
+    @patch("conversation_agent.providers.tts.piper_provider.PiperVoice")
+    def test_initialize_limits_onnx_threads(
+        self, mock_piper_class, mock_session_class, mock_model_files, mock_piper_voice
+    ):
+        """initialize() rebuilds the ONNX session when num_threads is set."""
+        import onnxruntime
+
+        model_path, config_path = mock_model_files
+        mock_piper_voice.session.get_providers.return_value = ["CPUExecutionProvider"]
+        mock_piper_class.load.return_value = mock_piper_voice
+
+        provider = PiperTTSProvider(
+            model_path, config_path, use_quantized=False, num_threads=2
+        )
+        provider.initialize()
+
+        args, kwargs = mock_session_class.call_args
+        assert args == (model_path,)
+        assert kwargs["providers"] == ["CPUExecutionProvider"]
+        assert kwargs["sess_options"].intra_op_num_threads == 2
+        assert (
+            kwargs["sess_options"].graph_optimization_level
+            == onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        assert provider.voice.session is mock_session_class.return_value
+
     def test_shutdown_clears_model(self, provider, mock_piper_voice):
         """shutdown() clears the voice model."""
         provider.voice = mock_piper_voice
@@ -540,9 +1194,11 @@ class TestTTSConfig:
                 volume=0.8,
             )
             provider = config.get_provider()
+            provider._executor.shutdown(wait=True)
 
             assert isinstance(provider, PiperTTSProvider)
             assert provider._volume == 0.8
+            provider.voice.synthesize.assert_called_once()  # Warm-up
 
     def test_get_provider_pyttsx3(self):
         """get_provider() returns configured pyttsx3 provider."""